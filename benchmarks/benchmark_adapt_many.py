@@ -0,0 +1,37 @@
+"""
+compares the runtime of adapt_to_target (one call per value) with adapt_many (one call per column).
+
+Run it with: python benchmarks/benchmark_adapt_many.py
+"""
+
+import timeit
+from datetime import date, timedelta
+
+import numpy as np
+import pytz
+
+from chronomeleon import ChronoAssumption, MappingConfig, adapt_to_target
+from chronomeleon.batch import adapt_many
+
+_NUMBER_OF_VALUES = 100_000
+
+config = MappingConfig(
+    source=ChronoAssumption(
+        implicit_timezone=pytz.timezone("Europe/Berlin"),
+        resolution=timedelta(days=1),
+        is_inclusive_end=True,
+        is_gastag_aware=False,
+    ),
+    target=ChronoAssumption(resolution=timedelta(milliseconds=1), is_inclusive_end=True, is_gastag_aware=True),
+    is_end=True,
+    is_gas=True,
+)
+source_values = [date(2000, 1, 1) + timedelta(days=i % 20_000) for i in range(_NUMBER_OF_VALUES)]
+source_array = np.array(source_values, dtype="datetime64[D]")
+
+if __name__ == "__main__":
+    scalar_seconds = min(timeit.repeat(lambda: [adapt_to_target(v, config) for v in source_values], number=1, repeat=3))
+    batch_seconds = min(timeit.repeat(lambda: adapt_many(source_array, config), number=1, repeat=3))
+    print(f"adapt_to_target: {scalar_seconds * 1e9 / _NUMBER_OF_VALUES:8.1f} ns/value")
+    print(f"adapt_many:      {batch_seconds * 1e9 / _NUMBER_OF_VALUES:8.1f} ns/value")
+    print(f"speedup:         {scalar_seconds / batch_seconds:8.1f}x")
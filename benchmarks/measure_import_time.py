@@ -0,0 +1,71 @@
+"""
+measures the time spent in the modules of chronomeleon themselves (i.e. without pytz and the standard library) when
+chronomeleon is imported by a fresh interpreter, and the time of the first conversion of a gas value.
+It reports the median of several runs (unittests/test_import_time.py checks the best run against the same budget).
+
+Run it with: python benchmarks/measure_import_time.py
+It exits with 1, if the median import time exceeds the budget.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+_IMPORT_TIME_BUDGET_MICROSECONDS = 50_000
+"""
+the budget for the time spent in the modules of chronomeleon themselves
+"""
+
+_REPETITIONS = 7
+
+_FIRST_GAS_CONVERSION = """
+import time
+from datetime import date, timedelta
+import pytz
+from chronomeleon import ChronoAssumption, MappingConfig, adapt_to_target
+config = MappingConfig(
+    source=ChronoAssumption(implicit_timezone=pytz.timezone("Europe/Berlin"), resolution=timedelta(days=1)),
+    target=ChronoAssumption(resolution=timedelta(days=1), is_gastag_aware=True),
+    is_gas=True,
+)
+start = time.perf_counter()
+adapt_to_target(date(2024, 1, 1), config)
+print(int((time.perf_counter() - start) * 1_000_000))
+"""
+
+
+def _run_python(code: str, *options: str) -> subprocess.CompletedProcess[str]:
+    """
+    runs the code in a fresh interpreter (so that nothing has been imported yet)
+    """
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+
+
+def measure_import_time() -> dict[str, int]:
+    """
+    returns the self time (in microseconds) of each module of chronomeleon that is loaded by "import chronomeleon"
+    """
+    # lines of -X importtime look like: "import time:  <self [us]> | <cumulative [us]> | <indentation><module>"
+    lines = _run_python("import chronomeleon", "-X", "importtime").stderr.splitlines()
+    return {
+        module.strip(): int(self_time.removeprefix("import time:"))
+        for self_time, _, module in (line.split("|") for line in lines if line.startswith("import time:"))
+        if module.strip().startswith("chronomeleon")
+    }
+
+
+if __name__ == "__main__":
+    import_times = [sum(measure_import_time().values()) for _ in range(_REPETITIONS)]
+    first_gas_conversions = [int(_run_python(_FIRST_GAS_CONVERSION).stdout) for _ in range(_REPETITIONS)]
+    median_import_time = statistics.median(import_times)
+    budget = _IMPORT_TIME_BUDGET_MICROSECONDS / 1_000
+    print(f"import chronomeleon:   {median_import_time / 1_000:8.1f} ms (budget {budget} ms)")
+    print(f"first gas conversion:  {statistics.median(first_gas_conversions) / 1_000:8.1f} ms")
+    sys.exit(0 if median_import_time < _IMPORT_TIME_BUDGET_MICROSECONDS else 1)
@@ -0,0 +1,198 @@
+"""
+measures adapt_to_target and its two internal steps for every combination of
+* the input: date, naive datetime or aware datetime
+* the kind of value: start, exclusive end or inclusive end
+* Gastag on/off
+* date-only target on/off
+and reports the time (ns/op) and the memory allocated per call (peak bytes/op, measured with tracemalloc).
+
+Run it with: python benchmarks/run_benchmarks.py --output benchmark.json
+and compare it to the results of another commit with: python benchmarks/run_benchmarks.py --compare benchmark.json
+"""
+
+import argparse
+import itertools
+import json
+import platform
+import subprocess
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+from functools import partial
+from typing import Any, Callable, Optional, Union
+
+import pytz
+
+from chronomeleon import ChronoAssumption, MappingConfig, adapt_to_target
+from chronomeleon.mapping import _convert_aware_datetime_to_target, _convert_source_date_or_datetime_to_aware_datetime
+
+_berlin = pytz.timezone("Europe/Berlin")
+
+_INPUTS: dict[str, Union[date, datetime]] = {
+    "date": date(2024, 3, 31),
+    "naive": datetime(2024, 3, 31, 6, 0),
+    "aware": _berlin.localize(datetime(2024, 3, 31, 6, 0)),
+}
+
+_KINDS = ["start", "exclusive_end", "inclusive_end"]
+
+_ALLOCATION_CALLS = 100
+
+_SECONDS_PER_REPETITION = 0.02
+
+
+@dataclass(frozen=True, kw_only=True)
+class BenchmarkResult:  # pylint:disable=too-many-instance-attributes
+    """
+    the result of one benchmark; the name identifies the benchmark across commits
+    """
+
+    name: str
+    function: str
+    input: str
+    kind: str
+    is_gastag: bool
+    is_date_only: bool
+    ns_per_op: float
+    """
+    the best time of a single call in nanoseconds
+    """
+    peak_bytes_per_op: float
+    """
+    the peak memory that is allocated during a single call
+    """
+
+
+def _get_config(input_name: str, kind: str, is_gastag: bool, is_date_only: bool) -> MappingConfig:
+    is_end = kind != "start"
+    is_inclusive_end = kind == "inclusive_end" if is_end else None
+    return MappingConfig(
+        source=ChronoAssumption(
+            implicit_timezone=None if input_name == "aware" else _berlin,
+            resolution=timedelta(days=1) if input_name == "date" else timedelta(seconds=1),
+            is_inclusive_end=is_inclusive_end,
+        ),
+        target=ChronoAssumption(
+            implicit_timezone=_berlin,
+            resolution=timedelta(days=1) if is_date_only else timedelta(milliseconds=1),
+            is_inclusive_end=is_inclusive_end,
+            is_gastag_aware=is_gastag,
+            is_date_only=is_date_only,
+        ),
+        is_end=is_end,
+        is_gas=is_gastag,
+    )
+
+
+def _measure_time(function: Callable[[], Any], repeat: int) -> float:
+    """
+    returns the best time of a single call in nanoseconds
+    """
+    timer = timeit.Timer(function)
+    estimate = timer.timeit(number=10) / 10
+    number = max(1, int(_SECONDS_PER_REPETITION / max(estimate, 1e-9)))
+    return min(timer.repeat(repeat=repeat, number=number)) * 1e9 / number
+
+
+def _measure_allocations(function: Callable[[], Any]) -> float:
+    """
+    returns the peak memory in bytes that is allocated during a single call (averaged over several calls)
+    """
+    function()  # warm up caches, so that they don't count as allocations
+    total = 0
+    tracemalloc.start()
+    try:
+        for _ in range(_ALLOCATION_CALLS):
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            function()
+            _, peak = tracemalloc.get_traced_memory()
+            total += peak - baseline
+    finally:
+        tracemalloc.stop()
+    return total / _ALLOCATION_CALLS
+
+
+def run_benchmarks(name_filter: str = "", repeat: int = 5) -> list[BenchmarkResult]:
+    """
+    runs all benchmarks whose name contains name_filter
+    """
+    results: list[BenchmarkResult] = []
+    for input_name, kind, is_gastag, is_date_only in itertools.product(_INPUTS, _KINDS, [False, True], [False, True]):
+        config = _get_config(input_name, kind, is_gastag, is_date_only)
+        source_value = _INPUTS[input_name]
+        aware_value = _convert_source_date_or_datetime_to_aware_datetime(source_value, config)
+        functions: dict[str, Callable[[], Any]] = {
+            "adapt_to_target": partial(adapt_to_target, source_value, config),
+            "convert_source": partial(_convert_source_date_or_datetime_to_aware_datetime, source_value, config),
+            "convert_target": partial(_convert_aware_datetime_to_target, aware_value, config),
+        }
+        for function_name, function in functions.items():
+            name = (
+                f"{function_name}[{input_name}-{kind}"
+                f"{'-gastag' if is_gastag else ''}{'-date_only' if is_date_only else ''}]"
+            )
+            if name_filter not in name:
+                continue
+            results.append(
+                BenchmarkResult(
+                    name=name,
+                    function=function_name,
+                    input=input_name,
+                    kind=kind,
+                    is_gastag=is_gastag,
+                    is_date_only=is_date_only,
+                    ns_per_op=_measure_time(function, repeat),
+                    peak_bytes_per_op=_measure_allocations(function),
+                )
+            )
+            print(f"{name:70} {results[-1].ns_per_op:10.0f} ns/op {results[-1].peak_bytes_per_op:8.0f} B/op")
+    return results
+
+
+def _get_metadata() -> dict[str, Any]:
+    try:
+        commit: Optional[str] = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def _compare(results: list[BenchmarkResult], baseline_path: str) -> None:
+    with open(baseline_path, "r", encoding="utf-8") as baseline_file:
+        baseline = {result["name"]: result for result in json.load(baseline_file)["results"]}
+    print(f"\ncompared to {baseline_path} (ratio > 1 means slower than the baseline):")
+    for result in results:
+        if result.name in baseline:
+            ratio = result.ns_per_op / baseline[result.name]["ns_per_op"]
+            print(f"{result.name:70} {ratio:6.2f}x{'  <-- regression' if ratio > 1.1 else ''}")
+
+
+def main() -> None:
+    """
+    runs the benchmarks from the command line
+    """
+    parser = argparse.ArgumentParser(description="benchmarks the conversion paths of chronomeleon")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="compare the results to those in this JSON file (from --output)")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this string")
+    parser.add_argument("--repeat", type=int, default=5, help="the number of repetitions per benchmark")
+    arguments = parser.parse_args()
+    results = run_benchmarks(arguments.filter, arguments.repeat)
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as output_file:
+            json.dump({"metadata": _get_metadata(), "results": [asdict(r) for r in results]}, output_file, indent=2)
+    if arguments.compare:
+        _compare(results, arguments.compare)
+
+
+if __name__ == "__main__":
+    main()
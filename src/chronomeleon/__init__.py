@@ -2,7 +2,40 @@
 Chronomeleon is a Python package that helps you to migrate datetimes from one system to another.
 """
 
-__all__ = ["ChronoAssumption", "MappingConfig", "adapt_to_target"]
+__all__ = [
+    "ChronoAssumption",
+    "ConversionError",
+    "ConversionKind",
+    "ConversionPlan",
+    "MappingConfig",
+    "RangeConversionPlan",
+    "RangeMappingConfig",
+    "adapt_range_to_target",
+    "adapt_to_source",
+    "adapt_to_target",
+    "classify_config",
+    "compile_composition",
+    "compile_config",
+    "compile_inverse",
+    "compile_range_config",
+    "compose_configs",
+    "get_lossy_steps",
+]
 
-from .mapping import adapt_to_target
-from .models import ChronoAssumption, MappingConfig
+from .errors import ConversionError
+from .mapping import (
+    ConversionKind,
+    ConversionPlan,
+    RangeConversionPlan,
+    adapt_range_to_target,
+    adapt_to_source,
+    adapt_to_target,
+    classify_config,
+    compile_composition,
+    compile_config,
+    compile_inverse,
+    compile_range_config,
+    compose_configs,
+    get_lossy_steps,
+)
+from .models import ChronoAssumption, MappingConfig, RangeMappingConfig
@@ -0,0 +1,69 @@
+"""
+the command line interface of chronomeleon, which maps the date(time) columns of a CSV or Parquet file:
+
+    python -m chronomeleon input.csv output.csv --config columns.toml
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional, Sequence
+
+from chronomeleon.streaming import DEFAULT_CHUNK_SIZE, StreamStatistics, adapt_file, load_column_configs
+
+
+def _print_statistics(statistics: StreamStatistics) -> None:
+    print(
+        f"{statistics.rows} rows in {statistics.seconds:.1f}s ({statistics.rows_per_second:.0f} rows/s)",
+        file=sys.stderr,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    runs the command line interface and returns the exit code
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m chronomeleon", description="maps the date(time) columns of a CSV or Parquet file"
+    )
+    parser.add_argument("input", help="the CSV or Parquet file to read")
+    parser.add_argument("output", help="the file to write the result to")
+    parser.add_argument(
+        "--config",
+        required=True,
+        help="a JSON or TOML file with a 'columns' table that maps column names to mapping configurations",
+    )
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="the number of rows per chunk")
+    parser.add_argument(
+        "--workers", type=int, default=1, help="the number of processes which convert the chunks of a CSV file"
+    )
+    parser.add_argument("--progress", action="store_true", help="report the throughput after each chunk")
+    arguments = parser.parse_args(argv)
+    try:
+        column_configs = load_column_configs(arguments.config)
+        on_chunk = _print_statistics if arguments.progress else None
+        if arguments.workers > 1 and Path(arguments.input).suffix.lower() not in {".parquet", ".pq"}:
+            # multiprocessing is only imported if it's needed, because it makes up a large part of the start-up time
+            from chronomeleon.parallel import adapt_csv_in_parallel  # pylint:disable=import-outside-toplevel
+
+            statistics = adapt_csv_in_parallel(
+                arguments.input,
+                arguments.output,
+                column_configs,
+                workers=arguments.workers,
+                chunk_size=arguments.chunk_size,
+                on_chunk=on_chunk,
+            )
+        else:
+            statistics = adapt_file(
+                arguments.input, arguments.output, column_configs, chunk_size=arguments.chunk_size, on_chunk=on_chunk
+            )
+    except (OSError, ValueError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    _print_statistics(statistics)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+contains the pyarrow integration of chronomeleon, a compute-style function that maps timestamp and date arrays.
+
+It operates on the underlying int64 buffers, so there's no Python object per value. Nulls are passed through.
+This module requires pyarrow and numpy (install chronomeleon[parquet]).
+"""
+
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import pyarrow as pa  # type: ignore[import-untyped,import-not-found,unused-ignore]
+
+from chronomeleon.batch import NOT_A_TIME, adapt_epoch_values
+from chronomeleon.mapping import compile_config
+from chronomeleon.models.mapping_config import MappingConfig
+from chronomeleon.transition_index import MICROSECONDS_PER_DAY, get_timezone_name
+
+_NANOSECONDS_PER_DAY = 1_000 * MICROSECONDS_PER_DAY
+
+
+def _get_arrow_timezone(config: MappingConfig) -> str:
+    if config.target.implicit_timezone is None:
+        return "UTC"
+    name = get_timezone_name(config.target.implicit_timezone)
+    return name.removeprefix("UTC") if name.startswith(("UTC+", "UTC-")) else name  # e.g. '+01:00' for fixed offsets
+
+
+_MILLISECONDS_PER_DAY = MICROSECONDS_PER_DAY // 1_000
+
+
+def _get_epoch_values(array: Any) -> tuple[str, bool, npt.NDArray[np.int64]]:
+    """
+    returns the unit, whether the values are aware (UTC instants) and the int64 values since epoch (NaT for nulls) of
+    the array; date64 values are dates (just like date32 values), so they're returned in days
+    """
+    if pa.types.is_timestamp(array.type):
+        return array.type.unit, array.type.tz is not None, array.cast(pa.int64()).fill_null(NOT_A_TIME).to_numpy()
+    if pa.types.is_date32(array.type):
+        return "D", False, array.cast(pa.int32()).cast(pa.int64()).fill_null(NOT_A_TIME).to_numpy()
+    if pa.types.is_date64(array.type):
+        milliseconds = array.cast(pa.int64()).fill_null(NOT_A_TIME).to_numpy()
+        return "D", False, np.where(milliseconds == NOT_A_TIME, NOT_A_TIME, milliseconds // _MILLISECONDS_PER_DAY)
+    raise ValueError(f"the array must be a timestamp or date array but is {array.type}")
+
+
+def _adapt_array(array: Any, config: MappingConfig, naive: bool) -> Any:
+    unit, is_aware, values = _get_epoch_values(array)
+    is_valid = array.is_valid().to_numpy(zero_copy_only=False)
+    # the values are not cast to us, because that raises for ns values with a remainder; the remainder is kept instead
+    result = adapt_epoch_values(values, unit, is_aware, config, naive or config.target.is_date_only)
+    if config.target.is_date_only:
+        days = result // (_NANOSECONDS_PER_DAY if unit == "ns" else MICROSECONDS_PER_DAY)
+        return pa.array(days.astype(np.int32), mask=~is_valid).cast(pa.date32())
+    timezone = None if naive else _get_arrow_timezone(config)
+    return pa.array(result, mask=~is_valid, type=pa.int64()).cast(
+        pa.timestamp("ns" if unit == "ns" else "us", tz=timezone)
+    )
+
+
+def adapt_arrow(array: Any, config: MappingConfig, *, naive: bool = False) -> Any:
+    """
+    Maps all values of the pyarrow timestamp or date (Chunked)Array to values compatible with the target system; it's
+    the vectorized equivalent of calling adapt_to_target for each value. Nulls are passed through.
+    The result is a timestamp array (in ns if the input is in ns and in us otherwise) with the implicit_timezone of the
+    target or UTC as timezone; if naive, its timestamps are the wall clock values in that timezone without a timezone
+    (as written by adapt_parquet). If the target is_date_only, the result is a date32 array instead.
+    """
+    compile_config(config)  # raises if the config is not self-consistent
+    if isinstance(array, pa.ChunkedArray):
+        return pa.chunked_array([_adapt_array(chunk, config, naive) for chunk in array.chunks])
+    return _adapt_array(array, config, naive)
@@ -0,0 +1,154 @@
+"""
+contains an asynchronous streaming adapter for asyncio based services, which read e.g. from async database cursors or
+message queues.
+
+The values are collected into batches. Small batches are mapped directly in the event loop (which is blocked only
+briefly), larger ones are offloaded to an executor (by default the thread pool of the event loop), so that other
+coroutines keep running in the meantime. The results are yielded in the order of the input.
+At most max_pending offloaded batches are in flight; as long as they're not consumed, no more values are read from the
+source (backpressure).
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import Executor
+from datetime import date, datetime
+from typing import AsyncIterable, AsyncIterator, Optional, Sequence, Union
+
+from chronomeleon.mapping import compile_config, get_cached_plan
+from chronomeleon.models.mapping_config import MappingConfig
+from chronomeleon.streaming import adapt_chunk
+
+DEFAULT_BATCH_SIZE = 1_000
+"""
+the default (maximum) number of values per batch
+"""
+
+DEFAULT_MIN_OFFLOAD_SIZE = 500
+"""
+batches with less values than this are mapped in the event loop itself
+"""
+
+
+def _adapt_batch(config: MappingConfig, first_row_index: int, batch: Sequence[Union[date, datetime]]) -> list[datetime]:
+    """
+    maps a batch in the executor; the plan is looked up from the config, so that it is also compiled only once per
+    worker if the executor is a ProcessPoolExecutor
+    """
+    return adapt_chunk(batch, first_row_index, get_cached_plan(config))
+
+
+class _BatchReader:
+    """
+    reads batches of up to batch_size values from an async iterable; if max_delay is set, a batch is returned at the
+    latest max_delay seconds after its first value has been read, even if it is not full yet
+    """
+
+    def __init__(
+        self, source_values: AsyncIterable[Union[date, datetime]], batch_size: int, max_delay: Optional[float]
+    ):
+        self._iterator = aiter(source_values)
+        self._batch_size = batch_size
+        self._max_delay = max_delay
+        self._next_value: Optional[asyncio.Future[Union[date, datetime]]] = None
+        self._is_exhausted = False
+
+    async def _has_next_value(self, timeout: Optional[float]) -> bool:
+        """
+        waits (at most timeout seconds) for the next value; returns False if it has not been read yet
+        """
+        if self._next_value is None:
+            self._next_value = asyncio.ensure_future(anext(self._iterator))
+        if timeout is not None:
+            await asyncio.wait({self._next_value}, timeout=max(timeout, 0))
+            return self._next_value.done()
+        await asyncio.wait({self._next_value})
+        return True
+
+    async def read_batch(self) -> list[Union[date, datetime]]:
+        """
+        returns the next batch; an empty batch means that the source is exhausted
+        """
+        loop = asyncio.get_running_loop()
+        batch: list[Union[date, datetime]] = []
+        deadline: Optional[float] = None
+        while not self._is_exhausted and len(batch) < self._batch_size:
+            if not await self._has_next_value(None if deadline is None else deadline - loop.time()):
+                break  # the batch is due
+            next_value, self._next_value = self._next_value, None
+            assert next_value is not None
+            try:
+                batch.append(next_value.result())
+            except StopAsyncIteration:
+                self._is_exhausted = True
+            if deadline is None and self._max_delay is not None:
+                deadline = loop.time() + self._max_delay
+        return batch
+
+    def close(self) -> None:
+        """
+        stops waiting for the next value
+        """
+        if self._next_value is not None:
+            self._next_value.cancel()
+
+
+async def _pop_results(pending: deque["asyncio.Future[list[datetime]]"], max_pending: int) -> AsyncIterator[datetime]:
+    """
+    pops the batches from the front, which are done or have to be waited for (because more than max_pending batches
+    are in flight), and yields their results
+    """
+    while pending and (len(pending) > max_pending or pending[0].done()):
+        for result in await pending.popleft():
+            yield result
+
+
+async def adapt_stream(  # pylint:disable=too-many-arguments
+    source_values: AsyncIterable[Union[date, datetime]],
+    config: MappingConfig,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_delay: Optional[float] = None,
+    executor: Optional[Executor] = None,
+    min_offload_size: int = DEFAULT_MIN_OFFLOAD_SIZE,
+    max_pending: int = 2,
+) -> AsyncIterator[datetime]:
+    """
+    Maps the values of the async iterable just like adapt_to_target and yields the results in the same order:
+
+        async for result in adapt_stream(source_values, config):
+            ...
+
+    Batches with at least min_offload_size values are mapped by the executor (defaults to the thread pool of the event
+    loop; a ProcessPoolExecutor works, too). If max_delay is set, incomplete batches are mapped at the latest
+    max_delay seconds after their first value arrived, which limits the latency of slowly trickling sources.
+    Raises a ConversionError with the index of the first value that cannot be mapped.
+    """
+    plan = compile_config(config)  # raises if the config is not self-consistent
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1 but is {batch_size}")
+    if max_pending < 1:
+        raise ValueError(f"max_pending must be at least 1 but is {max_pending}")
+    loop = asyncio.get_running_loop()
+    reader = _BatchReader(source_values, batch_size, max_delay)
+    pending: deque[asyncio.Future[list[datetime]]] = deque()
+    first_row_index = 0
+    try:
+        while batch := await reader.read_batch():
+            if len(batch) >= min_offload_size:
+                pending.append(loop.run_in_executor(executor, _adapt_batch, config, first_row_index, batch))
+            else:
+                # small batches are mapped in the event loop; the results of the preceding batches have to come first
+                async for result in _pop_results(pending, 0):
+                    yield result
+                for result in adapt_chunk(batch, first_row_index, plan):
+                    yield result
+            first_row_index += len(batch)
+            async for result in _pop_results(pending, max_pending):
+                yield result
+        async for result in _pop_results(pending, 0):
+            yield result
+    finally:
+        reader.close()
+        for future in pending:  # e.g. if a batch failed or the consumer stopped early
+            future.cancel()
@@ -0,0 +1,551 @@
+"""
+contains adapt_many, the vectorized counterpart of adapt_to_target, which maps an entire column at once
+(and adapt_ranges, the vectorized counterpart of adapt_range_to_target).
+
+This module requires numpy (install chronomeleon[numpy]).
+"""
+
+from datetime import date, datetime, timedelta, tzinfo
+from functools import lru_cache
+from typing import Any, Mapping, Optional, Sequence, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from chronomeleon.errors import ConversionError, ErrorKind
+from chronomeleon.gastag import get_berlin, get_gastag_table
+from chronomeleon.mapping import check_config
+from chronomeleon.models.mapping_config import MappingConfig
+from chronomeleon.models.range_mapping_config import RangeMappingConfig
+from chronomeleon.registry import ConfigRegistry
+from chronomeleon.transition_index import (
+    EPOCH,
+    MAX_MICROSECONDS,
+    MICROSECONDS_PER_DAY,
+    MICROSECONDS_PER_HOUR,
+    MIN_MICROSECONDS,
+    ONE_MICROSECOND,
+    from_microseconds,
+    get_transition_index,
+)
+
+_SIX_HOURS = 6 * MICROSECONDS_PER_HOUR
+_EPOCH_ORDINAL = EPOCH.toordinal()
+
+SourceValues = Union[npt.NDArray[np.datetime64], npt.NDArray[np.int64], Sequence[Union[date, datetime]]]
+"""
+the column types accepted by adapt_many:
+* a numpy datetime64 array holds naive (wall clock) values; if its unit is 'D', the values are treated like dates
+* a numpy int64 array holds timezone-aware instants as microseconds since 1970-01-01T00:00:00Z (unix epoch)
+* a sequence of date or datetime objects is treated element-wise just like adapt_to_target would treat it
+"""
+
+
+def _to_microseconds(value: timedelta) -> int:
+    return value // ONE_MICROSECOND
+
+
+class RowErrors:  # pylint:disable=too-few-public-methods
+    """
+    collects the rows which cannot be mapped per kind of error instead of raising (see chronomeleon.validation).
+    Each row is recorded only with the first error, which occurs.
+    """
+
+    def __init__(self) -> None:
+        self.masks: dict[ErrorKind, npt.NDArray[np.bool_]] = {}
+        """
+        the rows which cannot be mapped, per kind of error
+        """
+        self.is_invalid: Optional[npt.NDArray[np.bool_]] = None
+        """
+        all rows which cannot be mapped (None if there are none)
+        """
+
+    def add(self, kind: ErrorKind, is_invalid: npt.NDArray[np.bool_], values: npt.NDArray[np.int64]) -> None:
+        """
+        records the invalid rows and replaces their values by the epoch, so that the following steps do not fail
+        """
+        if self.is_invalid is not None:
+            is_invalid = is_invalid & ~self.is_invalid
+        if not is_invalid.any():
+            return
+        self.masks[kind] = self.masks[kind] | is_invalid if kind in self.masks else is_invalid.copy()
+        self.is_invalid = is_invalid.copy() if self.is_invalid is None else self.is_invalid | is_invalid
+        values[is_invalid] = 0
+
+
+@lru_cache(maxsize=None)
+def get_transition_arrays(
+    timezone: tzinfo,
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.bool_]]:
+    """
+    returns the transitions, offsets and DST flags of the timezone's TransitionIndex as numpy arrays
+    """
+    index = get_transition_index(timezone)
+    return (
+        np.array(index.transitions, dtype=np.int64),
+        np.array(index.offsets, dtype=np.int64),
+        np.array(index.is_dst, dtype=np.bool_),
+    )
+
+
+def get_positions(transitions: npt.NDArray[np.int64], utc_values: npt.NDArray[np.int64]) -> npt.NDArray[np.intp]:
+    """
+    returns the index of the transition (see get_transition_arrays), which applies to each UTC value
+    """
+    return np.maximum(np.searchsorted(transitions, utc_values, side="right") - 1, 0)
+
+
+def utc_to_local(utc_values: npt.NDArray[np.int64], timezone: tzinfo) -> npt.NDArray[np.int64]:
+    """
+    vectorized equivalent of TransitionIndex.utc_to_local
+    """
+    transitions, offsets, _ = get_transition_arrays(timezone)
+    return utc_values + offsets[get_positions(transitions, utc_values)]
+
+
+_Candidate = tuple[npt.NDArray[np.int64], npt.NDArray[np.bool_], npt.NDArray[np.bool_]]
+"""
+a candidate UTC instant for each local value, whether it is valid and whether it uses a DST offset
+"""
+
+
+def _get_localization_candidate(local_values: npt.NDArray[np.int64], timezone: tzinfo, delta: int) -> _Candidate:
+    """
+    Just like pytz, we look up the offset that is valid delta microseconds before/after the local value.
+    This offset leads to a candidate UTC instant, which is valid if it maps back to the same local value.
+    """
+    transitions, offsets, is_dst = get_transition_arrays(timezone)
+    positions = get_positions(transitions, local_values + delta)
+    candidate = local_values - offsets[positions]
+    is_valid = offsets[get_positions(transitions, candidate)] == offsets[positions]
+    return candidate, is_valid, is_dst[positions]
+
+
+def _choose_ambiguous_candidate(first: _Candidate, second: _Candidate, is_dst: bool) -> npt.NDArray[np.int64]:
+    """
+    prefers the candidate whose DST flag matches is_dst; if that's not unique, takes the earliest/latest instant
+    """
+    preferred = np.where(first[2] == is_dst, first[0], second[0])
+    fallback = np.minimum(first[0], second[0]) if is_dst else np.maximum(first[0], second[0])
+    return np.where(first[2] != second[2], preferred, fallback)
+
+
+def _get_invalid_local_values(
+    local_values: npt.NDArray[np.int64], timezone: tzinfo
+) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+    """
+    returns the masks of the ambiguous and of the non-existent local values
+    """
+    first = _get_localization_candidate(local_values, timezone, -MICROSECONDS_PER_DAY)
+    second = _get_localization_candidate(local_values, timezone, MICROSECONDS_PER_DAY)
+    return first[1] & second[1] & (first[0] != second[0]), ~first[1] & ~second[1]
+
+
+def local_to_utc(
+    local_values: npt.NDArray[np.int64], timezone: tzinfo, is_dst: Optional[bool] = False
+) -> npt.NDArray[np.int64]:
+    """
+    vectorized equivalent of TransitionIndex.local_to_utc
+    """
+    first = _get_localization_candidate(local_values, timezone, -MICROSECONDS_PER_DAY)
+    second = _get_localization_candidate(local_values, timezone, MICROSECONDS_PER_DAY)
+    result = np.where(first[1], first[0], second[0])
+    is_ambiguous = first[1] & second[1] & (first[0] != second[0])
+    is_non_existent = ~first[1] & ~second[1]
+    if is_dst is None:
+        if is_ambiguous.any() or is_non_existent.any():
+            invalid_value = int(local_values[is_ambiguous | is_non_existent][0])
+            kind = "ambiguous" if is_ambiguous.any() else "non-existent"
+            raise ValueError(f"{from_microseconds(invalid_value)} is {kind} in {get_transition_index(timezone).zone}")
+        return result
+    if is_ambiguous.any():
+        result = np.where(is_ambiguous, _choose_ambiguous_candidate(first, second, is_dst), result)
+    if is_non_existent.any():
+        # Just like pytz, we use the offset from 6 hours before (after) the gap.
+        six_hours = -_SIX_HOURS if is_dst else _SIX_HOURS
+        result[is_non_existent] = local_to_utc(local_values[is_non_existent] - six_hours, timezone, is_dst) + six_hours
+    return result
+
+
+@lru_cache(maxsize=1)
+def get_gastag_arrays() -> tuple[int, npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """
+    returns the first day number, the midnights and the Gastag starts of the GastagTable as numpy arrays
+    """
+    table = get_gastag_table()
+    midnights = np.array(table.midnights, dtype=np.int64)
+    return table.first_day_number, midnights, np.array(table.gastag_starts, dtype=np.int64)
+
+
+def _shift_gastag_starts_to_midnight(utc_values: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+    """
+    vectorized equivalent of gastag.shift_gastag_start_to_midnight
+    """
+    first_day_number, midnights, gastag_starts = get_gastag_arrays()
+    positions = utc_values // MICROSECONDS_PER_DAY - first_day_number
+    is_in_table = (positions >= 0) & (positions < len(gastag_starts))
+    positions = np.where(is_in_table, positions, 0)
+    result = np.where(is_in_table & (gastag_starts[positions] == utc_values), midnights[positions], utc_values)
+    if not is_in_table.all():
+        # outside the table, we have to do the math
+        berlin_local_values = utc_to_local(utc_values, get_berlin())
+        is_gastag_start = ~is_in_table & (np.mod(berlin_local_values, MICROSECONDS_PER_DAY) == _SIX_HOURS)
+        result[is_gastag_start] = local_to_utc(berlin_local_values[is_gastag_start] - _SIX_HOURS, get_berlin())
+    return result
+
+
+def _shift_midnights_to_gastag_start(utc_values: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+    """
+    vectorized equivalent of gastag.shift_midnight_to_gastag_start
+    """
+    first_day_number, midnights, gastag_starts = get_gastag_arrays()
+    positions = utc_values // MICROSECONDS_PER_DAY - first_day_number + 1  # midnight is on the previous UTC day
+    is_in_table = (positions >= 0) & (positions < len(midnights))
+    positions = np.where(is_in_table, positions, 0)
+    result = np.where(is_in_table & (midnights[positions] == utc_values), gastag_starts[positions], utc_values)
+    if not is_in_table.all():
+        berlin_local_values = utc_to_local(utc_values, get_berlin())
+        is_midnight = ~is_in_table & (np.mod(berlin_local_values, MICROSECONDS_PER_DAY) == 0)
+        result[is_midnight] = local_to_utc(berlin_local_values[is_midnight] + _SIX_HOURS, get_berlin())
+    return result
+
+
+def _sequence_to_arrays(
+    source_values: Sequence[Union[date, datetime]],
+    resolution: Optional[timedelta],
+    date_shift: int,
+    errors: Optional[RowErrors],
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.bool_]]:
+    """
+    converts a sequence of dates and datetimes; see source_values_to_arrays
+    """
+    values = np.zeros(len(source_values), dtype=np.int64)
+    is_of_invalid_type = np.zeros(len(source_values), dtype=np.bool_)
+    is_aware = np.zeros(len(source_values), dtype=np.bool_)
+    resolution_in_microseconds = 0 if resolution is None else _to_microseconds(resolution)
+    for index, source_value in enumerate(source_values):
+        if isinstance(source_value, datetime):
+            utc_offset = source_value.utcoffset()
+            if utc_offset is None:
+                values[index] = _to_microseconds(source_value - EPOCH) + resolution_in_microseconds
+            else:
+                # the resolution is added to the UTC instant (see _to_exclusive_end_datetime)
+                values[index] = _to_microseconds(source_value.replace(tzinfo=None) - EPOCH - utc_offset)
+                values[index] += resolution_in_microseconds
+                is_aware[index] = True
+        elif isinstance(source_value, date):
+            values[index] = (source_value.toordinal() - _EPOCH_ORDINAL) * MICROSECONDS_PER_DAY + date_shift
+        elif errors is None:
+            raise ValueError(
+                f"source_values[{index}] must be a date or datetime object but is {source_value.__class__.__name__}"
+            )
+        else:
+            is_of_invalid_type[index] = True
+    if errors is not None and is_of_invalid_type.any():
+        is_missing = np.zeros(len(source_values), dtype=np.bool_)
+        is_missing[[i for i in np.flatnonzero(is_of_invalid_type).tolist() if source_values[i] is None]] = True
+        errors.add(ErrorKind.MISSING, is_missing, values)
+        errors.add(ErrorKind.INVALID_TYPE, is_of_invalid_type & ~is_missing, values)
+    return values, is_aware
+
+
+def source_values_to_arrays(
+    source_values: SourceValues,
+    config: MappingConfig,
+    errors: Optional[RowErrors] = None,
+    to_exclusive_end: bool = True,
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.bool_]]:
+    """
+    converts the source values to microseconds since epoch which are already shifted to an exclusive end, if necessary
+    (and if to_exclusive_end is True).
+    returns those values and a mask which is True where the value is an aware UTC instant (and False where it's naive).
+    If errors is set, values of the wrong type and missing values (None, NaT) are recorded there instead of raising.
+    """
+    resolution: Optional[timedelta] = None
+    date_shift = 0
+    if to_exclusive_end and config.is_end and config.source.is_inclusive_end:
+        assert config.source.resolution is not None  # ensured by the consistency check
+        resolution = config.source.resolution
+        date_shift = MICROSECONDS_PER_DAY
+    if not isinstance(source_values, np.ndarray):
+        return _sequence_to_arrays(source_values, resolution, date_shift, errors)
+    shift = 0 if resolution is None else _to_microseconds(resolution)
+    if np.issubdtype(source_values.dtype, np.datetime64):
+        values = source_values.astype("datetime64[us]").astype(np.int64)
+        is_aware = np.zeros(values.shape, dtype=np.bool_)
+        if np.datetime_data(source_values.dtype)[0] == "D":  # type: ignore[arg-type]
+            shift = date_shift
+    elif np.issubdtype(source_values.dtype, np.integer):
+        values = source_values.astype(np.int64)
+        is_aware = np.ones(values.shape, dtype=np.bool_)
+    else:
+        raise ValueError(f"source_values must be a datetime64 or int64 array but has dtype {source_values.dtype}")
+    if errors is not None:
+        errors.add(ErrorKind.MISSING, values == NOT_A_TIME, values)
+    return values + shift, is_aware
+
+
+def _check_range(values: npt.NDArray[np.int64], errors: Optional[RowErrors] = None) -> None:
+    if errors is not None:
+        errors.add(ErrorKind.OUT_OF_RANGE, (values < MIN_MICROSECONDS) | (values > MAX_MICROSECONDS), values)
+    elif values.size > 0 and (values.min() < MIN_MICROSECONDS or values.max() > MAX_MICROSECONDS):
+        raise OverflowError("date value out of range")
+
+
+def convert_source_values_to_utc(
+    source_values: SourceValues, config: MappingConfig, errors: Optional[RowErrors] = None
+) -> npt.NDArray[np.int64]:
+    """
+    vectorized equivalent of _convert_source_date_or_datetime_to_aware_datetime.
+    returns the (exclusive) UTC instants as microseconds since epoch.
+    If errors is set, the rows which cannot be mapped are recorded there instead of raising.
+    """
+    values, is_aware = source_values_to_arrays(source_values, config, errors)  # new arrays, we may modify them
+    _check_range(values, errors)
+    if not is_aware.all():
+        if config.source.implicit_timezone is None:
+            if errors is None:
+                # pylint:disable=line-too-long
+                raise ValueError(
+                    "source_value must be timezone-aware or implicit_timezone must be set in the mapping configuration"
+                )
+            errors.add(ErrorKind.NAIVE_WITHOUT_TIMEZONE, ~is_aware, values)
+        else:
+            is_naive = ~is_aware
+            if errors is not None and config.source.implicit_is_dst is None:
+                is_ambiguous, is_non_existent = _get_invalid_local_values(values, config.source.implicit_timezone)
+                errors.add(ErrorKind.AMBIGUOUS, is_ambiguous & is_naive, values)
+                errors.add(ErrorKind.NON_EXISTENT, is_non_existent & is_naive, values)
+            values[is_naive] = local_to_utc(
+                values[is_naive], config.source.implicit_timezone, config.source.implicit_is_dst
+            )
+    if config.source.is_gastag_aware and config.is_gas:
+        values = _shift_gastag_starts_to_midnight(values)
+    _check_range(values, errors)
+    return values
+
+
+def convert_utc_values_to_target(
+    values: npt.NDArray[np.int64],
+    config: MappingConfig,
+    to_wall_clock: bool = True,
+    errors: Optional[RowErrors] = None,
+) -> npt.NDArray[np.int64]:
+    """
+    vectorized equivalent of _convert_aware_datetime_to_target.
+    returns the wall clock values of the target as microseconds since epoch.
+    If to_wall_clock is False, the UTC instants are returned instead (unless the target is_date_only).
+    If errors is set, the rows which are out of range are recorded there instead of raising.
+    """
+    values = values.copy()
+    if config.target.is_gastag_aware and config.is_gas:
+        values = _shift_midnights_to_gastag_start(values)
+    if config.is_end and config.target.is_inclusive_end:
+        assert config.target.resolution is not None  # ensured by the consistency check
+        values -= _to_microseconds(config.target.resolution)
+    if config.target.implicit_timezone is not None and (to_wall_clock or config.target.is_date_only):
+        values = utc_to_local(values, config.target.implicit_timezone)
+    if config.target.is_date_only:
+        values -= np.mod(values, MICROSECONDS_PER_DAY)
+    _check_range(values, errors)
+    return values
+
+
+def convert_target_values_to_utc(values: npt.NDArray[np.int64], config: MappingConfig) -> npt.NDArray[np.int64]:
+    """
+    the inverse of convert_utc_values_to_target with to_wall_clock=False (see compile_inverse): returns the (exclusive)
+    UTC instants of the target values, which are UTC instants or, if the target is_date_only, naive midnights.
+    """
+    if config.target.is_date_only and config.target.implicit_timezone is not None:
+        values = local_to_utc(values, config.target.implicit_timezone, config.target.implicit_is_dst)
+    if config.is_end and config.target.is_inclusive_end:
+        assert config.target.resolution is not None  # ensured by the consistency check
+        values = values + _to_microseconds(config.target.resolution)
+    if config.target.is_gastag_aware and config.is_gas:
+        values = _shift_gastag_starts_to_midnight(values)
+    _check_range(values)
+    return values
+
+
+def convert_utc_values_to_source(values: npt.NDArray[np.int64], config: MappingConfig) -> npt.NDArray[np.int64]:
+    """
+    the inverse of convert_source_values_to_utc (see compile_inverse): returns the wall clock values of the source
+    (in its implicit timezone or UTC) as microseconds since epoch.
+    """
+    if config.source.is_gastag_aware and config.is_gas:
+        values = _shift_midnights_to_gastag_start(values)
+    if config.source.implicit_timezone is not None:
+        values = utc_to_local(values, config.source.implicit_timezone)
+    if config.is_end and config.source.is_inclusive_end:
+        assert config.source.resolution is not None  # ensured by the consistency check
+        values = values - (
+            MICROSECONDS_PER_DAY if config.source.is_date_only else _to_microseconds(config.source.resolution)
+        )
+        if config.source.implicit_timezone is not None:  # the wall clock value may not exist (or be ambiguous)
+            utc_values = local_to_utc(values, config.source.implicit_timezone, config.source.implicit_is_dst)
+            values = utc_to_local(utc_values, config.source.implicit_timezone)
+    if config.source.is_date_only:
+        values = values - np.mod(values, MICROSECONDS_PER_DAY)
+    _check_range(values)
+    return values
+
+
+def check_arguments(source_values: SourceValues, config: MappingConfig) -> None:
+    """
+    raises a ValueError if the source values or the config are missing or if the config is not self-consistent
+    """
+    if source_values is None:
+        raise ValueError("source_values must not be None")
+    check_config(config)
+
+
+def adapt_many(source_values: SourceValues, config: MappingConfig) -> npt.NDArray[np.datetime64]:
+    """
+    maps all the source values to values compatible with the target system by using the given mapping configuration.
+    This is the vectorized equivalent of calling adapt_to_target for each single value (and returns the same results).
+
+    Other than adapt_to_target, the result is a numpy datetime64[us] array of the same length as source_values.
+    It contains the naive wall clock values of what adapt_to_target returns: They're in the implicit_timezone of the
+    target, if set, and in UTC otherwise.
+    """
+    check_arguments(source_values, config)
+    utc_values = convert_source_values_to_utc(source_values, config)  # step 1
+    target_values = convert_utc_values_to_target(utc_values, config)  # step 2
+    return target_values.astype("datetime64[us]")
+
+
+def _take(source_values: SourceValues, positions: npt.NDArray[np.intp]) -> SourceValues:
+    if isinstance(source_values, np.ndarray):
+        return source_values[positions]
+    return [source_values[position] for position in positions.tolist()]
+
+
+def _group_config_keys(config_keys: Union[npt.NDArray[Any], Sequence[Any]]) -> tuple[list[Any], npt.NDArray[np.intp]]:
+    """
+    returns the distinct config keys and the index of each row's key among them; keys are compared like dict keys (so
+    tuples, None and keys of different types work), only numeric and string arrays are grouped by numpy
+    """
+    if isinstance(config_keys, np.ndarray) and config_keys.dtype.kind in "biufUS":
+        unique_keys, group_ids = np.unique(config_keys, return_inverse=True)
+        return unique_keys.tolist(), group_ids.ravel().astype(np.intp)
+    key_ids: dict[Any, int] = {}
+    ids = [key_ids.setdefault(key, len(key_ids)) for key in config_keys]
+    return list(key_ids), np.array(ids, dtype=np.intp)
+
+
+def adapt_mixed(
+    source_values: SourceValues,
+    config_keys: Union[npt.NDArray[Any], Sequence[Any]],
+    configs: Union[Mapping[Any, MappingConfig], ConfigRegistry],
+) -> npt.NDArray[np.datetime64]:
+    """
+    Maps each source value with its own config, just like adapt_to_target(source_values[i], configs[config_keys[i]]).
+    The config_keys are e.g. the names of configs in a ConfigRegistry (or the keys of any mapping of configs).
+    The rows are grouped by config (with a stable sort) and each group is mapped in one pass of adapt_many, so the
+    overhead depends on the number of distinct configs, not on the number of rows.
+    The result is the same as adapt_many would return for each row: the wall clock values in the implicit_timezone of
+    the row's target (or UTC); if the targets differ in their timezones, so do the values.
+    Raises a KeyError for config keys without config.
+    """
+    if source_values is None or config_keys is None or configs is None:
+        raise ValueError("source_values, config_keys and configs must not be None")
+    if len(source_values) != len(config_keys):
+        lengths = f"{len(source_values)} and {len(config_keys)}"
+        raise ValueError(f"source_values and config_keys must have the same length but have {lengths}")
+    unique_keys, group_ids = _group_config_keys(config_keys)
+    group_configs = [
+        configs.get_config(key) if isinstance(configs, ConfigRegistry) else configs[key] for key in unique_keys
+    ]
+    order = np.argsort(group_ids, kind="stable")
+    group_sizes = np.bincount(group_ids, minlength=len(unique_keys))
+    group_ends = np.cumsum(group_sizes)
+    result = np.empty(len(source_values), dtype="datetime64[us]")
+    for config, group_start, group_end in zip(group_configs, (group_ends - group_sizes).tolist(), group_ends.tolist()):
+        positions = order[group_start:group_end]
+        result[positions] = adapt_many(_take(source_values, positions), config)
+    return result
+
+
+NOT_A_TIME = np.iinfo(np.int64).min
+"""
+the integer representation of NaT (not a time) in numpy and pandas
+"""
+
+_MICROSECONDS_PER_UNIT = {"D": MICROSECONDS_PER_DAY, "s": 1_000_000, "ms": 1_000, "us": 1}
+
+
+def adapt_epoch_values(
+    values: npt.NDArray[np.int64], unit: str, is_aware: bool, config: MappingConfig, to_wall_clock: bool = True
+) -> npt.NDArray[np.int64]:
+    """
+    Maps the integers since epoch in the given unit ('D', 's', 'ms', 'us' or 'ns'); this is the common core of the
+    pandas and pyarrow integrations. The values are UTC instants if is_aware and naive wall clock values otherwise.
+    NaT (the smallest int64) is passed through.
+    Returns integers since epoch in ns if the unit is ns and in us otherwise: the wall clock values of the target or,
+    if to_wall_clock is False, the UTC instants (see convert_utc_values_to_target).
+    """
+    is_valid = values != NOT_A_TIME
+    valid_values = values[is_valid]
+    remainders: Optional[npt.NDArray[np.int64]] = None
+    if unit == "ns":
+        microseconds, remainders = np.divmod(valid_values, 1_000)
+    elif unit in _MICROSECONDS_PER_UNIT:
+        microseconds = valid_values * _MICROSECONDS_PER_UNIT[unit]
+    else:
+        raise ValueError(f"unit must be one of D, s, ms, us or ns but is {unit}")
+    source_values: SourceValues = microseconds
+    if not is_aware:
+        source_values = valid_values.astype("datetime64[D]") if unit == "D" else microseconds.astype("datetime64[us]")
+    utc_values = convert_source_values_to_utc(source_values, config)
+    result_values = convert_utc_values_to_target(utc_values, config, to_wall_clock)
+    if remainders is not None:
+        has_remainder = remainders != 0
+        if config.is_gas and has_remainder.any():
+            # The Gastag shifts only apply to values that are exactly a midnight or Gastag start, which values with
+            # a remainder of nanoseconds are not. We cannot see this in microseconds, so we convert them without.
+            non_gas_config = MappingConfig(
+                source=config.source, target=config.target, is_end=config.is_end, is_gas=False
+            )
+            result_values[has_remainder] = convert_utc_values_to_target(
+                convert_source_values_to_utc(source_values[has_remainder], non_gas_config),
+                non_gas_config,
+                to_wall_clock,
+            )
+        if config.target.is_date_only:
+            remainders = np.zeros_like(remainders)
+        if result_values.size > 0 and np.abs(result_values).max() >= np.iinfo(np.int64).max // 1_000:
+            raise OverflowError("date value out of range")
+        result_values = result_values * 1_000 + remainders
+    result = np.full(values.shape, NOT_A_TIME, dtype=np.int64)
+    result[is_valid] = result_values
+    return result
+
+
+def adapt_ranges(
+    starts: SourceValues, ends: SourceValues, config: RangeMappingConfig, validate_order: bool = False
+) -> tuple[npt.NDArray[np.datetime64], npt.NDArray[np.datetime64]]:
+    """
+    maps the starts and the ends of ranges to values compatible with the target system by using the given range
+    mapping configuration. This is the vectorized equivalent of adapt_range_to_target (see adapt_many for the types).
+    If validate_order is True, a ConversionError with the index of the first range whose start is not before its
+    (exclusive) end is raised.
+    """
+    if starts is None or ends is None:
+        raise ValueError("starts and ends must not be None")
+    if len(starts) != len(ends):
+        raise ValueError(f"starts and ends must have the same length but have {len(starts)} and {len(ends)}")
+    check_config(config)
+    start_config = config.start_config
+    end_config = config.end_config
+    utc_starts = convert_source_values_to_utc(starts, start_config)
+    utc_ends = convert_source_values_to_utc(ends, end_config)
+    if validate_order:
+        invalid_positions = np.flatnonzero(utc_starts >= utc_ends)
+        if len(invalid_positions) > 0:
+            row_index = int(invalid_positions[0])
+            raise ConversionError(row_index, f"the start {starts[row_index]} must be before the end {ends[row_index]}")
+    return (
+        convert_utc_values_to_target(utc_starts, start_config).astype("datetime64[us]"),
+        convert_utc_values_to_target(utc_ends, end_config).astype("datetime64[us]"),
+    )
@@ -0,0 +1,125 @@
+"""
+contains an opt-in cache for the results of adapt_to_target.
+
+Migration data is often highly repetitive (e.g. many contracts start on the first of a month), so the same source
+value is mapped with the same configuration over and over again. The cache stores the results by source value and
+configuration and evicts the least recently used ones, once it is full. Its statistics show how much repetition there
+actually is.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+from threading import Lock
+from typing import Hashable, Union
+
+from chronomeleon.mapping import adapt_to_target
+from chronomeleon.models.mapping_config import MappingConfig
+
+DEFAULT_MAX_SIZE = 65_536
+"""
+the default number of results that are cached
+"""
+
+
+@dataclass(frozen=True, kw_only=True)
+class CacheInfo:
+    """
+    statistics of an AdaptToTargetCache (similar to functools.lru_cache's cache_info)
+    """
+
+    hits: int
+    """
+    the number of calls that were answered from the cache
+    """
+    misses: int
+    """
+    the number of calls that had to be mapped
+    """
+    evictions: int
+    """
+    the number of results that were removed from the cache to make room for new ones
+    """
+    max_size: int
+    """
+    the maximum number of cached results
+    """
+    size: int
+    """
+    the current number of cached results
+    """
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        the share of calls that were answered from the cache (0 if there have not been any calls yet)
+        """
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+class AdaptToTargetCache:
+    """
+    A bounded least recently used (LRU) cache around adapt_to_target.
+    Calling it is equivalent to calling adapt_to_target, but the result for the same source value and configuration is
+    mapped only once (as long as it is not evicted). Errors are not cached.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1 but is {max_size}")
+        self._max_size = max_size
+        self._results: OrderedDict[Hashable, datetime] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __call__(self, source_value: Union[date, datetime], config: MappingConfig) -> datetime:
+        """
+        maps the source value just like adapt_to_target, but returns the cached result, if there is one
+        """
+        # the type is part of the key because e.g. date(2024, 1, 1) and a datetime may still be mapped differently.
+        # Aware datetimes in the same timezone are compared by their wall clock (without the fold), so e.g. the two
+        # 2:30 in the repeated hour are equal; the fold and the UTC offset tell them apart.
+        if isinstance(source_value, datetime):
+            key: Hashable = (datetime, source_value, source_value.fold, source_value.utcoffset(), config)
+        else:
+            key = (source_value.__class__, source_value, config)
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._hits += 1
+                self._results.move_to_end(key)
+                return result
+        result = adapt_to_target(source_value, config)
+        with self._lock:
+            self._misses += 1
+            self._results[key] = result
+            if len(self._results) > self._max_size:
+                self._results.popitem(last=False)
+                self._evictions += 1
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """
+        returns the hit/miss/eviction statistics of the cache
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                max_size=self._max_size,
+                size=len(self._results),
+            )
+
+    def cache_clear(self) -> None:
+        """
+        removes all results from the cache and resets the statistics
+        """
+        with self._lock:
+            self._results.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
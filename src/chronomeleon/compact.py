@@ -0,0 +1,167 @@
+"""
+contains DatetimeArray, a compact column of mapped datetimes, and adapt_compact, which returns one.
+
+A list of millions of timezone-aware datetime objects takes roughly 60 bytes per value; a DatetimeArray stores the
+instants as one int64 array (8 bytes per value) plus a single timezone. The datetime objects are only created when a
+single value is accessed.
+This module requires numpy (install chronomeleon[numpy]).
+"""
+
+from datetime import datetime, timedelta
+from datetime import timezone as fixed_offset_timezone
+from datetime import tzinfo
+from typing import Any, Iterator, Optional, Sequence, Union, overload
+
+import numpy as np
+import numpy.typing as npt
+import pytz
+
+from chronomeleon.batch import (
+    NOT_A_TIME,
+    SourceValues,
+    check_arguments,
+    convert_source_values_to_utc,
+    convert_utc_values_to_target,
+    get_positions,
+    get_transition_arrays,
+)
+from chronomeleon.models.mapping_config import MappingConfig
+from chronomeleon.transition_index import from_microseconds, get_transition_index
+
+
+def _format_utc_offset(offset: int) -> str:
+    """
+    returns the UTC offset (in microseconds) as datetime.isoformat appends it, e.g. '+01:00'
+    """
+    return datetime(2000, 1, 1, tzinfo=fixed_offset_timezone(timedelta(microseconds=offset))).isoformat()[19:]
+
+
+class DatetimeArray(Sequence[Optional[datetime]]):
+    """
+    A compact, read-only column of datetimes: the values are stored as int64 microseconds since epoch, which are UTC
+    instants in the given timezone or, if the timezone is None, naive wall clock values. NaT (the smallest int64) is a
+    missing value (None on access).
+    Accessing a value returns the same datetime as adapt_to_target (with the same tzinfo and fold).
+    """
+
+    __slots__ = ("_values", "_timezone")
+
+    def __init__(self, values: npt.NDArray[np.int64], timezone: Optional[tzinfo]):
+        if values.dtype != np.int64 or values.ndim != 1:
+            raise ValueError(f"values must be a one-dimensional int64 array but has dtype {values.dtype}")
+        self._values = values.view()
+        self._values.flags.writeable = False  # the array, its views and its buffer are read-only
+        self._timezone = timezone
+
+    @property
+    def values(self) -> npt.NDArray[np.int64]:
+        """
+        the underlying int64 array (a read-only view, not a copy)
+        """
+        return self._values
+
+    @property
+    def timezone(self) -> Optional[tzinfo]:
+        """
+        the timezone of all values or None, if they're naive
+        """
+        return self._timezone
+
+    @property
+    def nbytes(self) -> int:
+        """
+        the number of bytes of the underlying array
+        """
+        return self._values.nbytes
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _materialize(self, value: int) -> Optional[datetime]:
+        if value == NOT_A_TIME:
+            return None
+        if self._timezone is None:
+            return from_microseconds(value)
+        return get_transition_index(self._timezone).to_aware_datetime(value)
+
+    @overload
+    def __getitem__(self, index: int) -> Optional[datetime]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "DatetimeArray": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Optional[datetime], "DatetimeArray"]:
+        if isinstance(index, slice):
+            return DatetimeArray(self._values[index], self._timezone)  # a view, not a copy
+        return self._materialize(int(self._values[index]))
+
+    def __iter__(self) -> Iterator[Optional[datetime]]:
+        for value in self._values.tolist():
+            yield self._materialize(value)
+
+    def __repr__(self) -> str:
+        return f"DatetimeArray(length={len(self)}, timezone={self._timezone})"
+
+    def to_numpy(self, wall_clock: bool = False) -> npt.NDArray[np.datetime64]:
+        """
+        Returns the values as a datetime64[us] array: the UTC instants or, if wall_clock is True, the wall clock values
+        in the timezone (just like adapt_many returns them). The values are only copied for wall clock values in a
+        timezone; otherwise the result is a read-only view of the values (naive values are their own wall clock values).
+        """
+        if not wall_clock or self._timezone is None:
+            return self._values.view("datetime64[us]")
+        return self._get_wall_clock_values().view("datetime64[us]")
+
+    def __array__(self, dtype: Any = None, copy: Optional[bool] = None) -> npt.NDArray[Any]:
+        result = self.to_numpy()
+        if dtype is not None:
+            return result.astype(dtype)
+        return result.copy() if copy else result
+
+    def __buffer__(self, flags: int) -> memoryview:  # pylint:disable=unused-argument
+        # the buffer protocol for Python classes (PEP 688) works with Python 3.12 and later; use values otherwise
+        return self._values.data
+
+    def _get_utc_offsets(self) -> npt.NDArray[np.int64]:
+        assert self._timezone is not None
+        transitions, offsets, _ = get_transition_arrays(self._timezone)
+        return offsets[get_positions(transitions, self._values)]
+
+    def _get_wall_clock_values(self) -> npt.NDArray[np.int64]:
+        is_missing = self._values == NOT_A_TIME
+        return np.where(is_missing, NOT_A_TIME, self._values + np.where(is_missing, 0, self._get_utc_offsets()))
+
+    def isoformat(self, sep: str = "T", na_rep: str = "") -> list[str]:
+        """
+        returns the ISO 8601 strings of all values, the same as datetime.isoformat(sep) for each one (NaT is na_rep),
+        but without creating any datetime objects
+        """
+        local_values = self._values if self._timezone is None else self._get_wall_clock_values()
+        is_missing = local_values == NOT_A_TIME
+        local_values = np.where(is_missing, 0, local_values)
+        strings = np.datetime_as_string(local_values.view("datetime64[us]"), unit="s").astype(object)
+        if sep != "T":
+            strings = np.char.replace(strings.astype(str), "T", sep).astype(object)
+        microseconds = local_values % 1_000_000
+        has_microseconds = microseconds != 0
+        if has_microseconds.any():
+            strings[has_microseconds] += np.char.mod(".%06d", microseconds[has_microseconds]).astype(object)
+        if self._timezone is not None:
+            offsets = self._get_utc_offsets()
+            for offset in np.unique(offsets).tolist():
+                strings[offsets == offset] += _format_utc_offset(offset)
+        strings[is_missing] = na_rep
+        return strings.tolist()  # type: ignore[no-any-return]
+
+
+def adapt_compact(source_values: SourceValues, config: MappingConfig) -> DatetimeArray:
+    """
+    Maps all the source values just like adapt_many, but returns a DatetimeArray in the implicit_timezone of the target
+    (or UTC). Its values are the same as adapt_to_target returns for each single value.
+    """
+    check_arguments(source_values, config)
+    utc_values = convert_source_values_to_utc(source_values, config)
+    values = convert_utc_values_to_target(utc_values, config, to_wall_clock=False)
+    if config.target.is_date_only:
+        return DatetimeArray(values, None)  # naive midnights, just like adapt_to_target returns them
+    return DatetimeArray(values, config.target.implicit_timezone or pytz.utc)
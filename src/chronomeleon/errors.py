@@ -0,0 +1,64 @@
+"""
+contains the exceptions raised by chronomeleon (in addition to the plain ValueErrors for invalid input) and the kinds
+of errors which the bulk validation (see chronomeleon.validation) reports instead of raising
+"""
+
+from enum import Enum
+
+
+class ConversionError(ValueError):
+    """
+    raised if mapping a single value of a (large) sequence, column or file fails.
+    It knows the index of the row that failed, so that failures in large jobs are still debuggable.
+    """
+
+    def __init__(self, row_index: int, message: str):
+        super().__init__(f"row {row_index}: {message}")
+        self.row_index = row_index
+        """
+        the (0-based) index of the failing value in the input sequence (or of the data row in the input file)
+        """
+        self.message = message
+        """
+        the error message without the row index
+        """
+
+    def __reduce__(self) -> tuple[type["ConversionError"], tuple[int, str]]:
+        # the exception has to survive being pickled, e.g. when it's raised in a worker process
+        return self.__class__, (self.row_index, self.message)
+
+
+class ErrorKind(Enum):
+    """
+    the reasons why a single source value cannot be mapped
+    """
+
+    MISSING = "missing"
+    """
+    the value is None (or NaT)
+    """
+
+    INVALID_TYPE = "invalid_type"
+    """
+    the value is neither a date nor a datetime, e.g. a string
+    """
+
+    NAIVE_WITHOUT_TIMEZONE = "naive_without_timezone"
+    """
+    the value is naive, but the source has no implicit_timezone
+    """
+
+    AMBIGUOUS = "ambiguous"
+    """
+    the naive value is ambiguous in the implicit_timezone of the source, which has implicit_is_dst=None
+    """
+
+    NON_EXISTENT = "non_existent"
+    """
+    the naive value does not exist in the implicit_timezone of the source, which has implicit_is_dst=None
+    """
+
+    OUT_OF_RANGE = "out_of_range"
+    """
+    the value (or the result of one of the steps) is outside the range of datetime
+    """
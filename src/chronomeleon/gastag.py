@@ -0,0 +1,114 @@
+"""
+contains the lookup table of German civil midnights and Gastag starts (6:00 am German local time).
+
+The Gastag logic used to convert every gas value to Europe/Berlin, compare its local time and re-localize it.
+The table precomputes the UTC instants of the civil midnight and the Gastag start of every day once, so that shifting
+a column of values between midnight and Gastag start becomes an array lookup (see chronomeleon.batch).
+Single values only need the midnight and the Gastag start of their own day; they are computed on first use and cached
+per day, so that short-lived processes don't pay for building the whole table.
+All values are integers: microseconds since 1970-01-01T00:00:00Z.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+
+import pytz
+
+from chronomeleon import instrumentation
+from chronomeleon.transition_index import MICROSECONDS_PER_DAY, MICROSECONDS_PER_HOUR, get_transition_index
+
+
+@lru_cache(maxsize=1)
+def get_berlin() -> pytz.BaseTzInfo:
+    """
+    returns the German timezone; it is loaded on first use, so that importing chronomeleon does not read the tz database
+    """
+    return pytz.timezone("Europe/Berlin")
+
+
+_SIX_HOURS = 6 * MICROSECONDS_PER_HOUR
+
+FIRST_DAY = date(1970, 1, 1)
+"""
+the first day which is covered by the Gastag table
+"""
+LAST_DAY = date(2100, 12, 31)
+"""
+the last day which is covered by the Gastag table
+"""
+
+
+@dataclass(frozen=True, kw_only=True)
+class GastagTable:
+    """
+    The UTC instants of the German civil midnight and of the Gastag start of each day.
+    The German midnight is always on the previous UTC day (22:00 or 23:00 UTC) and the Gastag start is always on the
+    same UTC day (4:00 or 5:00 UTC). Hence, the UTC day of a value is enough to find the only candidate it may match.
+    """
+
+    first_day_number: int
+    """
+    the number of the first day (days since 1970-01-01)
+    """
+
+    midnights: tuple[int, ...]
+    """
+    the UTC instant of the German civil midnight at the start of the respective day
+    """
+
+    gastag_starts: tuple[int, ...]
+    """
+    the UTC instant of 6:00 am German local time on the respective day
+    """
+
+
+@lru_cache(maxsize=1)
+def get_gastag_table() -> GastagTable:
+    """
+    returns the Gastag table; it is built on first use
+    """
+    berlin_index = get_transition_index(get_berlin())
+    first_day_number = (FIRST_DAY - date(1970, 1, 1)).days
+    day_numbers = range(first_day_number, (LAST_DAY - date(1970, 1, 1)).days + 2)  # +1 day for the last midnight
+    return GastagTable(
+        first_day_number=first_day_number,
+        midnights=tuple(berlin_index.local_to_utc(d * MICROSECONDS_PER_DAY) for d in day_numbers),
+        gastag_starts=tuple(berlin_index.local_to_utc(d * MICROSECONDS_PER_DAY + _SIX_HOURS) for d in day_numbers),
+    )
+
+
+@lru_cache(maxsize=65_536)
+def _get_midnight_and_gastag_start(day_number: int) -> tuple[int, int]:
+    """
+    returns the UTC instants of the German civil midnight and of the Gastag start of the day (days since 1970-01-01)
+    """
+    berlin_index = get_transition_index(get_berlin())
+    local_midnight = day_number * MICROSECONDS_PER_DAY
+    return berlin_index.local_to_utc(local_midnight), berlin_index.local_to_utc(local_midnight + _SIX_HOURS)
+
+
+def shift_gastag_start_to_midnight(utc_value: int) -> int:
+    """
+    If the value is the start of a Gastag (6:00 am German local time), returns the German midnight of the same day.
+    Otherwise, returns the value unchanged.
+    The Gastag does not always start 6h after midnight. It might also be 5h or 7h on DST transition days.
+    """
+    midnight, gastag_start = _get_midnight_and_gastag_start(utc_value // MICROSECONDS_PER_DAY)
+    if gastag_start == utc_value:
+        instrumentation.count_branch(instrumentation.GASTAG_START_TO_MIDNIGHT)
+        return midnight
+    return utc_value
+
+
+def shift_midnight_to_gastag_start(utc_value: int) -> int:
+    """
+    If the value is a German (civil) midnight, returns the start of the Gastag (6:00 am German local time) of the same
+    day. Otherwise, returns the value unchanged.
+    """
+    # the German midnight is on the previous UTC day
+    midnight, gastag_start = _get_midnight_and_gastag_start(utc_value // MICROSECONDS_PER_DAY + 1)
+    if midnight == utc_value:
+        instrumentation.count_branch(instrumentation.MIDNIGHT_TO_GASTAG_START)
+        return gastag_start
+    return utc_value
@@ -0,0 +1,119 @@
+"""
+contains the opt-in instrumentation of adapt_to_target (and of conversion plans).
+
+While recording is active (see the context manager 'recording'), the number of calls and the cumulative time of
+* the validation (i.e. getting the compiled and validated plan of the configuration),
+* step 1 (converting the source value to an aware UTC datetime) and
+* step 2 (converting the aware UTC datetime to the target)
+are recorded, as well as how often the Gastag shifts and the resolution of ambiguous or non-existent local times fire.
+While recording is inactive, the only overhead is checking that there's no active recorder.
+The vectorized functions (e.g. adapt_many) are not instrumented.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+VALIDATION = "validation"
+SOURCE_CONVERSION = "source_conversion"
+TARGET_CONVERSION = "target_conversion"
+
+GASTAG_START_TO_MIDNIGHT = "gastag_start_to_midnight"
+MIDNIGHT_TO_GASTAG_START = "midnight_to_gastag_start"
+AMBIGUOUS_LOCAL_TIME = "ambiguous_local_time"
+NON_EXISTENT_LOCAL_TIME = "non_existent_local_time"
+
+
+@dataclass(kw_only=True)
+class StepStatistics:
+    """
+    the number of calls and the cumulative time of one step
+    """
+
+    calls: int = 0
+    """
+    how often the step has been run
+    """
+    seconds: float = 0.0
+    """
+    the total time spent in the step
+    """
+
+    @property
+    def nanoseconds_per_call(self) -> float:
+        """
+        the average time per call in nanoseconds
+        """
+        return self.seconds * 1e9 / self.calls if self.calls else 0.0
+
+
+@dataclass(kw_only=True)
+class Recorder:
+    """
+    collects the statistics while recording is active
+    """
+
+    steps: dict[str, StepStatistics] = field(default_factory=dict)
+    """
+    the statistics per step (VALIDATION, SOURCE_CONVERSION, TARGET_CONVERSION)
+    """
+    branches: Counter[str] = field(default_factory=Counter)
+    """
+    how often each branch fired (GASTAG_START_TO_MIDNIGHT, MIDNIGHT_TO_GASTAG_START, AMBIGUOUS_LOCAL_TIME,
+    NON_EXISTENT_LOCAL_TIME)
+    """
+
+    def add_step(self, step: str, seconds: float) -> None:
+        """
+        records one call of the step
+        """
+        statistics = self.steps.get(step)
+        if statistics is None:
+            statistics = self.steps[step] = StepStatistics()
+        statistics.calls += 1
+        statistics.seconds += seconds
+
+    def report(self) -> str:
+        """
+        returns a human readable summary of the statistics
+        """
+        lines = [
+            f"{step}: {s.calls} calls, {s.seconds:.3f}s ({s.nanoseconds_per_call:.0f} ns/call)"
+            for step, s in self.steps.items()
+        ]
+        lines.extend(f"{branch}: {count} times" for branch, count in sorted(self.branches.items()))
+        return "\n".join(lines)
+
+
+active_recorder: Optional[Recorder] = None  # pylint:disable=invalid-name
+"""
+the recorder of the ongoing recording (if any); use the context manager 'recording' instead of setting it directly
+"""
+
+
+@contextmanager
+def recording() -> Iterator[Recorder]:
+    """
+    Records the statistics of all conversions within the with block (in this process, across all threads):
+
+        with recording() as recorder:
+            adapt_to_target(source_value, config)
+        print(recorder.report())
+    """
+    global active_recorder  # pylint:disable=global-statement
+    previous_recorder = active_recorder
+    recorder = Recorder()
+    active_recorder = recorder
+    try:
+        yield recorder
+    finally:
+        active_recorder = previous_recorder
+
+
+def count_branch(branch: str) -> None:
+    """
+    counts that the branch fired, if recording is active
+    """
+    if active_recorder is not None:
+        active_recorder.branches[branch] += 1
@@ -0,0 +1,190 @@
+"""
+contains interval-set operations (overlaps, gaps, merges and coverage) on ranges per key, e.g. the contract periods
+per Marktlokation.
+
+The ranges are converted to the canonical representation of chronomeleon once: UTC instants as microseconds since
+epoch with an exclusive end. Then, e.g. [2024-01-01, 2024-02-01) and [2024-02-01, 2024-03-01) touch but don't overlap
+and there's no gap in between, regardless of whether the source had inclusive or exclusive ends.
+All operations sort the ranges by key and start once (O(n log n)) and then sweep them in vectorized passes.
+The results can be mapped to any target system with a RangeMappingConfig (see Intervals.to_target).
+This module requires numpy (install chronomeleon[numpy]).
+"""
+
+from dataclasses import dataclass
+from typing import Any, Sequence, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from chronomeleon.batch import SourceValues, convert_source_values_to_utc, convert_utc_values_to_target
+from chronomeleon.errors import ConversionError
+from chronomeleon.mapping import check_config
+from chronomeleon.models.range_mapping_config import RangeMappingConfig
+
+Keys = Union[npt.NDArray[Any], Sequence[Any]]
+"""
+the key of each range (e.g. the ID of the Marktlokation); all keys must be comparable with each other
+"""
+
+
+@dataclass(frozen=True, kw_only=True)
+class Intervals:
+    """
+    ranges per key in the canonical representation, sorted by key and start
+    """
+
+    keys: npt.NDArray[Any]
+    """
+    the key of each range
+    """
+
+    starts: npt.NDArray[np.int64]
+    """
+    the (inclusive) starts as UTC microseconds since epoch
+    """
+
+    ends: npt.NDArray[np.int64]
+    """
+    the exclusive ends as UTC microseconds since epoch
+    """
+
+    row_indices: npt.NDArray[np.intp]
+    """
+    the index of the source row of each range (for overlaps: the later of both rows; for merges: the first row)
+    """
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def to_target(
+        self, config: RangeMappingConfig
+    ) -> tuple[npt.NDArray[Any], npt.NDArray[np.datetime64], npt.NDArray[np.datetime64]]:
+        """
+        Maps the ranges to the target of the config (only its target and is_gas matter) and returns the keys, starts
+        and ends just like chronomeleon.batch.adapt_ranges returns them.
+        """
+        check_config(config)
+        return (
+            self.keys,
+            convert_utc_values_to_target(self.starts, config.start_config).astype("datetime64[us]"),
+            convert_utc_values_to_target(self.ends, config.end_config).astype("datetime64[us]"),
+        )
+
+
+def _sort(keys: npt.NDArray[Any], starts: npt.NDArray[np.int64], ends: npt.NDArray[np.int64]) -> Intervals:
+    order = np.lexsort((ends, starts, keys))
+    return Intervals(keys=keys[order], starts=starts[order], ends=ends[order], row_indices=order)
+
+
+def to_intervals(keys: Keys, starts: SourceValues, ends: SourceValues, config: RangeMappingConfig) -> Intervals:
+    """
+    Converts the ranges (start and end per key) of the source of the config to the canonical representation and sorts
+    them by key and start. The types of the starts and ends are the same as for adapt_ranges.
+    Raises a ConversionError with the index of the first range, whose start is not before its (exclusive) end.
+    """
+    if keys is None or starts is None or ends is None:
+        raise ValueError("keys, starts and ends must not be None")
+    if not len(keys) == len(starts) == len(ends):
+        lengths = f"{len(keys)}, {len(starts)} and {len(ends)}"
+        raise ValueError(f"keys, starts and ends must have the same length but have {lengths}")
+    check_config(config)
+    utc_starts = convert_source_values_to_utc(starts, config.start_config)
+    utc_ends = convert_source_values_to_utc(ends, config.end_config)
+    invalid_positions = np.flatnonzero(utc_starts >= utc_ends)
+    if len(invalid_positions) > 0:
+        row_index = int(invalid_positions[0])
+        raise ConversionError(row_index, f"the start {starts[row_index]} must be before the end {ends[row_index]}")
+    key_array = np.asarray(keys)
+    if key_array.ndim != 1:
+        raise ValueError("keys must be scalars (e.g. strings or integers), not tuples or arrays")
+    return _sort(key_array, utc_starts, utc_ends)
+
+
+def _is_first_of_key(keys: npt.NDArray[Any]) -> npt.NDArray[np.bool_]:
+    is_first = np.ones(len(keys), dtype=np.bool_)
+    is_first[1:] = keys[1:] != keys[:-1]
+    return is_first
+
+
+def _get_previous_max_ends(intervals: Intervals) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.intp]]:
+    """
+    Returns the latest end of all previous ranges with the same key (the smallest int64, if there are none) and the
+    position of the range with that end for each range. This is the sweep line: Each range overlaps a previous one
+    if and only if it starts before the latest previous end.
+    """
+    count = len(intervals)
+    if count == 0:
+        return intervals.ends.copy(), np.zeros(0, dtype=np.intp)
+    is_first = _is_first_of_key(intervals.keys)
+    group_ids = np.cumsum(is_first) - 1
+    # The unique ranks of the ends are smaller than count. Adding group_id * count makes all values of a key larger
+    # than all values of the previous keys, so the running maximum restarts with each key.
+    order = np.argsort(intervals.ends, kind="stable")
+    ranks = np.empty(count, dtype=np.int64)
+    ranks[order] = np.arange(count)
+    running_max = np.maximum.accumulate(group_ids * count + ranks)
+    positions = np.empty(count, dtype=np.intp)
+    positions[1:] = order[running_max[:-1] - group_ids[1:] * count]
+    positions[0] = 0
+    previous_max_ends = np.where(is_first, np.iinfo(np.int64).min, intervals.ends[positions])
+    return previous_max_ends, positions
+
+
+def find_overlaps(intervals: Intervals) -> tuple[Intervals, npt.NDArray[np.intp]]:
+    """
+    Returns the overlapping parts of ranges with the same key and, for each overlap, the index of the source row of
+    the earlier range (the row_indices of the overlaps are the rows of the later ranges).
+    If a range overlaps several earlier ones, the overlap with the one that ends last is reported.
+    """
+    previous_max_ends, positions = _get_previous_max_ends(intervals)
+    is_overlap = intervals.starts < previous_max_ends
+    overlaps = Intervals(
+        keys=intervals.keys[is_overlap],
+        starts=intervals.starts[is_overlap],
+        ends=np.minimum(intervals.ends, previous_max_ends)[is_overlap],
+        row_indices=intervals.row_indices[is_overlap],
+    )
+    return overlaps, intervals.row_indices[positions[is_overlap]]
+
+
+def find_gaps(intervals: Intervals) -> Intervals:
+    """
+    Returns the gaps between the ranges with the same key (the row_indices are the rows of the ranges after the gaps).
+    Ranges which touch (the end of one is the start of the next) have no gap in between.
+    """
+    previous_max_ends, _ = _get_previous_max_ends(intervals)
+    is_after_gap = ~_is_first_of_key(intervals.keys) & (intervals.starts > previous_max_ends)
+    return Intervals(
+        keys=intervals.keys[is_after_gap],
+        starts=previous_max_ends[is_after_gap],
+        ends=intervals.starts[is_after_gap],
+        row_indices=intervals.row_indices[is_after_gap],
+    )
+
+
+def merge_intervals(intervals: Intervals) -> Intervals:
+    """
+    Returns the union of the ranges per key: Overlapping and touching ranges are merged into one.
+    """
+    if len(intervals) == 0:
+        return intervals
+    previous_max_ends, _ = _get_previous_max_ends(intervals)
+    merged_starts = np.flatnonzero(_is_first_of_key(intervals.keys) | (intervals.starts > previous_max_ends))
+    return Intervals(
+        keys=intervals.keys[merged_starts],
+        starts=intervals.starts[merged_starts],
+        ends=np.maximum.reduceat(intervals.ends, merged_starts),
+        row_indices=intervals.row_indices[merged_starts],
+    )
+
+
+def get_coverage(intervals: Intervals) -> tuple[npt.NDArray[Any], npt.NDArray[np.timedelta64]]:
+    """
+    Returns the unique keys and the total duration which the ranges of each key cover (overlaps count only once).
+    """
+    merged = merge_intervals(intervals)
+    if len(merged) == 0:
+        return merged.keys, np.zeros(0, dtype="timedelta64[us]")
+    first_positions = np.flatnonzero(_is_first_of_key(merged.keys))
+    durations = np.add.reduceat(merged.ends - merged.starts, first_positions)
+    return merged.keys[first_positions], durations.astype("timedelta64[us]")
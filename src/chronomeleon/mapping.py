@@ -2,15 +2,204 @@
 This a docstring for the module.
 """
 
-import datetime as dt_module
-from datetime import date, datetime, timedelta
-from typing import Union
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, tzinfo
+from enum import Enum
+from functools import lru_cache, partial
+from typing import Callable, Optional, Union
 
 import pytz
 
+from chronomeleon import gastag, instrumentation
 from chronomeleon.models.mapping_config import MappingConfig
+from chronomeleon.models.range_mapping_config import RangeMappingConfig
+from chronomeleon.transition_index import TransitionIndex, from_microseconds, get_transition_index, to_microseconds
 
-_berlin = pytz.timezone("Europe/Berlin")
+_ONE_DAY = timedelta(days=1)
+
+Step = Callable[[datetime], datetime]
+"""
+a single conversion step, which maps a datetime to another datetime
+"""
+
+
+def _to_datetime(source_value: Union[date, datetime]) -> datetime:
+    if isinstance(source_value, datetime):
+        return source_value
+    if isinstance(source_value, date):
+        return datetime.combine(source_value, datetime.min.time())
+    raise ValueError(f"source_value must be a date or datetime object but is {source_value.__class__.__name__}")
+
+
+def _to_exclusive_end_datetime(source_value: Union[date, datetime], resolution: timedelta) -> datetime:
+    if isinstance(source_value, datetime):
+        if source_value.utcoffset() is not None:
+            # Adding to an aware datetime is wall clock arithmetic, which would lose the fold (PEP 495) of repeated
+            # wall clock times. The resolution is a duration, so we add it to the UTC instant instead.
+            return source_value.astimezone(pytz.utc) + resolution
+        return source_value + resolution
+    if isinstance(source_value, date):
+        return datetime.combine(source_value + _ONE_DAY, datetime.min.time())
+    raise ValueError(f"source_value must be a date or datetime object but is {source_value.__class__.__name__}")
+
+
+def _localize(value: datetime, implicit_timezone: tzinfo, is_dst: Optional[bool]) -> datetime:
+    """
+    returns the naive value localized in the implicit timezone (as UTC datetime); aware values are returned as they are
+    """
+    if value.tzinfo is None:
+        utc_value = get_transition_index(implicit_timezone).local_to_utc(to_microseconds(value), is_dst)
+        return from_microseconds(utc_value).replace(tzinfo=pytz.utc)
+    return value
+
+
+def _localize_with_fixed_offset(value: datetime, offset: timedelta) -> datetime:
+    """
+    the fast path of _localize for timezones with a fixed UTC offset (e.g. UTC or a datetime.timezone)
+    """
+    if value.tzinfo is None:
+        return (value - offset).replace(tzinfo=pytz.utc)
+    return value
+
+
+def _ensure_aware(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        # pylint:disable=line-too-long
+        raise ValueError(
+            "source_value must be timezone-aware or implicit_timezone must be set in the mapping configuration"
+        )
+    return value
+
+
+def _to_utc(value: datetime) -> datetime:
+    return value.astimezone(pytz.utc)
+
+
+def _to_utc_microseconds(value: datetime) -> int:
+    return to_microseconds(value.replace(tzinfo=None) - value.utcoffset())  # type: ignore[operator]
+
+
+def _shift_gastag_start_to_midnight(value: datetime) -> datetime:
+    utc_value = _to_utc_microseconds(value)
+    shifted_utc_value = gastag.shift_gastag_start_to_midnight(utc_value)
+    if shifted_utc_value != utc_value:
+        return from_microseconds(shifted_utc_value).replace(tzinfo=pytz.utc)
+    return value
+
+
+def _shift_midnight_to_gastag_start(value: datetime) -> datetime:
+    utc_value = _to_utc_microseconds(value)
+    shifted_utc_value = gastag.shift_midnight_to_gastag_start(utc_value)
+    if shifted_utc_value != utc_value:
+        return from_microseconds(shifted_utc_value).replace(tzinfo=pytz.utc)
+    return value
+
+
+def _to_inclusive_end(value: datetime, resolution: timedelta) -> datetime:
+    # converts the exclusive end to an inclusive end
+    # and e.g. 2024-01-02 00:00:00 to 2024-01-01 23:59:59 if the resolution is timedelta(seconds=1)
+    # Work because the original value is - if it is an end - always an exclusive end.
+    return value - resolution
+
+
+def _to_exclusive_end(value: datetime, resolution: timedelta) -> datetime:
+    # the inverse of _to_inclusive_end
+    return value + resolution
+
+
+def _to_naive_inclusive_end(value: datetime, resolution: timedelta) -> datetime:
+    # the inverse of _to_exclusive_end_datetime, which adds the resolution to the naive wall clock value
+    return value.replace(tzinfo=None) - resolution
+
+
+def _to_timezone(value: datetime, timezone: tzinfo) -> datetime:
+    """
+    same as value.astimezone(timezone) for the aware value
+    """
+    utc_value = to_microseconds(value.replace(tzinfo=None) - value.utcoffset())  # type: ignore[operator]
+    return get_transition_index(timezone).to_aware_datetime(utc_value)
+
+
+def _to_fixed_offset_timezone(value: datetime, timezone: tzinfo) -> datetime:
+    """
+    the fast path of _to_timezone for timezones with a fixed UTC offset (e.g. UTC or a datetime.timezone)
+    """
+    return value.astimezone(timezone)
+
+
+def _get_fixed_offset(timezone: tzinfo) -> Optional[timedelta]:
+    """
+    returns the UTC offset of the timezone, if it never changes (and None otherwise)
+    """
+    index = get_transition_index(timezone)
+    if len(index.offsets) == 1:
+        return timedelta(microseconds=index.offsets[0])
+    return None
+
+
+def _truncate_to_date(value: datetime) -> datetime:
+    return datetime.combine(value.date(), datetime.min.time())
+
+
+def _get_to_datetime(config: MappingConfig) -> Callable[[Union[date, datetime]], datetime]:
+    """
+    returns the function which converts a source date or datetime to a (possibly naive) datetime, that is an
+    exclusive end regardless of whether the source was configured as an inclusive or exclusive end.
+    """
+    if config.is_end and config.source.is_inclusive_end:
+        assert config.source.resolution is not None  # ensured by the consistency check
+        return partial(_to_exclusive_end_datetime, resolution=config.source.resolution)
+    return _to_datetime
+
+
+def _get_localize_step(timezone: Optional[tzinfo], is_dst: Optional[bool]) -> Step:
+    """
+    returns the step which localizes naive datetimes in the (implicit) timezone; without timezone they're rejected
+    """
+    if timezone is None:
+        return _ensure_aware
+    fixed_offset = _get_fixed_offset(timezone)
+    if fixed_offset is not None:
+        return partial(_localize_with_fixed_offset, offset=fixed_offset)
+    return partial(_localize, implicit_timezone=timezone, is_dst=is_dst)
+
+
+def _get_source_steps(config: MappingConfig) -> tuple[Step, ...]:
+    """
+    returns the steps which convert the result of _get_to_datetime to an aware (exclusive) UTC datetime
+    """
+    steps: list[Step] = [_get_localize_step(config.source.implicit_timezone, config.source.implicit_is_dst), _to_utc]
+    if config.source.is_gastag_aware and config.is_gas:
+        steps.append(_shift_gastag_start_to_midnight)
+    return tuple(steps)
+
+
+def _get_target_steps(config: MappingConfig) -> tuple[Step, ...]:
+    """
+    returns the steps which convert an aware (exclusive) UTC datetime to a datetime compatible with the target system
+    """
+    steps: list[Step] = []
+    if config.target.is_gastag_aware and config.is_gas:
+        steps.append(_shift_midnight_to_gastag_start)
+    if config.is_end and config.target.is_inclusive_end:
+        assert config.target.resolution is not None  # ensured by the consistency check
+        steps.append(partial(_to_inclusive_end, resolution=config.target.resolution))
+    steps.extend(_get_to_timezone_steps(config.target.implicit_timezone))
+    if config.target.is_date_only:
+        steps.append(_truncate_to_date)
+    return tuple(steps)
+
+
+def _get_to_timezone_steps(timezone: Optional[tzinfo]) -> tuple[Step, ...]:
+    """
+    returns the step which converts an aware datetime to the (implicit) timezone of the target (if any)
+    """
+    if timezone is None:
+        return ()
+    if _get_fixed_offset(timezone) is not None:
+        return (partial(_to_fixed_offset_timezone, timezone=timezone),)
+    return (partial(_to_timezone, timezone=timezone),)
 
 
 def _convert_source_date_or_datetime_to_aware_datetime(
@@ -20,37 +209,9 @@ def _convert_source_date_or_datetime_to_aware_datetime(
     returns a datetime object which is aware of the timezone (i.e. not naive) and is an exclusive end
     regardless of whether the source was configured as an inclusive or exclusive end.
     """
-    source_value_datetime: datetime  # a non-naive datetime (exclusive, if end)
-    if isinstance(source_value, datetime):
-        source_value_datetime = source_value
-        if config.is_end and config.source.is_inclusive_end:
-            assert config.source.resolution is not None  # ensured by the consistency check
-            source_value_datetime += config.source.resolution
-    elif isinstance(source_value, date):
-        if config.is_end and config.source.is_inclusive_end:
-            source_value_datetime = datetime.combine(source_value + timedelta(days=1), datetime.min.time())
-        else:
-            source_value_datetime = datetime.combine(source_value, datetime.min.time())
-    else:
-        raise ValueError(f"source_value must be a date or datetime object but is {source_value.__class__.__name__}")
-    if source_value_datetime.tzinfo is None:
-        if config.source.implicit_timezone is not None:
-            source_value_datetime = config.source.implicit_timezone.localize(source_value_datetime)
-        else:
-            # pylint:disable=line-too-long
-            raise ValueError(
-                "source_value must be timezone-aware or implicit_timezone must be set in the mapping configuration"
-            )
-    source_value_datetime = source_value_datetime.astimezone(pytz.utc)
-    if config.source.is_gastag_aware and config.is_gas:
-        berlin_local_datetime = source_value_datetime.astimezone(_berlin)
-        if berlin_local_datetime.time() == dt_module.time(6, 0, 0):
-            berlin_local_datetime = berlin_local_datetime.replace(hour=0).replace(tzinfo=None)
-            # We need to re-localize the datetime, because the UTC offset might have changed
-            # The Gastag does not always start 6h after midnight.
-            # It might also be 5h or 7h on DST transition days.
-            berlin_local_datetime = _berlin.localize(berlin_local_datetime)
-            source_value_datetime = berlin_local_datetime.astimezone(pytz.utc)
+    source_value_datetime = _get_to_datetime(config)(source_value)
+    for step in _get_source_steps(config):
+        source_value_datetime = step(source_value_datetime)
     return source_value_datetime
 
 
@@ -61,27 +222,310 @@ def _convert_aware_datetime_to_target(value: datetime, config: MappingConfig) ->
     if value.tzinfo is None:
         raise ValueError("value must be timezone-aware at this point")
     target_value: datetime = value
-    if config.target.is_gastag_aware and config.is_gas:
-        _berlin_local_datetime = value.astimezone(_berlin)
-        if _berlin_local_datetime.time() == dt_module.time(0, 0, 0):
-            _berlin_local_datetime = _berlin_local_datetime.replace(hour=6).replace(tzinfo=None)
-            # We need to re-localize the datetime, because the UTC offset might have changed.
-            # The Gastag does not always start 6h after midnight.
-            # It might also be 5h or 7h on DST transition days.
-            _berlin_local_datetime = _berlin.localize(_berlin_local_datetime)
-            target_value = _berlin_local_datetime.astimezone(pytz.utc)
-    if config.is_end and config.target.is_inclusive_end:
-        assert config.target.resolution is not None  # ensured by the consistency check
-        target_value = target_value - config.target.resolution  # converts the exclusive end to an inclusive end
-        # and e.g. 2024-01-02 00:00:00 to 2024-01-01 23:59:59 if the resolution is timedelta(seconds=1)
-        # Work because the original value is - if it is an end - always an exclusive end.
-    if config.target.implicit_timezone is not None:
-        target_value = target_value.astimezone(config.target.implicit_timezone)
-    if config.target.is_date_only:
-        target_value = datetime.combine(target_value.date(), datetime.min.time())
+    for step in _get_target_steps(config):
+        target_value = step(target_value)
     return target_value
 
 
+class ConversionKind(Enum):
+    """
+    classifies how much work it takes to map a value with a configuration (see classify_config)
+    """
+
+    IDENTITY = "identity"
+    """
+    every value is mapped to the same instant in the same timezone (only naive values become aware)
+    """
+
+    OFFSET_SHIFT = "offset_shift"
+    """
+    the timezones differ, but both have a fixed UTC offset: naive values are shifted by a constant offset
+    """
+
+    RESOLUTION_SHIFT = "resolution_shift"
+    """
+    the timezone is the same, but the inclusive ends shift the values by (the difference of) the resolutions
+    """
+
+    GENERAL = "general"
+    """
+    all other configurations, e.g. with Gastag shifts, a date-only target or a change of a timezone with DST
+    """
+
+
+def _get_inclusive_end_resolution(config: MappingConfig, is_source: bool) -> Optional[timedelta]:
+    """
+    returns the resolution which is added to the source (or subtracted from the target) value, if it is an inclusive end
+    """
+    assumption = config.source if is_source else config.target
+    if config.is_end and assumption.is_inclusive_end:
+        return assumption.resolution
+    return None
+
+
+def _has_fixed_offset(timezone: Optional[tzinfo]) -> bool:
+    """
+    returns True if the timezone is UTC or another timezone without DST (no implicit timezone means UTC, too)
+    """
+    return timezone is None or _get_fixed_offset(timezone) is not None
+
+
+def _do_inclusive_end_shifts_cancel_out(config: MappingConfig) -> bool:
+    """
+    returns True if the inclusive end resolution, which is added to the source value, is subtracted from the target
+    value again. Equal resolutions are not sufficient: The resolution is added to the (naive) wall clock but subtracted
+    from the UTC instant, which differs around DST transitions; and dates are first shifted by one day.
+    """
+    source_resolution = _get_inclusive_end_resolution(config, is_source=True)
+    if source_resolution != _get_inclusive_end_resolution(config, is_source=False):
+        return False
+    if source_resolution is None or config.source.implicit_timezone is None:
+        return True  # no shifts at all or only aware source values, which are shifted in UTC
+    return _has_fixed_offset(config.source.implicit_timezone) and source_resolution == _ONE_DAY
+
+
+def classify_config(config: MappingConfig) -> ConversionKind:
+    """
+    classifies the (self-consistent) config by how much work it takes to map a value, e.g. to find out which of your
+    mappings are expensive. The plans of all but ConversionKind.GENERAL configs map the values in a single fused step.
+    """
+    source_timezone, target_timezone = config.source.implicit_timezone, config.target.implicit_timezone
+    if config.target.is_date_only or (
+        config.is_gas and (config.source.is_gastag_aware or config.target.is_gastag_aware)
+    ):
+        return ConversionKind.GENERAL
+    if not _do_inclusive_end_shifts_cancel_out(config):
+        return ConversionKind.RESOLUTION_SHIFT if source_timezone == target_timezone else ConversionKind.GENERAL
+    if source_timezone == target_timezone:
+        return ConversionKind.IDENTITY
+    if _has_fixed_offset(source_timezone) and _has_fixed_offset(target_timezone):
+        return ConversionKind.OFFSET_SHIFT
+    return ConversionKind.GENERAL
+
+
+def get_lossy_steps(config: MappingConfig) -> list[str]:
+    """
+    returns a list of messages, one for each step of the mapping which cannot be inverted for all values, i.e. some
+    values don't survive the round trip source -> target -> source (see compile_inverse). Non-existent local times in
+    the implicit timezone of the source are not listed; they cannot be restored either (see check_round_trip).
+    """
+    lossy_steps: list[str] = []
+    if config.target.is_date_only and not config.source.is_date_only:
+        lossy_steps.append("target: is_date_only truncates the time of day")
+    elif config.target.is_date_only and config.source.implicit_timezone != config.target.implicit_timezone:
+        lossy_steps.append("target: is_date_only truncates to dates in another timezone than the source's")
+    if (
+        config.target.is_date_only
+        and _get_inclusive_end_resolution(config, is_source=False) is not None
+        and not _has_fixed_offset(config.target.implicit_timezone)
+    ):
+        # the resolution is subtracted from the UTC instant, so two days around a DST transition map to the same date
+        lossy_steps.append("target: the inclusive end of dates is ambiguous around DST transitions")
+    if config.is_gas and (config.source.is_gastag_aware or config.target.is_gastag_aware):
+        lossy_steps.append("Gastag: midnights and the starts of the Gastag (6:00) are shifted to the same value")
+    return lossy_steps
+
+
+def _convert_with_fixed_offsets(
+    source_value: Union[date, datetime],
+    to_datetime: Callable[[Union[date, datetime]], datetime],
+    shift: Optional[timedelta],
+    resolution: timedelta,
+    timezone: tzinfo,
+) -> datetime:
+    """
+    the fast path of a plan if both timezones have a fixed UTC offset: naive values are shifted by the difference of
+    the offsets minus the target resolution of inclusive ends in a single addition (shift is None if there is no
+    implicit source timezone); aware values are converted to the target timezone directly
+    """
+    value = to_datetime(source_value)
+    if value.tzinfo is not None:
+        return value.astimezone(timezone) - resolution
+    if shift is None:
+        return _ensure_aware(value)  # raises
+    return (value + shift).replace(tzinfo=timezone)
+
+
+def _convert_with_transition_index(
+    source_value: Union[date, datetime],
+    to_datetime: Callable[[Union[date, datetime]], datetime],
+    index: TransitionIndex,
+    is_dst: Optional[bool],
+    resolution: int,
+) -> datetime:
+    """
+    the fast path of a plan if the source and target timezone are the same (with DST): naive values are localized and
+    the result is converted back to the timezone on the UTC microseconds, without any datetimes in between
+    """
+    value = to_datetime(source_value)
+    if value.tzinfo is None:
+        utc_value = index.local_to_utc(to_microseconds(value), is_dst)
+    else:
+        utc_value = _to_utc_microseconds(value)
+    return index.to_aware_datetime(utc_value - resolution)
+
+
+def _get_fast_path(
+    config: MappingConfig, kind: ConversionKind
+) -> Optional[Callable[[Union[date, datetime]], datetime]]:
+    """
+    returns the function which maps a source value in one go, if the config is not ConversionKind.GENERAL
+    """
+    if kind is ConversionKind.GENERAL:
+        return None
+    to_datetime = _get_to_datetime(config)
+    resolution = _get_inclusive_end_resolution(config, is_source=False) or timedelta(0)
+    source_timezone, target_timezone = config.source.implicit_timezone, config.target.implicit_timezone
+    if _has_fixed_offset(source_timezone) and _has_fixed_offset(target_timezone):
+        target_offset = timedelta(0) if target_timezone is None else _get_fixed_offset(target_timezone)
+        assert target_offset is not None  # ensured by _has_fixed_offset
+        shift: Optional[timedelta] = None
+        if source_timezone is not None:
+            shift = target_offset - _get_fixed_offset(source_timezone) - resolution  # type: ignore[operator]
+        return partial(
+            _convert_with_fixed_offsets,
+            to_datetime=to_datetime,
+            shift=shift,
+            resolution=resolution,
+            timezone=target_timezone or pytz.utc,
+        )
+    assert source_timezone is not None  # the same timezone (with DST) in source and target
+    return partial(
+        _convert_with_transition_index,
+        to_datetime=to_datetime,
+        index=get_transition_index(source_timezone),
+        is_dst=config.source.implicit_is_dst,
+        resolution=resolution // timedelta(microseconds=1),
+    )
+
+
+@dataclass(frozen=True, kw_only=True)
+class ConversionPlan:
+    """
+    A conversion plan is a mapping configuration that has been validated once and compiled to only those steps that
+    are necessary for this configuration. Calling the plan with a source value is equivalent to calling
+    adapt_to_target with the source value and the configuration, but it's faster, if you map many values.
+    Use compile_config (or MappingConfig.compile) to create a plan.
+    """
+
+    config: MappingConfig
+    """
+    the (self-consistent) mapping configuration from which the plan has been compiled
+    """
+
+    to_datetime: Callable[[Union[date, datetime]], datetime]
+    """
+    converts the source date or datetime to a datetime which is an exclusive end (if it is an end at all)
+    """
+
+    source_steps: tuple[Step, ...]
+    """
+    the steps which convert the result of to_datetime to an aware (exclusive) UTC datetime
+    """
+
+    target_steps: tuple[Step, ...]
+    """
+    the steps which convert the aware (exclusive) UTC datetime to a value compatible with the target system
+    """
+
+    kind: ConversionKind = ConversionKind.GENERAL
+    """
+    how much work it takes to map a value with this plan (see classify_config)
+    """
+
+    fast_path: Optional[Callable[[Union[date, datetime]], datetime]] = None
+    """
+    maps a source value in one go (with the same result as the steps), if the plan is not ConversionKind.GENERAL
+    """
+
+    def __call__(self, source_value: Union[date, datetime]) -> datetime:
+        """
+        maps the source value to a value compatible with the target system
+        """
+        if source_value is None:
+            raise ValueError("source_value must not be None")
+        if instrumentation.active_recorder is not None:
+            return self._call_instrumented(source_value, instrumentation.active_recorder)
+        if self.fast_path is not None:
+            return self.fast_path(source_value)
+        value = self.to_datetime(source_value)
+        for step in self.source_steps:
+            value = step(value)
+        for step in self.target_steps:
+            value = step(value)
+        return value
+
+    def _call_instrumented(self, source_value: Union[date, datetime], recorder: instrumentation.Recorder) -> datetime:
+        """
+        same as __call__, but records the time spent in both steps
+        """
+        start = time.perf_counter()
+        value = self.to_datetime(source_value)
+        for step in self.source_steps:
+            value = step(value)
+        middle = time.perf_counter()
+        recorder.add_step(instrumentation.SOURCE_CONVERSION, middle - start)
+        for step in self.target_steps:
+            value = step(value)
+        recorder.add_step(instrumentation.TARGET_CONVERSION, time.perf_counter() - middle)
+        return value
+
+    def to_utc(self, source_value: Union[date, datetime]) -> datetime:
+        """
+        maps the source value only to the aware (exclusive) UTC datetime, which all conversions have in common
+        """
+        if source_value is None:
+            raise ValueError("source_value must not be None")
+        value = self.to_datetime(source_value)
+        for step in self.source_steps:
+            value = step(value)
+        return value
+
+    def from_utc(self, value: datetime) -> datetime:
+        """
+        maps an aware (exclusive) UTC datetime, as returned by to_utc, to a value compatible with the target system
+        """
+        for step in self.target_steps:
+            value = step(value)
+        return value
+
+
+def check_config(config: Union[MappingConfig, RangeMappingConfig]) -> None:
+    """
+    raises a ValueError if the (range) mapping configuration is None or not self-consistent
+    """
+    if config is None:
+        raise ValueError("config must not be None")
+    if not config.is_self_consistent():
+        raise ValueError("config is not self-consistent: " + ", ".join(config.get_consistency_errors()))
+
+
+def compile_config(config: MappingConfig) -> ConversionPlan:
+    """
+    validates the mapping configuration once and returns a conversion plan that is specialized to the configuration.
+    Raises a ValueError if the configuration is not self-consistent.
+    """
+    check_config(config)
+    kind = classify_config(config)
+    return ConversionPlan(
+        config=config,
+        to_datetime=_get_to_datetime(config),
+        source_steps=_get_source_steps(config),
+        target_steps=_get_target_steps(config),
+        kind=kind,
+        fast_path=_get_fast_path(config, kind),
+    )
+
+
+@lru_cache(maxsize=256)
+def get_cached_plan(config: MappingConfig) -> ConversionPlan:
+    """
+    returns the conversion plan of the config just like compile_config, but each config is compiled only once (per
+    process), as long as it is one of the 256 most recently used ones. This is what adapt_to_target uses.
+    """
+    return compile_config(config)
+
+
 def adapt_to_target(source_value: Union[date, datetime], config: MappingConfig) -> datetime:
     """
     maps the source value to a value compatible with the target system by using the given mapping configuration
@@ -90,13 +534,224 @@ def adapt_to_target(source_value: Union[date, datetime], config: MappingConfig)
         raise ValueError("source_value must not be None")
     if config is None:
         raise ValueError("config must not be None")
-    if not config.is_self_consistent():
-        raise ValueError("config is not self-consistent: " + ", ".join(config.get_consistency_errors()))
     # there are just 2 steps:
     # 1. convert the source from whatever it is to something unified with what we can work
     # 2. convert the unified source to the target (which might be just as obscure as the source)
-    source_value_datetime = _convert_source_date_or_datetime_to_aware_datetime(source_value, config)  # step 1
-    assert source_value_datetime.tzinfo is not None
-    assert source_value_datetime.tzinfo == pytz.utc
-    target_value = _convert_aware_datetime_to_target(source_value_datetime, config)  # step 2
-    return target_value
+    # Both are part of the plan, which we compile (and validate) only once per configuration.
+    recorder = instrumentation.active_recorder
+    if recorder is None:
+        return get_cached_plan(config)(source_value)
+    start = time.perf_counter()
+    plan = get_cached_plan(config)
+    recorder.add_step(instrumentation.VALIDATION, time.perf_counter() - start)
+    return plan(source_value)
+
+
+@dataclass(frozen=True, kw_only=True)
+class RangeConversionPlan:
+    """
+    the conversion plans for the start and the end of a range, compiled from one RangeMappingConfig.
+    Use compile_range_config (or RangeMappingConfig.compile) to create a plan.
+    """
+
+    config: RangeMappingConfig
+    """
+    the (self-consistent) range mapping configuration from which the plan has been compiled
+    """
+
+    start_plan: ConversionPlan
+    """
+    the plan which maps the start of the range
+    """
+
+    end_plan: ConversionPlan
+    """
+    the plan which maps the end of the range
+    """
+
+    def __call__(
+        self, start: Union[date, datetime], end: Union[date, datetime], validate_order: bool = False
+    ) -> tuple[datetime, datetime]:
+        """
+        maps the start and the end of the range to values compatible with the target system.
+        If validate_order is True, a ValueError is raised unless the start is before the (exclusive) end.
+        """
+        utc_start = self.start_plan.to_utc(start)
+        utc_end = self.end_plan.to_utc(end)
+        if validate_order and not utc_start < utc_end:
+            raise ValueError(f"the start {start} must be before the end {end}")
+        return self.start_plan.from_utc(utc_start), self.end_plan.from_utc(utc_end)
+
+
+def compile_range_config(config: RangeMappingConfig) -> RangeConversionPlan:
+    """
+    validates the range mapping configuration once and returns the conversion plans for its start and end.
+    Raises a ValueError if the configuration is not self-consistent.
+    """
+    check_config(config)
+    return RangeConversionPlan(
+        config=config, start_plan=compile_config(config.start_config), end_plan=compile_config(config.end_config)
+    )
+
+
+def _get_inverse_source_steps(config: MappingConfig) -> tuple[Step, ...]:
+    """
+    returns the steps which convert a target value (as datetime) back to the aware (exclusive) UTC datetime; naive
+    values (the dates of date-only targets) are in the implicit timezone of the target or UTC
+    """
+    steps: list[Step] = [
+        _get_localize_step(config.target.implicit_timezone or pytz.utc, config.target.implicit_is_dst),
+        _to_utc,
+    ]
+    if config.is_end and config.target.is_inclusive_end:
+        assert config.target.resolution is not None  # ensured by the consistency check
+        steps.append(partial(_to_exclusive_end, resolution=config.target.resolution))
+    if config.target.is_gastag_aware and config.is_gas:
+        steps.append(_shift_gastag_start_to_midnight)
+    return tuple(steps)
+
+
+def _get_inverse_target_steps(config: MappingConfig) -> tuple[Step, ...]:
+    """
+    returns the steps which convert the aware (exclusive) UTC datetime back to a value of the source system
+    """
+    steps: list[Step] = []
+    if config.source.is_gastag_aware and config.is_gas:
+        steps.append(_shift_midnight_to_gastag_start)
+    steps.extend(_get_to_timezone_steps(config.source.implicit_timezone))
+    if config.is_end and config.source.is_inclusive_end:
+        assert config.source.resolution is not None  # ensured by the consistency check
+        resolution = _ONE_DAY if config.source.is_date_only else config.source.resolution
+        steps.append(partial(_to_naive_inclusive_end, resolution=resolution))
+        steps.append(_get_localize_step(config.source.implicit_timezone or pytz.utc, config.source.implicit_is_dst))
+        steps.extend(_get_to_timezone_steps(config.source.implicit_timezone))
+    if config.source.is_date_only:
+        steps.append(_truncate_to_date)
+    return tuple(steps)
+
+
+def compile_inverse(config: MappingConfig) -> ConversionPlan:
+    """
+    validates the mapping configuration once and returns a conversion plan, which maps values of the target system
+    back to the source system: It inverts the steps of the configuration (the Gastag shifts, the inclusive ends and
+    the timezones), so that mapping a source value to the target and back returns the same value, unless the config
+    has lossy steps (see get_lossy_steps). The config of the plan is config.inverse().
+    Raises a ValueError if the configuration is not self-consistent.
+    """
+    check_config(config)
+    return ConversionPlan(
+        config=config.inverse(),
+        to_datetime=_to_datetime,
+        source_steps=_get_inverse_source_steps(config),
+        target_steps=_get_inverse_target_steps(config),
+    )
+
+
+_get_cached_inverse_plan = lru_cache(maxsize=256)(compile_inverse)
+
+
+def adapt_to_source(target_value: Union[date, datetime], config: MappingConfig) -> datetime:
+    """
+    maps a value of the target system back to the source system; this is the inverse of adapt_to_target with the
+    same config (see compile_inverse). The result is aware (in the implicit_timezone of the source or UTC) or, if the
+    source is_date_only, a naive datetime at midnight.
+    """
+    if target_value is None:
+        raise ValueError("target_value must not be None")
+    if config is None:
+        raise ValueError("config must not be None")
+    return _get_cached_inverse_plan(config)(target_value)
+
+
+_get_cached_range_plan = lru_cache(maxsize=256)(compile_range_config)
+
+
+def adapt_range_to_target(
+    start: Union[date, datetime], end: Union[date, datetime], config: RangeMappingConfig, validate_order: bool = False
+) -> tuple[datetime, datetime]:
+    """
+    maps the start and the end of a range to values compatible with the target system by using the given range
+    mapping configuration. This is equivalent to calling adapt_to_target for the start (with is_end=False) and for the
+    end (with is_end=True). If validate_order is True, a ValueError is raised unless the start is before the
+    (exclusive) end.
+    """
+    if config is None:
+        raise ValueError("config must not be None")
+    return _get_cached_range_plan(config)(start, end, validate_order)
+
+
+def _get_intermediate_steps(first: MappingConfig, second: MappingConfig) -> Optional[tuple[Step, ...]]:
+    """
+    Returns the steps which are equivalent to mapping the (aware UTC) result of the first config's source steps to the
+    intermediate system (first.target) and back to UTC (second.source), if the round trip is lossless.
+    The conversion to and from the intermediate timezone and the inclusive end shift (-resolution, +resolution) cancel
+    out. What remains are the Gastag shifts, which are not inverse to each other: Shifting midnights to Gastag starts
+    and then Gastag starts to midnights is the same as only shifting Gastag starts to midnights.
+    Returns None, if the round trip is not lossless (e.g. because the intermediate system is date-only).
+    """
+    intermediate = first.target
+    if intermediate != second.source or intermediate.is_date_only:
+        return None
+    if bool(first.is_end and intermediate.is_inclusive_end) != bool(second.is_end and intermediate.is_inclusive_end):
+        return None
+    if intermediate.is_gastag_aware and second.is_gas:
+        return (_shift_gastag_start_to_midnight,)
+    if intermediate.is_gastag_aware and first.is_gas:
+        return (_shift_midnight_to_gastag_start,)
+    return ()
+
+
+def _merge_is_gas(first: MappingConfig, second: MappingConfig) -> Optional[bool]:
+    """
+    returns the is_gas of the composed config; the first config decides for the source, the second for the target
+    """
+    if not first.source.is_gastag_aware:
+        return second.is_gas
+    if not second.target.is_gastag_aware or bool(first.is_gas) == bool(second.is_gas):
+        return first.is_gas
+    raise ValueError("is_gas differs between the configs, but both the source and the target are Gastag aware")
+
+
+def compose_configs(first: MappingConfig, second: MappingConfig) -> MappingConfig:
+    """
+    Returns a single config, which is equivalent to mapping with the first config and then mapping the result with the
+    second config (e.g. legacy -> canonical model -> SAP). The intermediate system (first.target) must be the source of
+    the second config. Raises a ValueError, if the configs are not self-consistent or if there is no equivalent single
+    config (e.g. because the intermediate system is date-only, the configs differ in is_end or the intermediate system
+    is Gastag aware); use compile_composition in this case.
+    """
+    for config in [first, second]:
+        check_config(config)
+    if first.target != second.source:
+        raise ValueError("the target of the first config must be the source of the second config")
+    if first.is_end != second.is_end:
+        raise ValueError(f"is_end differs between the configs ({first.is_end} and {second.is_end})")
+    if _get_intermediate_steps(first, second) != ():
+        raise ValueError("the mapping through the intermediate system is lossy or shifts the Gastag")
+    return MappingConfig(
+        source=first.source, target=second.target, is_end=first.is_end, is_gas=_merge_is_gas(first, second)
+    )
+
+
+def compile_composition(first: MappingConfig, second: MappingConfig) -> ConversionPlan:
+    """
+    Returns a plan, which is equivalent to mapping with the first config and then mapping the result with the second
+    config, but which skips the redundant steps in between (see compose_configs). If the composition maps the values
+    back to the same assumptions (e.g. with a config and its mirror image), the plan is usually ConversionKind.IDENTITY.
+    The config of the returned plan is the composed config, if there is one, and the second config otherwise.
+    Raises a ValueError if the configs are not self-consistent.
+    """
+    first_plan, second_plan = compile_config(first), compile_config(second)
+    try:
+        composed = compose_configs(first, second)
+    except ValueError:
+        intermediate_steps = _get_intermediate_steps(first, second)
+        if intermediate_steps is None:
+            intermediate_steps = first_plan.target_steps + (second_plan.to_datetime,) + second_plan.source_steps
+        return ConversionPlan(
+            config=second,
+            to_datetime=first_plan.to_datetime,
+            source_steps=first_plan.source_steps + intermediate_steps,
+            target_steps=second_plan.target_steps,
+        )
+    return compile_config(composed)
@@ -2,8 +2,9 @@
 models are the classes used by chronomeleon
 """
 
-__all__ = ["ChronoAssumption", "MappingConfig"]
+__all__ = ["ChronoAssumption", "MappingConfig", "RangeMappingConfig"]
 # fixes: Module "chronomeleon.models" does not explicitly export attribute "ChronoAssumption"
 
 from .chrono_assumption import ChronoAssumption
 from .mapping_config import MappingConfig
+from .range_mapping_config import RangeMappingConfig
@@ -0,0 +1,29 @@
+"""contains a class decorator, which computes the hash of a frozen dataclass only once"""
+
+from typing import Any, Optional, TypeVar
+
+_T = TypeVar("_T")
+
+
+def _get_cached_hash(self: Any) -> int:
+    cached_hash: Optional[int] = self.__dict__.get("_hash")
+    if cached_hash is None:
+        cached_hash = hash(self._get_hash_key())  # pylint:disable=protected-access
+        object.__setattr__(self, "_hash", cached_hash)
+    return cached_hash
+
+
+def _get_state_without_hash(self: Any) -> dict[str, Any]:
+    # string hashes differ between processes, so the cached hash must not be pickled
+    return {key: value for key, value in self.__dict__.items() if key != "_hash"}
+
+
+def with_cached_hash(cls: type[_T]) -> type[_T]:
+    """
+    Makes the frozen dataclass hash the tuple returned by its _get_hash_key method only once. The __hash__ generated by
+    the dataclass decorator would hash all fields on every call, but the models are hashed whenever a cached plan or
+    result is looked up. Apply it above the dataclass decorator, which would replace an inherited __hash__.
+    """
+    setattr(cls, "__hash__", _get_cached_hash)
+    setattr(cls, "__getstate__", _get_state_without_hash)
+    return cls
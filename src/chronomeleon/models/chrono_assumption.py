@@ -1,12 +1,111 @@
 """contains the ChronoAssumption class"""
 
-from dataclasses import dataclass
-from datetime import timedelta
-from typing import Optional
+import re
+from dataclasses import dataclass, fields
+from datetime import timedelta, timezone, tzinfo
+from typing import Any, Optional
 
-from pytz import BaseTzInfo
+import pytz
 
+from .cached_hash import with_cached_hash
 
+_ISO_8601_DURATION_PATTERN = re.compile(
+    r"^P(?:(?P<days>\d+)D)?(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+(?:\.\d{1,6})?)S)?)?$"
+)
+
+
+def _parse_duration(value: str) -> timedelta:
+    """
+    parses an ISO 8601 duration with days, hours, minutes and (fractional) seconds, e.g. 'P1D' or 'PT0.001S'
+    """
+    match = _ISO_8601_DURATION_PATTERN.match(value) if isinstance(value, str) else None
+    if match is None or value in {"P", "PT"}:
+        raise ValueError(f"'{value}' is not a supported ISO 8601 duration (like 'P1D', 'PT1S' or 'PT0.001S')")
+    seconds, _, fraction = (match.group("seconds") or "0").partition(".")
+    return timedelta(
+        days=int(match.group("days") or 0),
+        hours=int(match.group("hours") or 0),
+        minutes=int(match.group("minutes") or 0),
+        seconds=int(seconds),
+        microseconds=int(fraction.ljust(6, "0")),
+    )
+
+
+ISO_FORMAT = "iso"
+"""
+the string_format of ISO 8601 strings, as datetime.fromisoformat parses them, e.g. '2024-01-31' or '2024-01-31T23:59:59'
+"""
+
+SAP_DATS_FORMAT = "sap_dats"
+"""
+the string_format of SAP DATS fields, e.g. '20240131'
+"""
+
+SAP_DATS_TIMS_FORMAT = "sap_dats_tims"
+"""
+the string_format of SAP DATS and TIMS fields in one string, e.g. '20240131235959'
+"""
+
+_FIXED_OFFSET_PATTERN = re.compile(r"^fixed:(?P<sign>[+-])(?P<hours>\d{2}):(?P<minutes>\d{2})$")
+
+
+def _format_timezone(value: tzinfo) -> str:
+    """
+    returns the name of a pytz timezone (e.g. 'Europe/Berlin'), 'zoneinfo:' + the key of a zoneinfo.ZoneInfo or
+    'fixed:' + the offset of a datetime.timezone (e.g. 'fixed:+01:00')
+    """
+    if isinstance(value, pytz.BaseTzInfo):
+        return str(value.zone)
+    # zoneinfo is only imported on demand to keep the import of chronomeleon fast
+    from zoneinfo import ZoneInfo  # pylint:disable=import-outside-toplevel
+
+    if isinstance(value, ZoneInfo) and value.key is not None:
+        return "zoneinfo:" + value.key
+    if isinstance(value, timezone):
+        offset = value.utcoffset(None)
+        if offset % timedelta(minutes=1) == timedelta(0):
+            sign = "-" if offset < timedelta(0) else "+"
+            hours, minutes = divmod(abs(offset) // timedelta(minutes=1), 60)
+            return f"fixed:{sign}{hours:02d}:{minutes:02d}"
+    raise ValueError(f"the timezone {value!r} cannot be serialized")
+
+
+def _parse_timezone(value: str) -> tzinfo:
+    """
+    parses a timezone as formatted by _format_timezone
+    """
+    if not isinstance(value, str):
+        raise ValueError(f"the timezone must be a string but is {value.__class__.__name__}")
+    fixed_offset_match = _FIXED_OFFSET_PATTERN.match(value)
+    if fixed_offset_match is not None:
+        offset = timedelta(hours=int(fixed_offset_match["hours"]), minutes=int(fixed_offset_match["minutes"]))
+        return timezone(-offset if fixed_offset_match["sign"] == "-" else offset)
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError  # pylint:disable=import-outside-toplevel
+
+    try:
+        if value.startswith("zoneinfo:"):
+            return ZoneInfo(value.removeprefix("zoneinfo:"))
+        return pytz.timezone(value)
+    except (pytz.UnknownTimeZoneError, ZoneInfoNotFoundError, ValueError) as error:
+        raise ValueError(f"unknown timezone '{value}'") from error
+
+
+def _format_duration(value: timedelta) -> str:
+    """
+    formats the timedelta as ISO 8601 duration (the inverse of _parse_duration)
+    """
+    result = f"P{value.days}D" if value.days else "P"
+    hours, remainder = divmod(value.seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    time_part = (f"{hours}H" if hours else "") + (f"{minutes}M" if minutes else "")
+    if seconds or value.microseconds:
+        time_part += f"{seconds}.{value.microseconds:06d}".rstrip("0").rstrip(".") + "S"
+    if time_part or result == "P":
+        result += "T" + (time_part or "0S")
+    return result
+
+
+@with_cached_hash
 @dataclass(frozen=True, kw_only=True)
 class ChronoAssumption:
     """
@@ -23,14 +122,26 @@ class ChronoAssumption:
     But if the resolution is 1 second, then the next possible value after 2024-01-01 00:00:00 is 2024-01-01 00:00:01.
     """
 
-    implicit_timezone: Optional[BaseTzInfo] = None
+    implicit_timezone: Optional[tzinfo] = None
     """
     Systems often don't provide an explicit UTC offset with their date or time fields.
     In this case, the system implicitly uses a specific timezone.
     You can specific this implicit timezone here.
     If the datetimes come with a specified UTC offset, leave it None.
-    You have to specify the implicit timezone as a pytz-timezone object, e.g. pytz.timezone("Europe/Berlin").
+    You can specify the implicit timezone as a pytz-timezone object, e.g. pytz.timezone("Europe/Berlin"), as
+    zoneinfo.ZoneInfo("Europe/Berlin") or as fixed offset, e.g. datetime.timezone(timedelta(hours=1)).
     pytz is a dependency of chronomeleon; If you install chronomeleon, you also get pytz.
+    The results are the same for pytz and zoneinfo, but pytz only knows the DST transitions until 2037.
+    """
+
+    implicit_is_dst: Optional[bool] = False
+    """
+    Only relevant if implicit_timezone is set.
+    Local times in the implicit timezone can be ambiguous (e.g. 2:30 am on the last Sunday of October in Germany
+    happens twice) or non-existent (e.g. 2:30 am on the last Sunday of March in Germany).
+    Just like the is_dst argument of pytz' localize, this decides how such local times are interpreted:
+    If False (default), they're interpreted as standard time (e.g. CET), if True as daylight saving time (e.g. CEST).
+    If None, mapping an ambiguous or non-existent local time raises a ValueError.
     """
 
     is_inclusive_end: Optional[bool] = None
@@ -53,6 +164,24 @@ class ChronoAssumption:
     True if and only if the field in the respective system is a date without a time component (datetime.date).
     """
 
+    string_format: Optional[str] = None
+    """
+    Only relevant if the system delivers (or expects) its values as strings (see chronomeleon.string_codecs).
+    Either 'iso' (ISO 8601, the default), 'sap_dats' (e.g. '20240131'), 'sap_dats_tims' (e.g. '20240131235959') or
+    a strptime/strftime pattern, e.g. '%d.%m.%Y'.
+    """
+
+    def _get_hash_key(self) -> tuple[Any, ...]:
+        return (
+            self.resolution,
+            getattr(self.implicit_timezone, "zone", self.implicit_timezone),
+            self.implicit_is_dst,
+            self.is_inclusive_end,
+            self.is_gastag_aware,
+            self.is_date_only,
+            self.string_format,
+        )
+
     def get_consistency_errors(self) -> list[str]:
         """
         returns errors from the self-consistency check; if the returned list is empty, the object is self-consistent
@@ -62,12 +191,65 @@ class ChronoAssumption:
             result.append("if is_inclusive_end is True, then resolution must be set")
         if self.resolution is not None and not isinstance(self.resolution, timedelta):
             result.append(f"resolution must be a timedelta object but is {self.resolution.__class__.__name__}")
-        if self.implicit_timezone is not None and not isinstance(self.implicit_timezone, BaseTzInfo):
+        if self.implicit_timezone is not None and not isinstance(self.implicit_timezone, tzinfo):
             result.append(
-                f"implicit_timezone must be a pytz timezone object but is {self.implicit_timezone.__class__.__name__}"
+                "implicit_timezone must be a timezone (tzinfo) object but is "
+                + self.implicit_timezone.__class__.__name__
             )
+        if self.implicit_is_dst is not None and not isinstance(self.implicit_is_dst, bool):
+            result.append(f"implicit_is_dst must be a bool or None but is {self.implicit_is_dst.__class__.__name__}")
+        if self.string_format is not None and (
+            not isinstance(self.string_format, str)
+            or (
+                self.string_format not in {ISO_FORMAT, SAP_DATS_FORMAT, SAP_DATS_TIMS_FORMAT}
+                and "%" not in self.string_format
+            )
+        ):
+            result.append(
+                f"string_format must be '{ISO_FORMAT}', '{SAP_DATS_FORMAT}', '{SAP_DATS_TIMS_FORMAT}' or a strptime "
+                f"pattern but is {self.string_format!r}"
+            )
+        return result
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        returns a JSON/TOML serializable dictionary, which only contains the values that differ from the defaults.
+        The resolution is serialized as ISO 8601 duration and the implicit_timezone by its name: 'Europe/Berlin' for
+        pytz, 'zoneinfo:Europe/Berlin' for zoneinfo and e.g. 'fixed:+01:00' for datetime.timezone.
+        """
+        result: dict[str, Any] = {}
+        if self.resolution is not None:
+            result["resolution"] = _format_duration(self.resolution)
+        if self.implicit_timezone is not None:
+            result["implicit_timezone"] = _format_timezone(self.implicit_timezone)
+        if self.implicit_is_dst is not False:
+            result["implicit_is_dst"] = self.implicit_is_dst
+        if self.is_inclusive_end is not None:
+            result["is_inclusive_end"] = self.is_inclusive_end
+        if self.is_gastag_aware:
+            result["is_gastag_aware"] = True
+        if self.is_date_only:
+            result["is_date_only"] = True
+        if self.string_format is not None:
+            result["string_format"] = self.string_format
         return result
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ChronoAssumption":
+        """
+        creates a ChronoAssumption from a dictionary as returned by to_dict.
+        Raises a ValueError if the dictionary contains unknown keys or values that cannot be parsed.
+        """
+        unknown_keys = set(data.keys()) - {field.name for field in fields(cls)}
+        if unknown_keys:
+            raise ValueError(f"unknown keys for ChronoAssumption: {', '.join(sorted(unknown_keys))}")
+        kwargs = dict(data)
+        if kwargs.get("resolution") is not None:
+            kwargs["resolution"] = _parse_duration(kwargs["resolution"])
+        if kwargs.get("implicit_timezone") is not None:
+            kwargs["implicit_timezone"] = _parse_timezone(kwargs["implicit_timezone"])
+        return cls(**kwargs)
+
     def is_self_consistent(self) -> bool:
         """
         returns True if the object is self-consistent
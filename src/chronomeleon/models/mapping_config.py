@@ -1,11 +1,16 @@
 """contains the Mapping configuration class"""
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Any, Optional
 
+from .cached_hash import with_cached_hash
 from .chrono_assumption import ChronoAssumption
 
+if TYPE_CHECKING:
+    from chronomeleon.mapping import ConversionPlan
 
+
+@with_cached_hash
 @dataclass(frozen=True, kw_only=True)
 class MappingConfig:
     """
@@ -32,6 +37,9 @@ class MappingConfig:
     Set to true to trigger the gas tag modifications in source, target or both, if necessary. Ignore otherwise.
     """
 
+    def _get_hash_key(self) -> tuple[Any, ...]:
+        return (self.source, self.target, self.is_end, self.is_gas)
+
     def get_consistency_errors(self) -> list[str]:
         """
         returns a list of error messages if the mapping configuration is not self-consistent
@@ -56,8 +64,57 @@ class MappingConfig:
             errors.append("if is_end is True, then is_inclusive_end must not be None in both source and target")
         return errors
 
+    def inverse(self) -> "MappingConfig":
+        """
+        returns the mirrored mapping configuration (target -> source) of the reverse sync.
+        Use adapt_to_source (or compile_inverse) to map the values back: It inverts the steps of this configuration
+        exactly, whereas mapping with the mirrored configuration subtracts the resolution of an inclusive end in UTC and
+        not on the wall clock of the original source (which differs across DST transitions, if the resolution is a day).
+        """
+        return MappingConfig(source=self.target, target=self.source, is_end=self.is_end, is_gas=self.is_gas)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        returns a JSON/TOML serializable dictionary; see ChronoAssumption.to_dict
+        """
+        result: dict[str, Any] = {"source": self.source.to_dict(), "target": self.target.to_dict()}
+        if self.is_end is not None:
+            result["is_end"] = self.is_end
+        if self.is_gas is not None:
+            result["is_gas"] = self.is_gas
+        return result
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "MappingConfig":
+        """
+        creates a MappingConfig from a dictionary as returned by to_dict.
+        Raises a ValueError if the dictionary contains unknown keys or values that cannot be parsed.
+        """
+        unknown_keys = set(data.keys()) - {field.name for field in fields(cls)}
+        if unknown_keys:
+            raise ValueError(f"unknown keys for MappingConfig: {', '.join(sorted(unknown_keys))}")
+        for key in ["source", "target"]:
+            if key not in data:
+                raise ValueError(f"{key} is missing")
+        return cls(
+            source=ChronoAssumption.from_dict(data["source"]),
+            target=ChronoAssumption.from_dict(data["target"]),
+            is_end=data.get("is_end"),
+            is_gas=data.get("is_gas"),
+        )
+
     def is_self_consistent(self) -> bool:
         """
         checks if the mapping configuration is self-consistent
         """
         return not any(self.get_consistency_errors())
+
+    def compile(self) -> "ConversionPlan":
+        """
+        validates the mapping configuration once and returns a conversion plan that is specialized to it.
+        Raises a ValueError if the configuration is not self-consistent.
+        """
+        # pylint:disable=import-outside-toplevel
+        from chronomeleon.mapping import compile_config  # avoids a circular import
+
+        return compile_config(self)
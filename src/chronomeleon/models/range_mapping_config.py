@@ -0,0 +1,111 @@
+"""contains the mapping configuration for ranges (start/end pairs)"""
+
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Any, Optional
+
+from .cached_hash import with_cached_hash
+from .chrono_assumption import ChronoAssumption
+from .mapping_config import MappingConfig
+
+if TYPE_CHECKING:
+    from chronomeleon.mapping import RangeConversionPlan
+
+
+@with_cached_hash
+@dataclass(frozen=True, kw_only=True)
+class RangeMappingConfig:
+    """
+    represents the mapping rules for a range, i.e. a pair of a start and an end date(time) field, from one system to
+    another. Start and end share the same assumptions about the source and the target system, so that they cannot get
+    out of sync (as two separate MappingConfigs might).
+    """
+
+    source: ChronoAssumption
+    """
+    assumptions about the interpretation of the start and end in the source system
+    """
+    target: ChronoAssumption
+    """
+    assumptions about the interpretation of the start and end in the target system
+    """
+
+    is_gas: Optional[bool] = None
+    """
+    True if the sparte is Gas; see MappingConfig.is_gas
+    """
+
+    def __post_init__(self) -> None:
+        # built only once, because they are used (and hashed) for every range that is mapped
+        object.__setattr__(
+            self,
+            "_start_config",
+            MappingConfig(source=self.source, target=self.target, is_end=False, is_gas=self.is_gas),
+        )
+        object.__setattr__(
+            self, "_end_config", MappingConfig(source=self.source, target=self.target, is_end=True, is_gas=self.is_gas)
+        )
+
+    def _get_hash_key(self) -> tuple[Any, ...]:
+        return (self.source, self.target, self.is_gas)
+
+    @property
+    def start_config(self) -> MappingConfig:
+        """
+        the mapping configuration of the start of the range
+        """
+        start_config: MappingConfig = self.__dict__["_start_config"]
+        return start_config
+
+    @property
+    def end_config(self) -> MappingConfig:
+        """
+        the mapping configuration of the end of the range
+        """
+        end_config: MappingConfig = self.__dict__["_end_config"]
+        return end_config
+
+    def get_consistency_errors(self) -> list[str]:
+        """
+        returns a list of error messages if the range mapping configuration is not self-consistent
+        """
+        errors: list[str] = []
+        for error in self.start_config.get_consistency_errors() + self.end_config.get_consistency_errors():
+            if error not in errors:  # most errors apply to both start and end
+                errors.append(error)
+        return errors
+
+    def is_self_consistent(self) -> bool:
+        """
+        checks if the range mapping configuration is self-consistent
+        """
+        return not any(self.get_consistency_errors())
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        returns a JSON/TOML serializable dictionary; see ChronoAssumption.to_dict
+        """
+        result = self.start_config.to_dict()
+        del result["is_end"]  # it's implied by start and end
+        return result
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RangeMappingConfig":
+        """
+        creates a RangeMappingConfig from a dictionary as returned by to_dict.
+        Raises a ValueError if the dictionary contains unknown keys or values that cannot be parsed.
+        """
+        unknown_keys = set(data.keys()) - {field.name for field in fields(cls)}
+        if unknown_keys:
+            raise ValueError(f"unknown keys for RangeMappingConfig: {', '.join(sorted(unknown_keys))}")
+        mapping_config = MappingConfig.from_dict(data)
+        return cls(source=mapping_config.source, target=mapping_config.target, is_gas=mapping_config.is_gas)
+
+    def compile(self) -> "RangeConversionPlan":
+        """
+        validates the range mapping configuration once and returns a conversion plan for start/end pairs.
+        Raises a ValueError if the configuration is not self-consistent.
+        """
+        # pylint:disable=import-outside-toplevel
+        from chronomeleon.mapping import compile_range_config  # avoids a circular import
+
+        return compile_range_config(self)
@@ -0,0 +1,75 @@
+"""
+contains the pandas integration of chronomeleon: Importing this module registers the Series accessor 'chronomeleon'.
+
+    import chronomeleon.pandas_accessor  # registers the accessor
+
+    df["vertragsende"] = df["vertragsende"].chronomeleon.adapt(config)
+
+The accessor operates on the underlying int64 buffer of datetime64 columns (naive or with timezone), so there's no
+Python object per value. Missing values (NaT or None) are passed through.
+This module requires pandas and numpy (install chronomeleon[pandas]).
+"""
+
+from datetime import date, datetime
+from typing import Any
+
+import numpy as np
+import pandas as pd  # type: ignore[import-untyped,import-not-found,unused-ignore]
+
+from chronomeleon.batch import adapt_epoch_values
+from chronomeleon.mapping import compile_config
+from chronomeleon.models.mapping_config import MappingConfig
+
+
+def _get_epoch_values(series: Any) -> tuple[Any, str, bool]:
+    """
+    returns the int64 values, their unit and whether they're UTC instants (and not wall clock values) of the series
+    """
+    if isinstance(series.dtype, pd.DatetimeTZDtype):
+        return series.array.asi8, series.dtype.unit, True
+    if pd.api.types.is_datetime64_dtype(series.dtype):
+        values = series.to_numpy()
+        return values.view(np.int64), np.datetime_data(values.dtype)[0], False
+    if series.dtype == object:
+        # pandas has no date dtype, so columns of dates are object columns
+        is_missing = series.isna().to_numpy()
+        if all(isinstance(value, date) and not isinstance(value, datetime) for value in series[~is_missing]):
+            values = np.full(len(series), np.datetime64("NaT"), dtype="datetime64[D]")
+            values[~is_missing] = np.array(series[~is_missing].tolist(), dtype="datetime64[D]")
+            return values.view(np.int64), "D", False
+    raise ValueError(f"the series must have a datetime64 dtype or contain dates but has dtype {series.dtype}")
+
+
+def adapt_series(series: Any, config: MappingConfig) -> Any:
+    """
+    Maps all values of the pandas Series to values compatible with the target system; it's the vectorized equivalent
+    of calling adapt_to_target for each value. NaT and None are passed through.
+    The result is a new Series (with the same index and name) of dtype datetime64[ns, tz] (or [us] if the input is not
+    in ns) where tz is the implicit_timezone of the target or UTC. If the target is_date_only, the result contains the
+    naive midnights of the dates instead.
+    """
+    compile_config(config)  # raises if the config is not self-consistent
+    values, unit, is_aware = _get_epoch_values(series)
+    to_wall_clock = config.target.is_date_only
+    result_values = adapt_epoch_values(values, unit, is_aware, config, to_wall_clock)
+    result_unit = "ns" if unit == "ns" else "us"
+    result = pd.Series(result_values.view(f"datetime64[{result_unit}]"), index=series.index, name=series.name)
+    if to_wall_clock:
+        return result
+    return result.dt.tz_localize("UTC").dt.tz_convert(config.target.implicit_timezone or "UTC")
+
+
+@pd.api.extensions.register_series_accessor("chronomeleon")  # type: ignore[misc,unused-ignore]
+class ChronomeleonAccessor:  # pylint:disable=too-few-public-methods
+    """
+    the accessor 'chronomeleon' of pandas Series, e.g. series.chronomeleon.adapt(config)
+    """
+
+    def __init__(self, series: Any):
+        self._series = series
+
+    def adapt(self, config: MappingConfig) -> Any:
+        """
+        maps all values of the series; see adapt_series
+        """
+        return adapt_series(self._series, config)
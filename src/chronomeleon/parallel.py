@@ -0,0 +1,190 @@
+"""
+contains helpers to spread large conversion jobs over several processes.
+
+A single process is bound by the GIL, no matter how fast the single conversions are. The functions in this module
+split the input into chunks and let a pool of worker processes convert them. The mapping configurations are sent to
+each worker only once (when the worker is started) and compiled there; the chunks only carry the values and the key of
+the configuration. The results are reassembled in the order of the input.
+For small inputs, starting the processes costs more than it saves, so they are converted in the calling process.
+"""
+
+import csv
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import date, datetime
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Sequence, TypeVar, Union
+
+from chronomeleon.mapping import ConversionPlan, compile_config
+from chronomeleon.models.mapping_config import MappingConfig
+from chronomeleon.streaming import (
+    DEFAULT_CHUNK_SIZE,
+    ChunkCallback,
+    StreamStatistics,
+    adapt_chunk,
+    adapt_csv_chunk,
+    check_chunk_size,
+    read_csv_header,
+)
+
+DEFAULT_MIN_PARALLEL_SIZE = 50_000
+"""
+inputs with less values than this are converted in the calling process
+"""
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+_worker_plans: dict[str, ConversionPlan] = {}
+"""
+the conversion plans of the worker process by key (column name); filled by _initialize_worker
+"""
+
+
+def _initialize_worker(configs: Mapping[str, MappingConfig]) -> None:
+    """
+    runs once in every worker process and compiles the mapping configurations which the worker will need
+    """
+    _worker_plans.clear()
+    _worker_plans.update({key: compile_config(config) for key, config in configs.items()})
+
+
+def get_workers(workers: Optional[int]) -> int:
+    """
+    returns the number of worker processes; None means the number of CPUs
+    """
+    if workers is None:
+        return os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1 but is {workers}")
+    return workers
+
+
+def _adapt_values_in_worker(
+    config_key: str, first_row_index: int, source_values: Sequence[Union[date, datetime]]
+) -> list[datetime]:
+    return adapt_chunk(source_values, first_row_index, _worker_plans[config_key])
+
+
+def _adapt_csv_chunk_in_worker(
+    column_indices: Sequence[tuple[int, str]], first_row_index: int, chunk: list[list[str]]
+) -> list[list[str]]:
+    column_plans = [(column_index, name, _worker_plans[name]) for column_index, name in column_indices]
+    return adapt_csv_chunk(chunk, first_row_index, column_plans)
+
+
+def _map_in_order(
+    executor: ProcessPoolExecutor,
+    function: Callable[[int, _T], _R],
+    chunks: Iterable[tuple[int, _T]],
+    max_pending: int,
+) -> Iterator[_R]:
+    """
+    Submits function(first_row_index, chunk) for every chunk and yields the results in the order of the chunks.
+    Other than executor.map, it consumes the chunks lazily, so that at most max_pending chunks are held in memory.
+    """
+    pending: deque[Future[_R]] = deque()
+    try:
+        for first_row_index, chunk in chunks:
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+            pending.append(executor.submit(function, first_row_index, chunk))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:  # e.g. if a chunk failed, there's no point in converting the following chunks
+            future.cancel()
+
+
+def _split(source_values: Sequence[_T], chunk_size: int) -> Iterator[tuple[int, Sequence[_T]]]:
+    for first_row_index in range(0, len(source_values), chunk_size):
+        yield first_row_index, source_values[first_row_index : first_row_index + chunk_size]
+
+
+def adapt_in_parallel(
+    source_values: Sequence[Union[date, datetime]],
+    config: MappingConfig,
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    min_parallel_size: int = DEFAULT_MIN_PARALLEL_SIZE,
+) -> list[datetime]:
+    """
+    Maps the source values just like adapt_to_target, but spreads the work over a pool of worker processes.
+    workers is the number of processes (defaults to the number of CPUs). Inputs with less than min_parallel_size
+    values (or workers=1) are converted in the calling process.
+    Raises a ConversionError with the index of the first value that cannot be mapped.
+    """
+    plan = compile_config(config)  # raises if the config is not self-consistent
+    workers = get_workers(workers)
+    check_chunk_size(chunk_size)
+    if workers == 1 or len(source_values) < min_parallel_size:
+        return adapt_chunk(source_values, 0, plan)
+    result: list[datetime] = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_initialize_worker, initargs=({"": config},)) as executor:
+        function = partial(_adapt_values_in_worker, "")
+        for chunk_result in _map_in_order(executor, function, _split(source_values, chunk_size), 2 * workers):
+            result.extend(chunk_result)
+    return result
+
+
+def _read_chunks(reader: Iterator[list[str]], chunk_size: int) -> Iterator[tuple[int, list[list[str]]]]:
+    first_row_index = 0
+    while chunk := list(islice(reader, chunk_size)):
+        yield first_row_index, chunk
+        first_row_index += len(chunk)
+
+
+def _write_chunks(
+    writer: Any, chunks: Iterator[list[list[str]]], on_chunk: Optional[ChunkCallback]
+) -> StreamStatistics:
+    start = time.perf_counter()
+    rows = 0
+    for chunk in chunks:
+        writer.writerows(chunk)
+        rows += len(chunk)
+        if on_chunk is not None:
+            on_chunk(StreamStatistics(rows=rows, seconds=time.perf_counter() - start))
+    return StreamStatistics(rows=rows, seconds=time.perf_counter() - start)
+
+
+def adapt_csv_in_parallel(  # pylint:disable=too-many-arguments
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    column_configs: Mapping[str, MappingConfig],
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    delimiter: str = ",",
+    on_chunk: Optional[ChunkCallback] = None,
+) -> StreamStatistics:
+    """
+    Maps the columns of the CSV file just like streaming.adapt_csv, but the chunks are converted by a pool of worker
+    processes (workers defaults to the number of CPUs). The chunks are still read lazily and written in order, so
+    that only about 2 chunks per worker are held in memory at any time.
+    Raises a ConversionError with the index of the (data) row, if a value cannot be mapped.
+    """
+    workers = get_workers(workers)
+    check_chunk_size(chunk_size)
+    with (
+        open(input_path, "r", encoding="utf-8", newline="") as input_file,
+        open(output_path, "w", encoding="utf-8", newline="") as output_file,
+        ProcessPoolExecutor(
+            max_workers=workers, initializer=_initialize_worker, initargs=(dict(column_configs),)
+        ) as executor,
+    ):
+        reader = csv.reader(input_file, delimiter=delimiter)
+        writer = csv.writer(output_file, delimiter=delimiter)
+        header, column_plans = read_csv_header(reader, column_configs)
+        writer.writerow(header)
+        adapted_chunks = _map_in_order(
+            executor,
+            partial(_adapt_csv_chunk_in_worker, [(index, name) for index, name, _ in column_plans]),
+            _read_chunks(reader, chunk_size),
+            2 * workers,
+        )
+        return _write_chunks(writer, adapted_chunks, on_chunk)
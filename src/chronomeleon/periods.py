@@ -0,0 +1,160 @@
+"""
+contains generate_periods, which expands ranges (e.g. contract periods) into the grid of their days, Gastage or
+quarter-hours, e.g. for settlement.
+
+The periods are Intervals (see chronomeleon.intervals): UTC instants with exclusive ends, which can be mapped to the
+semantics of any target system with Intervals.to_target. Because the grid is built in UTC, DST is taken into account
+for free: A German day has 92, 96 or 100 quarter-hours and a Gastag starts at 6:00 German local time.
+The boundaries of days and Gastage are precomputed once for all days from 1970 to 2100 (see chronomeleon.gastag), so no
+datetime objects are created. A year of quarter-hours for many ranges is a lot of periods, though; iter_periods yields
+them in chunks.
+This module requires numpy (install chronomeleon[numpy]).
+"""
+
+from datetime import tzinfo
+from enum import Enum
+from functools import lru_cache
+from typing import Iterator, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from chronomeleon.batch import get_gastag_arrays, local_to_utc
+from chronomeleon.gastag import FIRST_DAY, LAST_DAY, get_berlin
+from chronomeleon.intervals import Intervals
+from chronomeleon.transition_index import MICROSECONDS_PER_DAY
+
+_QUARTER_HOUR = MICROSECONDS_PER_DAY // 96
+
+DEFAULT_MAX_PERIODS = 1_000_000
+"""
+the default (approximate) number of periods per chunk of iter_periods
+"""
+
+
+class Granularity(Enum):
+    """
+    the length of the periods of a grid
+    """
+
+    DAY = "day"
+    """
+    civil days from midnight to midnight in the given timezone (23, 24 or 25 hours long)
+    """
+
+    GASTAG = "gastag"
+    """
+    gas days from 6:00 to 6:00 German local time
+    """
+
+    QUARTER_HOUR = "quarter_hour"
+    """
+    15 minutes, e.g. the settlement periods of the German energy market
+    """
+
+
+@lru_cache(maxsize=16)
+def _get_day_boundaries(timezone: Optional[tzinfo]) -> npt.NDArray[np.int64]:
+    """
+    returns the UTC instants of the midnights in the timezone (or UTC) of all days from FIRST_DAY to LAST_DAY + 1 day
+    """
+    first_day_number, midnights, _ = get_gastag_arrays()
+    if timezone is get_berlin():
+        return midnights
+    day_numbers = np.arange(first_day_number, first_day_number + len(midnights), dtype=np.int64)
+    local_midnights = day_numbers * MICROSECONDS_PER_DAY
+    if timezone is None:
+        return local_midnights
+    return local_to_utc(local_midnights, timezone, is_dst=False)
+
+
+def _get_boundaries(granularity: Granularity, timezone: Optional[tzinfo]) -> npt.NDArray[np.int64]:
+    if granularity is Granularity.GASTAG:
+        return get_gastag_arrays()[2]
+    return _get_day_boundaries(timezone)
+
+
+def _get_first_indices_and_counts(
+    intervals: Intervals, granularity: Granularity, timezone: Optional[tzinfo]
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """
+    returns the index of the first period (the one which contains the start) and the number of periods of each range;
+    empty ranges (ends <= starts) have no periods, even if they aren't on a boundary of the grid
+    """
+    if granularity is Granularity.QUARTER_HOUR:
+        first_indices = intervals.starts // _QUARTER_HOUR
+        end_indices = -(-intervals.ends // _QUARTER_HOUR)
+    else:
+        boundaries = _get_boundaries(granularity, timezone)
+        if len(intervals) > 0 and (intervals.starts.min() < boundaries[0] or intervals.ends.max() > boundaries[-1]):
+            raise ValueError(f"days and Gastage are only supported from {FIRST_DAY} to {LAST_DAY}")
+        first_indices = (np.searchsorted(boundaries, intervals.starts, side="right") - 1).astype(np.int64)
+        end_indices = np.searchsorted(boundaries, intervals.ends, side="left").astype(np.int64)
+    counts = np.where(intervals.ends > intervals.starts, end_indices - first_indices, 0)
+    return first_indices, counts
+
+
+def _get_boundary_values(
+    indices: npt.NDArray[np.int64], granularity: Granularity, timezone: Optional[tzinfo]
+) -> npt.NDArray[np.int64]:
+    if granularity is Granularity.QUARTER_HOUR:
+        return indices * _QUARTER_HOUR
+    return _get_boundaries(granularity, timezone)[indices]
+
+
+def _expand(
+    intervals: Intervals,
+    first_indices: npt.NDArray[np.int64],
+    counts: npt.NDArray[np.int64],
+    granularity: Granularity,
+    timezone: Optional[tzinfo],
+) -> Intervals:
+    """
+    returns the periods of all ranges: first_indices + 0, 1, ..., count - 1 for each range, clipped to the range
+    """
+    range_positions = np.repeat(np.arange(len(intervals)), counts)
+    offsets = np.arange(len(range_positions)) - np.repeat(np.cumsum(counts) - counts, counts)
+    indices = first_indices[range_positions] + offsets
+    return Intervals(
+        keys=intervals.keys[range_positions],
+        starts=np.maximum(_get_boundary_values(indices, granularity, timezone), intervals.starts[range_positions]),
+        ends=np.minimum(_get_boundary_values(indices + 1, granularity, timezone), intervals.ends[range_positions]),
+        row_indices=intervals.row_indices[range_positions],
+    )
+
+
+def generate_periods(intervals: Intervals, granularity: Granularity, timezone: Optional[tzinfo] = None) -> Intervals:
+    """
+    Returns the periods of the given granularity which the ranges cover, in the order of the ranges. The first and the
+    last period of a range are clipped to the range, if it doesn't start or end at a boundary of the grid.
+    The row_indices of the periods are those of their ranges. Days are civil days in the timezone (UTC if None);
+    Gastage and quarter-hours don't depend on it.
+    """
+    first_indices, counts = _get_first_indices_and_counts(intervals, granularity, timezone)
+    return _expand(intervals, first_indices, counts, granularity, timezone)
+
+
+def iter_periods(
+    intervals: Intervals,
+    granularity: Granularity,
+    timezone: Optional[tzinfo] = None,
+    max_periods: int = DEFAULT_MAX_PERIODS,
+) -> Iterator[Intervals]:
+    """
+    Yields the same periods as generate_periods, but in chunks of about max_periods periods (the periods of a range
+    are never split, so a chunk may be larger, if a single range has more periods).
+    """
+    if max_periods < 1:
+        raise ValueError(f"max_periods must be positive but is {max_periods}")
+    first_indices, counts = _get_first_indices_and_counts(intervals, granularity, timezone)
+    chunk_ids = (np.cumsum(counts) - counts) // max_periods
+    chunk_starts = np.flatnonzero(np.diff(chunk_ids, prepend=-1))
+    for chunk_start, chunk_end in zip(chunk_starts.tolist(), chunk_starts[1:].tolist() + [len(intervals)]):
+        chunk = slice(chunk_start, chunk_end)
+        chunk_intervals = Intervals(
+            keys=intervals.keys[chunk],
+            starts=intervals.starts[chunk],
+            ends=intervals.ends[chunk],
+            row_indices=intervals.row_indices[chunk],
+        )
+        yield _expand(chunk_intervals, first_indices[chunk], counts[chunk], granularity, timezone)
@@ -0,0 +1,217 @@
+"""
+contains a registry of named mapping configurations, which are loaded (and validated) once from a JSON or TOML file.
+
+The file has two top level tables:
+* "assumptions" maps names to ChronoAssumptions (as in ChronoAssumption.to_dict); it is optional.
+* "configs" maps names to MappingConfigs (as in MappingConfig.to_dict), whose source and target are either a
+  ChronoAssumption or the name of one of the assumptions.
+
+Equal assumptions and configs are interned, i.e. they are represented by the same object, and each distinct config is
+compiled to a ConversionPlan only once. Because the registry is immutable, the configs and plans can be shared freely.
+The registry can be serialized to a (small) string, which is an alternative to pickling it for worker processes.
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Mapping, Optional, Union
+
+from chronomeleon.mapping import ConversionPlan, compile_config
+from chronomeleon.models.chrono_assumption import ChronoAssumption
+from chronomeleon.models.mapping_config import MappingConfig
+
+
+def load_file(path: Union[str, Path]) -> dict[str, Any]:
+    """
+    loads a JSON or TOML file (depending on the file extension) and returns its top level table
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".toml":
+        if sys.version_info >= (3, 11):
+            import tomllib  # pylint:disable=import-outside-toplevel
+        else:  # pragma: no cover
+            import tomli as tomllib  # pylint:disable=import-outside-toplevel,import-error
+        with open(path, "rb") as toml_file:
+            data = tomllib.load(toml_file)
+    else:
+        with open(path, "r", encoding="utf-8") as json_file:
+            data = json.load(json_file)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path} must contain a table (object) at the top level")
+    return data
+
+
+def _format_toml_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, str):
+        return json.dumps(value)  # basic TOML strings use the same escapes as JSON
+    if isinstance(value, dict):
+        return "{ " + ", ".join(f"{json.dumps(k)} = {_format_toml_value(v)}" for k, v in value.items()) + " }"
+    raise ValueError(f"{value!r} cannot be represented in TOML (use JSON instead)")
+
+
+def _to_toml(data: dict[str, dict[str, dict[str, Any]]]) -> str:
+    """
+    formats the two levels of tables of the registry as TOML (the values are strings, booleans or inline tables)
+    """
+    lines: list[str] = []
+    for table_name, table in data.items():
+        for name, entries in table.items():
+            lines.append(f"[{table_name}.{json.dumps(name)}]")
+            lines.extend(f"{key} = {_format_toml_value(value)}" for key, value in entries.items())
+            lines.append("")
+    return "\n".join(lines)
+
+
+class ConfigRegistry:
+    """
+    an immutable collection of validated and compiled mapping configurations, which are looked up by name
+    """
+
+    def __init__(
+        self, configs: Mapping[str, MappingConfig], assumptions: Optional[Mapping[str, ChronoAssumption]] = None
+    ):
+        """
+        Validates and compiles the configs; raises a ValueError if any of them is not self-consistent.
+        The assumptions are only used to refer to them by name in to_dict.
+        """
+        self._interned_assumptions: dict[ChronoAssumption, ChronoAssumption] = {}
+        self._plans: dict[MappingConfig, ConversionPlan] = {}
+        self._assumptions = {name: self._intern(assumption) for name, assumption in (assumptions or {}).items()}
+        self._configs: dict[str, MappingConfig] = {}
+        for name, config in configs.items():
+            config = MappingConfig(
+                source=self._intern(config.source),
+                target=self._intern(config.target),
+                is_end=config.is_end,
+                is_gas=config.is_gas,
+            )
+            if config not in self._plans:
+                if not config.is_self_consistent():
+                    errors = ", ".join(config.get_consistency_errors())
+                    raise ValueError(f"config '{name}' is not self-consistent: {errors}")
+                self._plans[config] = compile_config(config)
+            self._configs[name] = self._plans[config].config
+
+    def _intern(self, assumption: ChronoAssumption) -> ChronoAssumption:
+        return self._interned_assumptions.setdefault(assumption, assumption)
+
+    @property
+    def names(self) -> list[str]:
+        """
+        the names of all configs
+        """
+        return list(self._configs.keys())
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._configs
+
+    def __len__(self) -> int:
+        return len(self._configs)
+
+    def get_config(self, name: str) -> MappingConfig:
+        """
+        returns the config with the given name; raises a KeyError if there is no such config
+        """
+        try:
+            return self._configs[name]
+        except KeyError as error:
+            raise KeyError(f"there is no config '{name}' in the registry") from error
+
+    def get_plan(self, name: str) -> ConversionPlan:
+        """
+        returns the compiled plan of the config with the given name; raises a KeyError if there is no such config
+        """
+        return self._plans[self.get_config(name)]
+
+    def get_assumption(self, name: str) -> ChronoAssumption:
+        """
+        returns the (named) assumption; raises a KeyError if there is no such assumption
+        """
+        try:
+            return self._assumptions[name]
+        except KeyError as error:
+            raise KeyError(f"there is no assumption '{name}' in the registry") from error
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        returns a JSON/TOML serializable dictionary; source and target are replaced by the name of an equal assumption
+        """
+        names_by_assumption: dict[ChronoAssumption, str] = {}
+        for name, assumption in self._assumptions.items():
+            names_by_assumption.setdefault(assumption, name)
+        configs: dict[str, dict[str, Any]] = {}
+        for name, config in self._configs.items():
+            config_dict = config.to_dict()
+            for key in ["source", "target"]:
+                assumption_name = names_by_assumption.get(getattr(config, key))
+                if assumption_name is not None:
+                    config_dict[key] = assumption_name
+            configs[name] = config_dict
+        result: dict[str, Any] = {}
+        if self._assumptions:
+            result["assumptions"] = {name: assumption.to_dict() for name, assumption in self._assumptions.items()}
+        result["configs"] = configs
+        return result
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ConfigRegistry":
+        """
+        creates a registry from a dictionary as returned by to_dict.
+        Raises a ValueError if the dictionary cannot be parsed or a config is not self-consistent.
+        """
+        unknown_keys = set(data.keys()) - {"assumptions", "configs"}
+        if unknown_keys:
+            raise ValueError(f"unknown keys for ConfigRegistry: {', '.join(sorted(unknown_keys))}")
+        assumption_dicts = data.get("assumptions", {})
+        config_dicts = data.get("configs")
+        if not isinstance(assumption_dicts, dict) or not isinstance(config_dicts, dict):
+            raise ValueError("'configs' (and 'assumptions') must be tables that map names to their definitions")
+        assumptions = {name: ChronoAssumption.from_dict(value) for name, value in assumption_dicts.items()}
+        configs: dict[str, MappingConfig] = {}
+        for name, config_dict in config_dicts.items():
+            if not isinstance(config_dict, dict):
+                raise ValueError(f"config '{name}' must be a table but is {config_dict.__class__.__name__}")
+            config_dict = dict(config_dict)
+            for key in ["source", "target"]:
+                assumption_name = config_dict.get(key)
+                if isinstance(assumption_name, str):
+                    if assumption_name not in assumptions:
+                        raise ValueError(f"config '{name}' refers to the unknown assumption '{assumption_name}'")
+                    config_dict[key] = assumption_dicts[assumption_name]  # the parsed assumptions are interned later
+            configs[name] = MappingConfig.from_dict(config_dict)
+        return cls(configs, assumptions)
+
+    def to_string(self) -> str:
+        """
+        returns the registry as compact JSON string, e.g. to ship it to worker processes (see from_string)
+        """
+        return json.dumps(self.to_dict(), separators=(",", ":"))
+
+    @classmethod
+    def from_string(cls, value: str) -> "ConfigRegistry":
+        """
+        creates a registry from a JSON string as returned by to_string
+        """
+        return cls.from_dict(json.loads(value))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ConfigRegistry":
+        """
+        loads the registry from a JSON or TOML file (depending on the file extension)
+        """
+        return cls.from_dict(load_file(path))
+
+    def dump(self, path: Union[str, Path]) -> None:
+        """
+        writes the registry to a JSON or TOML file (depending on the file extension), which can be loaded again.
+        Raises a ValueError for TOML files if an assumption has implicit_is_dst=None (TOML has no null).
+        """
+        path = Path(path)
+        if path.suffix.lower() == ".toml":
+            content = _to_toml(self.to_dict())
+        else:
+            content = json.dumps(self.to_dict(), indent=2) + "\n"
+        with open(path, "w", encoding="utf-8") as output_file:
+            output_file.write(content)
@@ -0,0 +1,100 @@
+"""
+contains check_round_trip, which verifies in one pass that entire columns survive the round trip from the source to the
+target system and back (as adapt_to_target and adapt_to_source would map them), e.g. after a migration.
+
+This module requires numpy (install chronomeleon[numpy]).
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from chronomeleon.batch import (
+    SourceValues,
+    check_arguments,
+    convert_source_values_to_utc,
+    convert_target_values_to_utc,
+    convert_utc_values_to_source,
+    convert_utc_values_to_target,
+    source_values_to_arrays,
+    utc_to_local,
+)
+from chronomeleon.mapping import get_lossy_steps
+from chronomeleon.models.mapping_config import MappingConfig
+
+
+@dataclass(frozen=True, kw_only=True)
+class RoundTripReport:
+    """
+    the rows which don't survive the round trip source -> target -> source; all arrays only contain those rows
+    """
+
+    row_indices: npt.NDArray[np.intp]
+    """
+    the (0-based, sorted) indices of the rows which don't survive the round trip
+    """
+
+    source_values: npt.NDArray[np.datetime64]
+    """
+    the source values of those rows as wall clock values in the implicit_timezone of the source (or UTC)
+    """
+
+    target_values: npt.NDArray[np.datetime64]
+    """
+    the same as adapt_many returns for those rows
+    """
+
+    round_tripped_values: npt.NDArray[np.datetime64]
+    """
+    the target values mapped back to the source (as wall clock values, like source_values)
+    """
+
+    lossy_steps: tuple[str, ...]
+    """
+    the steps of the config which cannot be inverted for all values (see get_lossy_steps)
+    """
+
+    @property
+    def count(self) -> int:
+        """
+        the number of rows which don't survive the round trip
+        """
+        return len(self.row_indices)
+
+
+def _get_source_wall_clock_values(source_values: SourceValues, config: MappingConfig) -> npt.NDArray[np.int64]:
+    """
+    returns the source values as wall clock values in the implicit timezone of the source (or UTC), which is how
+    convert_utc_values_to_source returns them
+    """
+    values, is_aware = source_values_to_arrays(source_values, config, to_exclusive_end=False)
+    if config.source.implicit_timezone is not None and is_aware.any():
+        values[is_aware] = utc_to_local(values[is_aware], config.source.implicit_timezone)
+    return values
+
+
+def check_round_trip(source_values: SourceValues, config: MappingConfig) -> RoundTripReport:
+    """
+    Maps all the source values to the target (like adapt_many) and back to the source (like adapt_to_source) and
+    returns the rows whose values differ after the round trip. The values are compared as wall clock values of the
+    source, so e.g. non-existent local times (which are moved by the DST gap) don't survive.
+    Raises a ValueError if the config is not self-consistent or a source value cannot be mapped at all.
+    """
+    check_arguments(source_values, config)
+    target_values = convert_utc_values_to_target(
+        convert_source_values_to_utc(source_values, config), config, to_wall_clock=False
+    )
+    round_tripped_values = convert_utc_values_to_source(convert_target_values_to_utc(target_values, config), config)
+    expected_values = _get_source_wall_clock_values(source_values, config)
+    row_indices = np.flatnonzero(round_tripped_values != expected_values)
+    failed_target_values = target_values[row_indices]
+    if config.target.implicit_timezone is not None and not config.target.is_date_only:
+        failed_target_values = utc_to_local(failed_target_values, config.target.implicit_timezone)
+    return RoundTripReport(
+        row_indices=row_indices,
+        source_values=expected_values[row_indices].astype("datetime64[us]"),
+        target_values=failed_target_values.astype("datetime64[us]"),
+        round_tripped_values=round_tripped_values[row_indices].astype("datetime64[us]"),
+        lossy_steps=tuple(get_lossy_steps(config)),
+    )
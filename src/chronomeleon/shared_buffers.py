@@ -0,0 +1,130 @@
+"""
+contains adapt_buffer, which maps columns of int64 values in (shared) memory buffers without copying them between
+processes, e.g. in the worker processes of a multiprocessing pool or of any other scheduler.
+
+A buffer is a numpy int64 array (e.g. an np.memmap), a multiprocessing.shared_memory.SharedMemory block or the path of
+a file of raw int64 values (as written by ndarray.tofile and read by np.memmap). SharedMemory blocks and paths are
+pickled by name, so passing them to a worker process does not copy any values: Each worker attaches to the buffers and
+maps its slice of the input into the same slice of the output (which may be the input itself).
+The values are microseconds since epoch, just like the int64 columns of adapt_many; NaT (the smallest int64) is passed
+through.
+This module requires numpy (install chronomeleon[numpy]).
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from chronomeleon.batch import adapt_epoch_values
+from chronomeleon.mapping import check_config
+from chronomeleon.models.mapping_config import MappingConfig
+from chronomeleon.parallel import DEFAULT_MIN_PARALLEL_SIZE, get_workers
+
+Buffer = Union[npt.NDArray[np.int64], SharedMemory, str, Path]
+"""
+a 1-dimensional numpy int64 array, a SharedMemory block or the path of a file of raw int64 values (in native byte order)
+"""
+
+DEFAULT_BLOCK_SIZE = 1_000_000
+"""
+the number of values which are mapped at once; this bounds the memory for temporary arrays, no matter how large the
+buffers are
+"""
+
+_BYTES_PER_VALUE = np.dtype(np.int64).itemsize
+
+
+def _open_buffer(buffer: Buffer, writable: bool) -> npt.NDArray[np.int64]:
+    """
+    returns an int64 array which shares the memory of the buffer (it is not copied)
+    """
+    if isinstance(buffer, SharedMemory):
+        return np.ndarray((buffer.size // _BYTES_PER_VALUE,), dtype=np.int64, buffer=buffer.buf)
+    if isinstance(buffer, (str, Path)):
+        if Path(buffer).stat().st_size == 0:
+            return np.zeros(0, dtype=np.int64)  # empty files cannot be memory-mapped
+        return np.memmap(buffer, dtype=np.int64, mode="r+" if writable else "r")
+    if not isinstance(buffer, np.ndarray) or buffer.dtype != np.int64 or buffer.ndim != 1:
+        raise ValueError("buffers must be 1-dimensional int64 arrays, SharedMemory blocks or paths of files")
+    return buffer
+
+
+def get_slices(length: int, parts: int) -> list[slice]:
+    """
+    Splits the positions 0 to length - 1 into (at most) parts disjoint slices of about the same size, e.g. one for
+    each worker that calls adapt_buffer.
+    """
+    if parts < 1:
+        raise ValueError(f"parts must be at least 1 but is {parts}")
+    bounds = np.linspace(0, length, min(parts, max(length, 1)) + 1).astype(np.int64).tolist()
+    return [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def adapt_buffer(  # pylint:disable=too-many-arguments
+    input_buffer: Buffer,
+    output_buffer: Buffer,
+    config: MappingConfig,
+    *,
+    start: int = 0,
+    stop: Optional[int] = None,
+    is_aware: bool = True,
+) -> None:
+    """
+    Maps the values input_buffer[start:stop] into output_buffer[start:stop] (stop defaults to the end of the input).
+    If is_aware, the input values are UTC instants, otherwise naive wall clock values in the implicit_timezone of the
+    source. The output values are those which adapt_many returns: the wall clock values in the implicit_timezone of the
+    target (or UTC). The output buffer may be the input buffer.
+    The values are mapped in blocks of DEFAULT_BLOCK_SIZE, so workers can map disjoint slices of the same (large)
+    buffers concurrently without copying them.
+    Note that the size of SharedMemory blocks may be rounded up to the page size on some platforms (e.g. macOS); pass
+    stop in that case.
+    """
+    check_config(config)
+    input_values = _open_buffer(input_buffer, writable=False)
+    output_values = _open_buffer(output_buffer, writable=True)
+    stop = len(input_values) if stop is None else stop
+    if not 0 <= start <= stop <= min(len(input_values), len(output_values)):
+        lengths = f"{len(input_values)} and {len(output_values)}"
+        raise ValueError(f"the slice {start}:{stop} is not within the input and output buffers of length {lengths}")
+    for block_start in range(start, stop, DEFAULT_BLOCK_SIZE):
+        block = slice(block_start, min(block_start + DEFAULT_BLOCK_SIZE, stop))
+        output_values[block] = adapt_epoch_values(input_values[block], "us", is_aware, config)
+    if isinstance(output_values, np.memmap):
+        output_values.flush()
+
+
+def adapt_buffer_in_parallel(
+    input_buffer: Union[SharedMemory, str, Path],
+    output_buffer: Union[SharedMemory, str, Path],
+    config: MappingConfig,
+    *,
+    workers: Optional[int] = None,
+    is_aware: bool = True,
+) -> None:
+    """
+    Maps the entire input buffer into the output buffer just like adapt_buffer, but each of a pool of worker processes
+    (workers defaults to the number of CPUs) maps one slice. Only the names of the buffers and the config are sent to
+    the workers. Buffers with less than DEFAULT_MIN_PARALLEL_SIZE values (or workers=1) are mapped in the calling
+    process.
+    """
+    if isinstance(input_buffer, np.ndarray) or isinstance(output_buffer, np.ndarray):
+        raise ValueError(
+            "arrays would be copied to the workers; pass SharedMemory blocks or the paths of files instead"
+        )
+    workers = get_workers(workers)
+    length = len(_open_buffer(input_buffer, writable=False))
+    adapt_slice = partial(adapt_buffer, input_buffer, output_buffer, config, is_aware=is_aware)
+    if workers == 1 or length < DEFAULT_MIN_PARALLEL_SIZE:
+        adapt_slice()
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(adapt_slice, start=part.start, stop=part.stop) for part in get_slices(length, workers)
+        ]
+        for future in futures:
+            future.result()
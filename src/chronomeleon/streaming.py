@@ -0,0 +1,293 @@
+"""
+contains a streaming adapter, which maps date(time) columns of (large) CSV or Parquet files chunk by chunk.
+Only one chunk is held in memory at any time, so the memory consumption does not depend on the size of the file.
+
+CSV files are handled with the standard library; the values are expected to be ISO 8601 strings.
+Parquet files require pyarrow and numpy (install chronomeleon[parquet]).
+"""
+
+import csv
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping, Optional, Sequence, Union
+
+from chronomeleon.errors import ConversionError
+from chronomeleon.mapping import ConversionPlan, compile_config
+from chronomeleon.models.mapping_config import MappingConfig
+from chronomeleon.registry import load_file
+
+DEFAULT_CHUNK_SIZE = 100_000
+"""
+the default number of rows that are read, converted and written at once
+"""
+
+
+@dataclass(frozen=True, kw_only=True)
+class StreamStatistics:
+    """
+    statistics about a (finished or ongoing) streaming conversion
+    """
+
+    rows: int
+    """
+    the number of rows that have been converted so far
+    """
+    seconds: float
+    """
+    the time elapsed since the conversion started
+    """
+
+    @property
+    def rows_per_second(self) -> float:
+        """
+        the average throughput of the conversion
+        """
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+ChunkCallback = Callable[[StreamStatistics], None]
+"""
+a function that is called after each chunk, e.g. to report the progress
+"""
+
+
+def check_chunk_size(chunk_size: int) -> None:
+    """
+    raises a ValueError if the chunk_size is less than 1 (with 0, no rows would be read at all)
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1 but is {chunk_size}")
+
+
+def load_column_configs(path: Union[str, Path]) -> dict[str, MappingConfig]:
+    """
+    Loads the mapping configurations per column name from a JSON or TOML file (depending on the file extension).
+    The file has a top level key "columns", which maps each column name to a MappingConfig as in MappingConfig.to_dict.
+    The configurations are validated; a ValueError is raised if any of them is not self-consistent.
+    """
+    data = load_file(path)
+    if not isinstance(data.get("columns"), dict):
+        raise ValueError(f"{path} must contain a 'columns' table that maps column names to mapping configurations")
+    result: dict[str, MappingConfig] = {}
+    for column_name, config_dict in data["columns"].items():
+        config = MappingConfig.from_dict(config_dict)
+        if not config.is_self_consistent():
+            errors = ", ".join(config.get_consistency_errors())
+            raise ValueError(f"config of column '{column_name}' is not self-consistent: {errors}")
+        result[column_name] = config
+    return result
+
+
+def _parse_cell(cell: str) -> Union[date, datetime]:
+    if len(cell) == 10:
+        return date.fromisoformat(cell)
+    return datetime.fromisoformat(cell)
+
+
+def _adapt_cell(cell: str, plan: ConversionPlan) -> str:
+    if not cell:
+        return cell  # empty cells (i.e. missing values) are passed through
+    result = plan(_parse_cell(cell))
+    if plan.config.target.is_date_only:
+        return result.date().isoformat()
+    return result.isoformat()
+
+
+def adapt_chunk(
+    source_values: Sequence[Union[date, datetime]], first_row_index: int, plan: ConversionPlan
+) -> list[datetime]:
+    """
+    maps the values with the plan; raises a ConversionError with the index of the value in the entire input
+    """
+    result: list[datetime] = []
+    for row_index, source_value in enumerate(source_values, start=first_row_index):
+        try:
+            result.append(plan(source_value))
+        except (ValueError, OverflowError) as error:
+            raise ConversionError(row_index, str(error)) from error
+    return result
+
+
+def adapt_csv_chunk(
+    chunk: list[list[str]], first_row_index: int, column_plans: list[tuple[int, str, ConversionPlan]]
+) -> list[list[str]]:
+    """
+    maps the cells of the given CSV rows in place; column_plans contains the column index, name and plan per column.
+    Raises a ConversionError with the index of the (data) row, which could not be mapped.
+    """
+    for row_index, row in enumerate(chunk, start=first_row_index):
+        for column_index, column_name, plan in column_plans:
+            try:
+                row[column_index] = _adapt_cell(row[column_index], plan)
+            except (ValueError, OverflowError) as error:
+                raise ConversionError(row_index, f"column '{column_name}': {error}") from error
+    return chunk
+
+
+def read_csv_header(
+    reader: Iterator[list[str]], column_configs: Mapping[str, MappingConfig]
+) -> tuple[list[str], list[tuple[int, str, ConversionPlan]]]:
+    """
+    reads the header of the CSV file and returns it together with the column index, name and plan per mapped column
+    """
+    header = next(reader, [])
+    missing_columns = set(column_configs.keys()) - set(header)
+    if missing_columns:
+        raise ValueError(f"the CSV file has no column(s) {', '.join(sorted(missing_columns))}")
+    column_plans = [(header.index(name), name, compile_config(config)) for name, config in column_configs.items()]
+    return header, column_plans
+
+
+def _adapt_csv_rows(
+    reader: Iterator[list[str]],
+    writer: Any,
+    column_plans: list[tuple[int, str, ConversionPlan]],
+    chunk_size: int,
+    on_chunk: Optional[ChunkCallback],
+) -> StreamStatistics:
+    start = time.perf_counter()
+    rows = 0
+    while chunk := list(islice(reader, chunk_size)):
+        writer.writerows(adapt_csv_chunk(chunk, rows, column_plans))
+        rows += len(chunk)
+        if on_chunk is not None:
+            on_chunk(StreamStatistics(rows=rows, seconds=time.perf_counter() - start))
+    return StreamStatistics(rows=rows, seconds=time.perf_counter() - start)
+
+
+def adapt_csv(  # pylint:disable=too-many-arguments
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    column_configs: Mapping[str, MappingConfig],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    delimiter: str = ",",
+    on_chunk: Optional[ChunkCallback] = None,
+) -> StreamStatistics:
+    """
+    Maps the columns of the CSV file (with header) at input_path and writes the result to output_path.
+    Only the columns in column_configs are modified, all other columns are copied as they are.
+    The values have to be ISO 8601 dates or datetimes; empty values are passed through.
+    Raises a ConversionError with the index of the (data) row, if a value cannot be mapped.
+    """
+    check_chunk_size(chunk_size)
+    with (
+        open(input_path, "r", encoding="utf-8", newline="") as input_file,
+        open(output_path, "w", encoding="utf-8", newline="") as output_file,
+    ):
+        reader = csv.reader(input_file, delimiter=delimiter)
+        writer = csv.writer(output_file, delimiter=delimiter)
+        header, column_plans = read_csv_header(reader, column_configs)
+        writer.writerow(header)
+        return _adapt_csv_rows(reader, writer, column_plans, chunk_size, on_chunk)
+
+
+def _get_adapted_type(column_type: Any, config: MappingConfig) -> Any:
+    """
+    returns the pyarrow type of a mapped column: dates, if the target is_date_only, and naive timestamps otherwise
+    (in ns, if the column is in ns, and in us otherwise)
+    """
+    import pyarrow as pa  # type: ignore[import-untyped,import-not-found,unused-ignore] # pylint:disable=import-outside-toplevel
+
+    if not pa.types.is_timestamp(column_type) and not pa.types.is_date(column_type):
+        raise ValueError(f"column must be a timestamp or date column but is {column_type}")
+    if config.target.is_date_only:
+        return pa.date32()
+    return pa.timestamp("ns" if pa.types.is_timestamp(column_type) and column_type.unit == "ns" else "us")
+
+
+def _get_adapted_schema(schema: Any, column_configs: Mapping[str, MappingConfig]) -> Any:
+    """
+    returns the pyarrow schema of the output: the mapped columns are naive timestamps or dates (if the target
+    is_date_only), all other columns are the same as in the input
+    """
+    import pyarrow as pa  # type: ignore[import-untyped,import-not-found,unused-ignore] # pylint:disable=import-outside-toplevel
+
+    return pa.schema(
+        [
+            (
+                field.with_type(_get_adapted_type(field.type, column_configs[field.name]))
+                if field.name in column_configs
+                else field
+            )
+            for field in schema
+        ],
+        metadata=schema.metadata,
+    )
+
+
+def _adapt_record_batch(batch: Any, column_configs: Mapping[str, MappingConfig], schema: Any) -> Any:
+    """
+    maps those columns of the pyarrow record batch, for which there is a config (schema is the adapted schema)
+    """
+    # pylint:disable=import-outside-toplevel
+    import pyarrow as pa  # type: ignore[import-untyped,import-not-found,unused-ignore]
+
+    from chronomeleon.arrow import adapt_arrow
+
+    return pa.RecordBatch.from_arrays(
+        [
+            adapt_arrow(column, column_configs[name], naive=True) if name in column_configs else column
+            for name, column in zip(batch.schema.names, batch.columns)
+        ],
+        schema=schema,
+    )
+
+
+def adapt_parquet(
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    column_configs: Mapping[str, MappingConfig],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_chunk: Optional[ChunkCallback] = None,
+) -> StreamStatistics:
+    """
+    Maps the timestamp or date columns of the Parquet file at input_path and writes the result to output_path.
+    Only the columns in column_configs are modified, all other columns are copied as they are.
+    The mapped columns are written as naive timestamps (wall clock in the target's implicit_timezone or UTC; in ns for
+    columns in ns and in us otherwise) or as dates, if the target is_date_only. Nulls are passed through.
+    """
+    check_chunk_size(chunk_size)
+    try:
+        # pylint:disable=import-outside-toplevel
+        import pyarrow.parquet as pq  # type: ignore[import-untyped,import-not-found,unused-ignore]
+    except ImportError as import_error:
+        raise ImportError("adapt_parquet requires pyarrow; install chronomeleon[parquet]") from import_error
+    for config in column_configs.values():
+        compile_config(config)  # raises if the config is not self-consistent
+    start = time.perf_counter()
+    rows = 0
+    parquet_file = pq.ParquetFile(input_path)
+    missing_columns = set(column_configs.keys()) - set(parquet_file.schema_arrow.names)
+    if missing_columns:
+        raise ValueError(f"{input_path} has no column(s) {', '.join(sorted(missing_columns))}")
+    schema = _get_adapted_schema(parquet_file.schema_arrow, column_configs)
+    # the writer is created up front, so that there's an output file (with the schema) even if the input has no rows
+    with pq.ParquetWriter(output_path, schema) as writer:
+        for batch in parquet_file.iter_batches(batch_size=chunk_size):
+            writer.write_batch(_adapt_record_batch(batch, column_configs, schema))
+            rows += batch.num_rows
+            if on_chunk is not None:
+                on_chunk(StreamStatistics(rows=rows, seconds=time.perf_counter() - start))
+    return StreamStatistics(rows=rows, seconds=time.perf_counter() - start)
+
+
+def adapt_file(
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    column_configs: Mapping[str, MappingConfig],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_chunk: Optional[ChunkCallback] = None,
+) -> StreamStatistics:
+    """
+    maps a CSV or Parquet file, depending on the file extension of the input_path; see adapt_csv and adapt_parquet
+    """
+    check_chunk_size(chunk_size)
+    if Path(input_path).suffix.lower() in {".parquet", ".pq"}:
+        return adapt_parquet(input_path, output_path, column_configs, chunk_size=chunk_size, on_chunk=on_chunk)
+    return adapt_csv(input_path, output_path, column_configs, chunk_size=chunk_size, on_chunk=on_chunk)
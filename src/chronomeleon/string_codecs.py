@@ -0,0 +1,282 @@
+"""
+contains adapt_strings, which maps entire columns of date(time) strings to strings: it parses the source values, maps
+them (see adapt_many) and formats the results, instead of calling strptime, adapt_to_target and strftime for each value.
+
+The format of the strings is the string_format of the ChronoAssumption of the source and the target, respectively:
+* 'iso' (the default): ISO 8601 as datetime.fromisoformat parses it, e.g. '2024-01-31' or '2024-01-31T23:59:59+01:00'
+* 'sap_dats': SAP DATS, e.g. '20240131'
+* 'sap_dats_tims': SAP DATS and TIMS in one string, e.g. '20240131235959'
+* any other value is a strptime/strftime pattern, e.g. '%d.%m.%Y'; those strings are parsed and formatted one by one.
+
+Sentinels are not mapped but passed through as open-ended ranges: Values on 9999-12-31 (e.g. '99991231') are an open
+end, values on 0001-01-01 and strings of zeros in the format (e.g. '00000000' or '0000-00-00') an open start. They're
+formatted as the respective sentinel of the target format, e.g. '99991231' or '9999-12-31T23:59:59'.
+Empty strings and None are missing values, which are None in the result.
+This module requires numpy (install chronomeleon[numpy]).
+"""
+
+import re
+import warnings
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from typing import Optional, Sequence, Union
+
+import numpy as np
+import numpy.typing as npt
+import pytz
+
+from chronomeleon.batch import SourceValues, check_arguments
+from chronomeleon.compact import DatetimeArray, adapt_compact
+from chronomeleon.errors import ConversionError
+from chronomeleon.models.chrono_assumption import ISO_FORMAT, SAP_DATS_FORMAT, SAP_DATS_TIMS_FORMAT
+from chronomeleon.models.mapping_config import MappingConfig
+
+_OPEN_START_DATE = date(1, 1, 1)
+_OPEN_END_DATE = date(9999, 12, 31)
+_OPEN_END = datetime(9999, 12, 31, 23, 59, 59)
+
+_PLACEHOLDER = datetime(2000, 1, 1, tzinfo=pytz.utc)
+"""
+replaces sentinels and missing values in the source values; it can be mapped with every config
+"""
+
+_SAP_LENGTHS = {SAP_DATS_FORMAT: 8, SAP_DATS_TIMS_FORMAT: 14}
+
+_ISO_ZEROS = frozenset({"0000-00-00", "0000-00-00T00:00:00", "0000-00-00 00:00:00"})
+
+_NAIVE_ISO = re.compile(r"\d{4}-\d{2}-\d{2}([T ][0-9:.]+)?")
+"""
+the shape of the naive ISO 8601 strings which are parsed with numpy (which would also parse e.g. 'today' or 'NaT')
+"""
+
+
+@dataclass(frozen=True, kw_only=True)
+class _ParsedStrings:
+    """
+    the parsed source values; the rows which are missing or sentinels contain placeholders
+    """
+
+    values: SourceValues
+    """
+    the parsed values, which can be mapped with adapt_compact
+    """
+
+    is_missing: npt.NDArray[np.bool_]
+    """
+    the rows which are None or empty strings
+    """
+
+    is_open_start: npt.NDArray[np.bool_]
+    """
+    the rows which are open starts (0001-01-01 or only zeros)
+    """
+
+    is_open_end: npt.NDArray[np.bool_]
+    """
+    the rows which are open ends (9999-12-31)
+    """
+
+
+def _parse_string(string: str, string_format: str) -> Union[date, datetime]:
+    """
+    parses a single (non-empty) string in the given format
+    """
+    if string_format == ISO_FORMAT:
+        return date.fromisoformat(string) if len(string) == 10 else datetime.fromisoformat(string)
+    if string_format in _SAP_LENGTHS:
+        if len(string) != _SAP_LENGTHS[string_format] or not string.isdigit():
+            raise ValueError(f"'{string}' is not a valid {string_format} value")
+        day = date(int(string[:4]), int(string[4:6]), int(string[6:8]))
+        if string_format == SAP_DATS_FORMAT:
+            return day
+        return datetime.combine(day, time(int(string[8:10]), int(string[10:12]), int(string[12:])))
+    return datetime.strptime(string, string_format)
+
+
+def _get_zeros(string_format: str) -> frozenset[str]:
+    """
+    returns the strings of zeros in the given format (e.g. '00000000' or '0000-00-00'), which are open starts
+    """
+    if string_format == ISO_FORMAT:
+        return _ISO_ZEROS
+    if string_format in _SAP_LENGTHS:
+        return frozenset({"0" * _SAP_LENGTHS[string_format]})
+    return frozenset({re.sub(r"\d", "0", datetime.min.strftime(string_format.replace("%Y", "0001")))})
+
+
+def _parse_one_by_one(strings: Sequence[Optional[str]], string_format: str) -> _ParsedStrings:
+    """
+    parses the strings one by one; raises a ConversionError with the index of the first string that cannot be parsed
+    """
+    zeros = _get_zeros(string_format)
+    values: list[Union[date, datetime]] = []
+    is_missing = np.zeros(len(strings), dtype=np.bool_)
+    is_open_start = np.zeros(len(strings), dtype=np.bool_)
+    is_open_end = np.zeros(len(strings), dtype=np.bool_)
+    for row_index, string in enumerate(strings):
+        if not string:
+            is_missing[row_index] = True
+        elif string in zeros:
+            is_open_start[row_index] = True
+        else:
+            try:
+                value = _parse_string(string, string_format)
+            except (ValueError, TypeError) as error:
+                raise ConversionError(row_index, str(error)) from error
+            day = value.date() if isinstance(value, datetime) else value
+            is_open_start[row_index] = day == _OPEN_START_DATE
+            is_open_end[row_index] = day == _OPEN_END_DATE
+            if not (is_open_start[row_index] or is_open_end[row_index]):
+                values.append(value)
+                continue
+        values.append(_PLACEHOLDER)
+    return _ParsedStrings(values=values, is_missing=is_missing, is_open_start=is_open_start, is_open_end=is_open_end)
+
+
+def _get_sentinel_masks(days: npt.NDArray[np.datetime64]) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+    return days == np.datetime64(_OPEN_START_DATE), days == np.datetime64(_OPEN_END_DATE)
+
+
+def _parse_iso_in_bulk(strings: Sequence[Optional[str]]) -> Optional[_ParsedStrings]:
+    """
+    parses naive ISO 8601 strings with numpy; returns None if they have to be parsed one by one (because they contain
+    UTC offsets, zeros or both dates and datetimes) or if they cannot be parsed at all
+    """
+    is_empty = np.array([not string for string in strings], dtype=np.bool_)
+    if not all(_NAIVE_ISO.fullmatch(string) for string in strings if string):
+        return None
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")  # numpy only warns about UTC offsets (and ignores them)
+            values = np.array(strings, dtype="datetime64")
+    except (ValueError, TypeError, Warning):
+        return None
+    unit = np.datetime_data(values.dtype)[0]
+    if unit != "D" and (unit not in {"h", "m", "s", "ms", "us"} or any(len(s) == 10 for s in strings if s)):
+        return None
+    is_missing = np.isnat(values)
+    if (is_missing & ~is_empty).any():
+        return None
+    is_open_start, is_open_end = _get_sentinel_masks(values.astype("datetime64[D]"))
+    if unit != "D":
+        values = values.astype("datetime64[us]")
+    values[is_missing | is_open_start | is_open_end] = np.datetime64("2000-01-01")
+    return _ParsedStrings(values=values, is_missing=is_missing, is_open_start=is_open_start, is_open_end=is_open_end)
+
+
+def _sap_numbers_to_values(
+    date_numbers: npt.NDArray[np.int64], time_numbers: npt.NDArray[np.int64]
+) -> Optional[npt.NDArray[np.datetime64]]:
+    """
+    returns the datetime64[us] values of the DATS (YYYYMMDD) and TIMS (HHMMSS) numbers or None if any of them is invalid
+    """
+    years, month_days = np.divmod(date_numbers, 10_000)
+    months, days = np.divmod(month_days, 100)
+    month_starts = ((years - 1970) * 12 + months - 1).astype("datetime64[M]").astype("datetime64[D]")
+    next_month_starts = ((years - 1970) * 12 + months).astype("datetime64[M]").astype("datetime64[D]")
+    hours, minute_seconds = np.divmod(time_numbers, 10_000)
+    minutes, seconds = np.divmod(minute_seconds, 100)
+    is_valid = (years >= 1) & (months >= 1) & (months <= 12) & (days >= 1)
+    is_valid &= days <= (next_month_starts - month_starts).astype(np.int64)
+    if not (is_valid & (hours < 24) & (minutes < 60) & (seconds < 60)).all():
+        return None
+    time_of_day = ((hours * 60 + minutes) * 60 + seconds) * 1_000_000
+    values: npt.NDArray[np.datetime64] = (month_starts + (days - 1)).astype("datetime64[us]") + time_of_day
+    return values
+
+
+def _parse_sap_in_bulk(strings: Sequence[Optional[str]], string_format: str) -> Optional[_ParsedStrings]:
+    """
+    parses SAP DATS (and TIMS) strings with numpy; returns None if they have to be parsed one by one (because there
+    are missing or invalid values)
+    """
+    length = _SAP_LENGTHS[string_format]
+    try:
+        # int() would accept e.g. ' 0000000' or '+0000000', too
+        if not all(string is not None and len(string) == length and string.isdigit() for string in strings):
+            return None
+        numbers = np.fromiter(map(int, strings), dtype=np.int64, count=len(strings))  # type: ignore[arg-type]
+    except (ValueError, TypeError):
+        return None
+    time_numbers = np.zeros_like(numbers)
+    if string_format == SAP_DATS_TIMS_FORMAT:
+        numbers, time_numbers = np.divmod(numbers, 1_000_000)
+    zeros = _get_zeros(string_format)
+    is_open_start = np.array([string in zeros for string in strings], dtype=np.bool_)  # not e.g. '00000000123456'
+    is_open_end = numbers == 99991231
+    numbers[is_open_start | is_open_end] = 20000101
+    values = _sap_numbers_to_values(numbers, time_numbers)
+    if values is None:
+        return None
+    if string_format == SAP_DATS_FORMAT:
+        values = values.astype("datetime64[D]")  # dates, not midnights
+    is_missing = np.zeros(len(strings), dtype=np.bool_)
+    return _ParsedStrings(values=values, is_missing=is_missing, is_open_start=is_open_start, is_open_end=is_open_end)
+
+
+def _parse_strings(strings: Sequence[Optional[str]], string_format: str) -> _ParsedStrings:
+    parsed: Optional[_ParsedStrings] = None
+    if string_format == ISO_FORMAT:
+        parsed = _parse_iso_in_bulk(strings)
+    elif string_format in _SAP_LENGTHS:
+        parsed = _parse_sap_in_bulk(strings, string_format)
+    return parsed or _parse_one_by_one(strings, string_format)
+
+
+def _format_sap(wall_clock_values: npt.NDArray[np.datetime64], string_format: str) -> list[str]:
+    days = wall_clock_values.astype("datetime64[D]")
+    months = days.astype("datetime64[M]")
+    years = months.astype("datetime64[Y]").astype(np.int64) + 1970
+    numbers = (years * 100 + months.astype(np.int64) % 12 + 1) * 100 + (days - months).astype(np.int64) + 1
+    if string_format == SAP_DATS_FORMAT:
+        return [f"{number:08d}" for number in numbers.tolist()]
+    seconds = (wall_clock_values - days).astype("timedelta64[s]").astype(np.int64)
+    hours, minute_seconds = np.divmod(seconds, 3600)
+    numbers = (numbers * 100 + hours) * 10_000 + minute_seconds // 60 * 100 + minute_seconds % 60
+    return [f"{number:014d}" for number in numbers.tolist()]
+
+
+def _format_strings(values: DatetimeArray, string_format: str, is_date_only: bool) -> list[Optional[str]]:
+    if string_format in _SAP_LENGTHS:
+        return list(_format_sap(values.to_numpy(wall_clock=True), string_format))
+    if string_format == ISO_FORMAT:
+        if is_date_only:
+            days: list[Optional[str]] = np.datetime_as_string(values.to_numpy(wall_clock=True), unit="D").tolist()
+            return days
+        return list(values.isoformat())
+    return [None if value is None else value.strftime(string_format) for value in values]
+
+
+def _get_sentinels(string_format: str, is_date_only: bool) -> tuple[str, str]:
+    """
+    returns the open start and the open end in the given format
+    """
+    if string_format == ISO_FORMAT:
+        if is_date_only:
+            return _OPEN_START_DATE.isoformat(), _OPEN_END_DATE.isoformat()
+        return datetime.min.isoformat(), _OPEN_END.isoformat()
+    if string_format in _SAP_LENGTHS:
+        return "0" * _SAP_LENGTHS[string_format], "99991231235959"[: _SAP_LENGTHS[string_format]]
+    # strftime doesn't pad years before 1000 on every platform
+    return datetime.min.strftime(string_format.replace("%Y", "0001")), _OPEN_END.strftime(string_format)
+
+
+def adapt_strings(source_values: Sequence[Optional[str]], config: MappingConfig) -> list[Optional[str]]:
+    """
+    Parses the source strings in the string_format of the source, maps them just like adapt_to_target would and
+    formats the results in the string_format of the target (both default to ISO 8601).
+    Sentinels (e.g. '99991231' or '0000-00-00') are passed through as open-ended ranges and missing values as None
+    (see the module docstring). Raises a ConversionError with the index of the first string that cannot be parsed.
+    """
+    check_arguments(source_values, config)  # type: ignore[arg-type]
+    target_format = config.target.string_format or ISO_FORMAT
+    parsed = _parse_strings(source_values, config.source.string_format or ISO_FORMAT)
+    result: list[Optional[str]] = [None] * len(source_values)
+    is_value = ~(parsed.is_missing | parsed.is_open_start | parsed.is_open_end)
+    if is_value.any():
+        result = _format_strings(adapt_compact(parsed.values, config), target_format, config.target.is_date_only)
+    open_start, open_end = _get_sentinels(target_format, config.target.is_date_only)
+    for mask, string in [(parsed.is_missing, None), (parsed.is_open_start, open_start), (parsed.is_open_end, open_end)]:
+        for row_index in np.flatnonzero(mask).tolist():
+            result[row_index] = string
+    return result
@@ -0,0 +1,251 @@
+"""
+contains the TransitionIndex, a precomputed table of UTC offset transitions of a timezone.
+
+It allows converting between local (wall clock) and UTC values with a single bisect and an addition instead of going
+through pytz' localize and astimezone for every single value.
+All values are integers: microseconds since 1970-01-01T00:00:00 (in UTC or in local time, respectively).
+
+The index is the timezone backend of chronomeleon. It can be built from
+* pytz timezones (from their transition tables),
+* fixed offsets (datetime.timezone, pytz.utc or pytz' static timezones) and
+* any other tzinfo, e.g. zoneinfo.ZoneInfo (by probing its UTC offset between PROBE_START and PROBE_END).
+Localization uses the semantics of pytz' localize (see local_to_utc) for all of them.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta, tzinfo
+from functools import lru_cache
+from typing import Optional
+
+from chronomeleon import instrumentation
+
+EPOCH = datetime(1970, 1, 1)
+ONE_MICROSECOND = timedelta(microseconds=1)
+MICROSECONDS_PER_HOUR = 3_600_000_000
+MICROSECONDS_PER_DAY = 24 * MICROSECONDS_PER_HOUR
+MIN_MICROSECONDS = (datetime.min - EPOCH) // ONE_MICROSECOND
+MAX_MICROSECONDS = (datetime.max - EPOCH) // ONE_MICROSECOND
+
+_SIX_HOURS = 6 * MICROSECONDS_PER_HOUR
+_ONE_SECOND = 1_000_000
+_PROBE_STEP = 7 * MICROSECONDS_PER_DAY
+
+PROBE_START = datetime(1800, 1, 1)
+"""
+the UTC offsets of timezones without transition table (e.g. zoneinfo.ZoneInfo) are probed from this (UTC) datetime on
+"""
+PROBE_END = datetime(2200, 1, 1)
+"""
+the UTC offsets of timezones without transition table are probed until this (UTC) datetime; the last offset applies
+to all later values
+"""
+
+
+def to_microseconds(value: datetime) -> int:
+    """
+    returns the microseconds since epoch of the given naive datetime
+    """
+    return (value - EPOCH) // ONE_MICROSECOND
+
+
+def from_microseconds(value: int) -> datetime:
+    """
+    returns the naive datetime for the given microseconds since epoch
+    """
+    return EPOCH + timedelta(microseconds=value)
+
+
+@dataclass(frozen=True, kw_only=True)
+class TransitionIndex:
+    """
+    The sorted UTC instants at which the UTC offset of a timezone changes, together with the offsets themselves.
+    Use get_transition_index to get the (cached) index of a timezone.
+    """
+
+    zone: str
+    """
+    the name of the timezone, e.g. 'Europe/Berlin'
+    """
+
+    transitions: tuple[int, ...]
+    """
+    the sorted UTC instants (microseconds since epoch) from which on the respective offset applies
+    """
+
+    offsets: tuple[int, ...]
+    """
+    the UTC offsets (in microseconds) which apply from the respective transition on
+    """
+
+    is_dst: tuple[bool, ...]
+    """
+    True if and only if the respective offset is a daylight saving time offset
+    """
+
+    tzinfos: tuple[tzinfo, ...]
+    """
+    the tzinfo objects which represent the respective offset (for pytz e.g. CET or CEST; otherwise the timezone itself)
+    """
+
+    uses_fold: bool = False
+    """
+    True if the tzinfo objects rely on the fold attribute (PEP 495) to tell the repeated wall clock times apart, which
+    happen twice when the clocks are turned back. pytz does not; it uses a separate tzinfo per offset instead.
+    """
+
+    def get_position(self, utc_value: int) -> int:
+        """
+        returns the position of the transition which applies at the given UTC instant
+        """
+        return max(bisect_right(self.transitions, utc_value) - 1, 0)
+
+    def utc_to_local(self, utc_value: int) -> int:
+        """
+        returns the local (wall clock) value of the given UTC instant
+        """
+        return utc_value + self.offsets[self.get_position(utc_value)]
+
+    def local_to_utc(self, local_value: int, is_dst: Optional[bool] = False) -> int:
+        """
+        returns the UTC instant of the given local (wall clock) value.
+        is_dst decides, just like in pytz' localize, how ambiguous and non-existent local times are resolved:
+        False: as standard time, True: as daylight saving time, None: a ValueError is raised.
+        """
+        # Just like pytz, we look up the offsets that are valid one day before and one day after the local value.
+        # Each offset leads to a candidate UTC instant, which is valid if it maps back to the same local value.
+        candidates: list[tuple[int, bool]] = []  # the candidate and whether its offset is DST
+        for delta in (-MICROSECONDS_PER_DAY, MICROSECONDS_PER_DAY):
+            position = self.get_position(local_value + delta)
+            candidate = local_value - self.offsets[position]
+            if self.offsets[self.get_position(candidate)] == self.offsets[position]:
+                candidates.append((candidate, self.is_dst[position]))
+        if len(candidates) == 2 and candidates[0][0] == candidates[1][0]:
+            del candidates[1]
+        if len(candidates) == 1:
+            return candidates[0][0]
+        instrumentation.count_branch(
+            instrumentation.AMBIGUOUS_LOCAL_TIME if candidates else instrumentation.NON_EXISTENT_LOCAL_TIME
+        )
+        if is_dst is None:
+            kind = "ambiguous" if candidates else "non-existent"
+            raise ValueError(f"{from_microseconds(local_value)} is {kind} in {self.zone}")
+        if not candidates:
+            # Just like pytz, we use the offset from 6 hours before (after) the gap.
+            if is_dst:
+                return self.local_to_utc(local_value + _SIX_HOURS, is_dst) - _SIX_HOURS
+            return self.local_to_utc(local_value - _SIX_HOURS, is_dst) + _SIX_HOURS
+        preferred = [candidate for candidate, candidate_is_dst in candidates if candidate_is_dst == is_dst]
+        if len(preferred) == 1:
+            return preferred[0]
+        # a pathological case: the offsets differ, but both are (no) DST; pytz takes the earliest (latest) instant
+        return min(c for c, _ in candidates) if is_dst else max(c for c, _ in candidates)
+
+    def to_aware_datetime(self, utc_value: int) -> datetime:
+        """
+        returns the aware datetime in this timezone (with the same tzinfo and fold as astimezone would use)
+        """
+        position = self.get_position(utc_value)
+        local_value = utc_value + self.offsets[position]
+        result = from_microseconds(local_value).replace(tzinfo=self.tzinfos[position])
+        if self.uses_fold and position > 0 and local_value < self.transitions[position] + self.offsets[position - 1]:
+            # the wall clock time has already been there before the clocks were turned back: it's the second one
+            return result.replace(fold=1)
+        return result
+
+
+def get_timezone_name(timezone: tzinfo) -> str:
+    """
+    returns the name of the timezone, e.g. 'Europe/Berlin' (for pytz and zoneinfo) or 'UTC+01:00' (for fixed offsets)
+    """
+    name = getattr(timezone, "zone", None) or getattr(timezone, "key", None)  # pytz or zoneinfo
+    return str(name) if name is not None else str(timezone)
+
+
+def _build_pytz_index(timezone: tzinfo) -> TransitionIndex:
+    # pylint:disable=protected-access
+    transition_infos = timezone._transition_info  # type: ignore[attr-defined]
+    return TransitionIndex(
+        zone=get_timezone_name(timezone),
+        transitions=tuple(to_microseconds(t) for t in timezone._utc_transition_times),  # type: ignore[attr-defined]
+        offsets=tuple(info[0] // ONE_MICROSECOND for info in transition_infos),
+        is_dst=tuple(bool(info[1]) for info in transition_infos),
+        tzinfos=tuple(timezone._tzinfos[info] for info in transition_infos),  # type: ignore[attr-defined]
+    )
+
+
+def _get_fixed_offset(timezone: tzinfo) -> Optional[timedelta]:
+    """
+    returns the UTC offset, if the timezone is a fixed offset (and None otherwise)
+    """
+    if hasattr(timezone, "_utc_transition_times"):  # pytz.tzinfo.DstTzInfo
+        return None
+    # a fixed offset doesn't depend on the datetime; pytz.utc, StaticTzInfo and datetime.timezone accept None
+    try:
+        return timezone.utcoffset(None)
+    except (TypeError, AttributeError):  # e.g. zoneinfo.ZoneInfo requires a datetime
+        return None
+
+
+def _probe_offset(timezone: tzinfo, utc_value: int) -> tuple[int, bool]:
+    """
+    returns the UTC offset and whether it's DST at the given UTC instant
+    """
+    local = timezone.fromutc(from_microseconds(utc_value).replace(tzinfo=timezone))
+    return local.utcoffset() // ONE_MICROSECOND, bool(local.dst())  # type: ignore[operator]
+
+
+def _build_probed_index(timezone: tzinfo) -> TransitionIndex:
+    """
+    builds the index of a timezone without accessible transition table by probing its UTC offset once per week.
+    The exact instant of each change is found by bisection (to the second, because no timezone changes in between).
+    If the offset changes twice within one week (and back to the original offset), the change is missed.
+    """
+    start, end = to_microseconds(PROBE_START), to_microseconds(PROBE_END)
+    transitions, offsets, is_dst = [MIN_MICROSECONDS], [], []
+    offset_and_dst = _probe_offset(timezone, start)
+    offsets.append(offset_and_dst[0])
+    is_dst.append(offset_and_dst[1])
+    for utc_value in range(start + _PROBE_STEP, end, _PROBE_STEP):
+        low = utc_value - _PROBE_STEP
+        while _probe_offset(timezone, utc_value) != offset_and_dst:
+            high = utc_value  # the (next) change happens in (low, high]
+            while high - low > _ONE_SECOND:
+                middle = low + max((high - low) // 2 // _ONE_SECOND, 1) * _ONE_SECOND
+                if _probe_offset(timezone, middle) == offset_and_dst:
+                    low = middle
+                else:
+                    high = middle
+            offset_and_dst = _probe_offset(timezone, high)
+            transitions.append(high)
+            offsets.append(offset_and_dst[0])
+            is_dst.append(offset_and_dst[1])
+            low = high
+    return TransitionIndex(
+        zone=get_timezone_name(timezone),
+        transitions=tuple(transitions),
+        offsets=tuple(offsets),
+        is_dst=tuple(is_dst),
+        tzinfos=(timezone,) * len(transitions),
+        uses_fold=True,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_transition_index(timezone: tzinfo) -> TransitionIndex:
+    """
+    returns the transition index of the given timezone (pytz, zoneinfo.ZoneInfo or datetime.timezone); it is built
+    only once per timezone
+    """
+    if hasattr(timezone, "_utc_transition_times"):  # pytz.tzinfo.DstTzInfo
+        return _build_pytz_index(timezone)
+    fixed_offset = _get_fixed_offset(timezone)
+    if fixed_offset is not None:  # datetime.timezone, pytz.tzinfo.StaticTzInfo or pytz.UTC
+        return TransitionIndex(
+            zone=get_timezone_name(timezone),
+            transitions=(MIN_MICROSECONDS,),
+            offsets=(fixed_offset // ONE_MICROSECOND,),
+            is_dst=(False,),
+            tzinfos=(timezone,),
+        )
+    return _build_probed_index(timezone)
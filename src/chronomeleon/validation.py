@@ -0,0 +1,129 @@
+"""
+contains validate_many, a mode of adapt_many for (large) datasets with bad values: Instead of raising on the first value
+that cannot be mapped, it maps all valid values and reports the invalid ones per kind of error, in a single pass.
+
+This module requires numpy (install chronomeleon[numpy]).
+"""
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from chronomeleon.batch import (
+    RowErrors,
+    SourceValues,
+    check_arguments,
+    convert_source_values_to_utc,
+    convert_utc_values_to_target,
+)
+from chronomeleon.errors import ErrorKind
+from chronomeleon.models.mapping_config import MappingConfig
+
+DEFAULT_MAX_SAMPLES = 5
+"""
+the default number of sample rows per kind of error
+"""
+
+
+@dataclass(frozen=True, kw_only=True)
+class ErrorSummary:
+    """
+    the rows which cannot be mapped for the same reason
+    """
+
+    kind: ErrorKind
+    """
+    the reason why the rows cannot be mapped
+    """
+
+    row_indices: npt.NDArray[np.intp]
+    """
+    the (0-based, sorted) indices of all rows with this error
+    """
+
+    samples: tuple[tuple[int, str], ...]
+    """
+    the index and the representation of the source value of the first rows with this error
+    """
+
+    @property
+    def count(self) -> int:
+        """
+        the number of rows with this error
+        """
+        return len(self.row_indices)
+
+
+@dataclass(frozen=True, kw_only=True)
+class ValidationReport:
+    """
+    the result of validate_many: the mapped values and the errors of the values which cannot be mapped
+    """
+
+    values: npt.NDArray[np.datetime64]
+    """
+    the same as adapt_many returns for the valid rows and NaT for the invalid ones
+    """
+
+    is_valid: npt.NDArray[np.bool_]
+    """
+    a mask which is True where the source value could be mapped
+    """
+
+    errors: dict[ErrorKind, ErrorSummary]
+    """
+    the invalid rows per kind of error (only the kinds that occurred); each row has only one (the first) error
+    """
+
+    @property
+    def error_count(self) -> int:
+        """
+        the number of rows which cannot be mapped
+        """
+        return sum(summary.count for summary in self.errors.values())
+
+    def summary(self) -> str:
+        """
+        returns a human-readable summary of the errors, e.g. for logging
+        """
+        lines = [f"{self.error_count} of {len(self.is_valid)} values cannot be mapped"]
+        for summary in self.errors.values():
+            samples = ", ".join(f"row {row_index}: {value}" for row_index, value in summary.samples)
+            lines.append(f"{summary.kind.value}: {summary.count} (e.g. {samples})")
+        return "\n".join(lines)
+
+
+def _get_samples(source_values: SourceValues, row_indices: npt.NDArray[np.intp], max_samples: int) -> list[str]:
+    if isinstance(source_values, np.ndarray):
+        return [str(value) for value in source_values[row_indices[:max_samples]]]
+    sequence: Sequence[object] = source_values
+    return [repr(sequence[row_index]) for row_index in row_indices[:max_samples]]
+
+
+def validate_many(
+    source_values: SourceValues, config: MappingConfig, max_samples: int = DEFAULT_MAX_SAMPLES
+) -> ValidationReport:
+    """
+    Maps all the source values just like adapt_many, but never raises because of a single value. Instead, the values
+    which cannot be mapped are NaT in the result and reported per kind of error (with up to max_samples sample rows).
+    Raises a ValueError only if the config is not self-consistent or the source values are not a supported column type.
+    """
+    check_arguments(source_values, config)
+    row_errors = RowErrors()
+    utc_values = convert_source_values_to_utc(source_values, config, row_errors)
+    values = convert_utc_values_to_target(utc_values, config, errors=row_errors).astype("datetime64[us]")
+    is_valid = np.ones(len(values), dtype=np.bool_)
+    errors: dict[ErrorKind, ErrorSummary] = {}
+    for kind in ErrorKind:  # in the order of the enum, not in the order in which the errors occurred
+        if kind not in row_errors.masks:
+            continue
+        row_indices = np.flatnonzero(row_errors.masks[kind])
+        samples = _get_samples(source_values, row_indices, max_samples)
+        errors[kind] = ErrorSummary(
+            kind=kind, row_indices=row_indices, samples=tuple(zip(row_indices.tolist(), samples))
+        )
+        is_valid[row_indices] = False
+    values[~is_valid] = np.datetime64("NaT")
+    return ValidationReport(values=values, is_valid=is_valid, errors=errors)
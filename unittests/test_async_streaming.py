@@ -0,0 +1,131 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Any, AsyncIterator, Optional, Union
+
+import pytest
+import pytz
+
+from chronomeleon import ChronoAssumption, ConversionError, MappingConfig, adapt_to_target
+from chronomeleon.async_streaming import adapt_stream
+
+_berlin = pytz.timezone("Europe/Berlin")
+
+_CONFIG = MappingConfig(
+    source=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(days=1), is_inclusive_end=True),
+    target=ChronoAssumption(implicit_timezone=pytz.utc, resolution=timedelta(days=1), is_inclusive_end=False),
+    is_end=True,
+)
+
+_SOURCE_VALUES: list[Union[date, datetime]] = [date(2024, 1, 1) + timedelta(days=i) for i in range(500)]
+
+
+async def _generate(source_values: list[Union[date, datetime]]) -> AsyncIterator[Union[date, datetime]]:
+    for source_value in source_values:
+        await asyncio.sleep(0)  # like a real source, which gives other coroutines the chance to run
+        yield source_value
+
+
+async def _collect(source_values: list[Union[date, datetime]], **kwargs: Any) -> list[datetime]:
+    return [result async for result in adapt_stream(_generate(source_values), _CONFIG, **kwargs)]
+
+
+@pytest.mark.parametrize(
+    "batch_size, min_offload_size",
+    [
+        pytest.param(1_000, 1_000, id="a single batch, which is mapped in the event loop"),
+        pytest.param(37, 1, id="all batches are offloaded"),
+        pytest.param(37, 37, id="mixed: the last (incomplete) batch is mapped in the event loop"),
+    ],
+)
+def test_adapt_stream_keeps_the_order(batch_size: int, min_offload_size: int):
+    result = asyncio.run(_collect(_SOURCE_VALUES, batch_size=batch_size, min_offload_size=min_offload_size))
+    assert result == [adapt_to_target(value, _CONFIG) for value in _SOURCE_VALUES]
+
+
+def test_adapt_stream_with_a_process_pool():
+    async def collect() -> list[datetime]:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            stream = adapt_stream(_generate(_SOURCE_VALUES), _CONFIG, batch_size=50, executor=executor)
+            return [result async for result in stream]
+
+    assert asyncio.run(collect()) == [adapt_to_target(value, _CONFIG) for value in _SOURCE_VALUES]
+
+
+@pytest.mark.parametrize("min_offload_size", [1, 1_000])
+def test_adapt_stream_reports_the_row_index_after_the_preceding_results(min_offload_size: int):
+    source_values = list(_SOURCE_VALUES)
+    source_values[123] = "2024-01-01"  # type: ignore[call-overload]
+    results: list[datetime] = []
+
+    async def collect() -> None:
+        async for result in adapt_stream(
+            _generate(source_values), _CONFIG, batch_size=50, min_offload_size=min_offload_size
+        ):
+            results.append(result)
+
+    with pytest.raises(ConversionError, match="row 123: source_value must be a date or datetime") as error_info:
+        asyncio.run(collect())
+    assert error_info.value.row_index == 123
+    assert len(results) == 100  # the first two batches
+
+
+def test_adapt_stream_applies_backpressure():
+    read_values = 0
+
+    async def count(source_values: AsyncIterator[Union[date, datetime]]) -> AsyncIterator[Union[date, datetime]]:
+        nonlocal read_values
+        async for source_value in source_values:
+            read_values += 1
+            yield source_value
+
+    async def read_one_result() -> None:
+        stream = adapt_stream(
+            count(_generate(_SOURCE_VALUES)), _CONFIG, batch_size=10, min_offload_size=1, max_pending=2
+        )
+        await anext(stream)  # the consumer is slow and does not read any further
+        await asyncio.sleep(0.1)
+        await stream.aclose()  # type: ignore[attr-defined]
+
+    asyncio.run(read_one_result())
+    assert read_values <= 4 * 10  # at most max_pending + 1 batches in flight and one being read
+
+
+@pytest.mark.parametrize("max_delay", [0.01, None])
+def test_max_delay_limits_the_latency_of_slow_sources(max_delay: Optional[float]):
+    async def slow_source(first_result_arrived: asyncio.Event) -> AsyncIterator[Union[date, datetime]]:
+        yield date(2024, 1, 1)
+        await first_result_arrived.wait()  # the second value only arrives after the first result has been consumed
+        yield date(2024, 1, 2)
+
+    async def collect() -> list[datetime]:
+        first_result_arrived = asyncio.Event()
+        results: list[datetime] = []
+        async for result in adapt_stream(slow_source(first_result_arrived), _CONFIG, max_delay=max_delay):
+            results.append(result)
+            first_result_arrived.set()
+        return results
+
+    async def collect_with_timeout() -> list[datetime]:
+        return await asyncio.wait_for(collect(), timeout=1)
+
+    if max_delay is None:
+        with pytest.raises(asyncio.TimeoutError):  # waits for a full batch forever
+            asyncio.run(collect_with_timeout())
+    else:
+        assert asyncio.run(collect_with_timeout()) == [
+            adapt_to_target(date(2024, 1, 1), _CONFIG),
+            adapt_to_target(date(2024, 1, 2), _CONFIG),
+        ]
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        pytest.param({"batch_size": 0}, "batch_size must be at least 1", id="batch_size"),
+        pytest.param({"max_pending": 0}, "max_pending must be at least 1", id="max_pending"),
+    ],
+)
+def test_invalid_arguments_raise_a_value_error(kwargs: dict[str, int], message: str):
+    with pytest.raises(ValueError, match=message):
+        asyncio.run(_collect(_SOURCE_VALUES, **kwargs))
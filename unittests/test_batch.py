@@ -0,0 +1,113 @@
+from datetime import date, datetime, timedelta
+from typing import Union
+
+import numpy as np
+import pytest
+import pytz
+
+from chronomeleon import ChronoAssumption, MappingConfig, adapt_to_target
+from chronomeleon.batch import adapt_many
+
+_berlin = pytz.timezone("Europe/Berlin")
+
+_configs = [
+    pytest.param(
+        MappingConfig(
+            source=ChronoAssumption(resolution=timedelta(days=1), implicit_timezone=_berlin),
+            target=ChronoAssumption(resolution=timedelta(days=1)),
+        ),
+        id="Berlin to UTC",
+    ),
+    pytest.param(
+        MappingConfig(
+            source=ChronoAssumption(
+                resolution=timedelta(days=1), implicit_timezone=_berlin, is_inclusive_end=False, is_gastag_aware=True
+            ),
+            target=ChronoAssumption(resolution=timedelta(microseconds=1), is_inclusive_end=True),
+            is_end=True,
+            is_gas=True,
+        ),
+        id="exclusive Gastag aware Berlin end to inclusive UTC end",
+    ),
+    pytest.param(
+        MappingConfig(
+            source=ChronoAssumption(resolution=timedelta(seconds=1), implicit_timezone=_berlin, is_inclusive_end=True),
+            target=ChronoAssumption(
+                resolution=timedelta(milliseconds=1),
+                implicit_timezone=_berlin,
+                is_inclusive_end=True,
+                is_gastag_aware=True,
+            ),
+            is_end=True,
+            is_gas=True,
+        ),
+        id="inclusive Berlin end to inclusive Gastag aware Berlin end",
+    ),
+    pytest.param(
+        MappingConfig(
+            source=ChronoAssumption(resolution=timedelta(days=1), implicit_timezone=pytz.utc, is_inclusive_end=True),
+            target=ChronoAssumption(
+                resolution=timedelta(days=1), implicit_timezone=_berlin, is_inclusive_end=True, is_date_only=True
+            ),
+            is_end=True,
+        ),
+        id="inclusive UTC end to inclusive Berlin end date",
+    ),
+]
+
+
+def _datetimes_around_dst_transitions() -> list[datetime]:
+    result: list[datetime] = []
+    for day in [date(2023, 3, 26), date(2023, 10, 29), date(2024, 1, 1), date(2024, 6, 30)]:
+        start = datetime.combine(day - timedelta(days=1), datetime.min.time())
+        result.extend(start + timedelta(minutes=30 * i) for i in range(3 * 48))
+    return result
+
+
+def _as_numpy(value: datetime) -> np.datetime64:
+    return np.datetime64(value.replace(tzinfo=None), "us")
+
+
+@pytest.mark.parametrize("config", _configs)
+def test_adapt_many_matches_adapt_to_target_for_naive_datetimes(config: MappingConfig):
+    source_values = _datetimes_around_dst_transitions()
+    expected = np.array([_as_numpy(adapt_to_target(v, config)) for v in source_values], dtype="datetime64[us]")
+    actual_from_numpy = adapt_many(np.array(source_values, dtype="datetime64[us]"), config)
+    actual_from_list = adapt_many(source_values, config)
+    np.testing.assert_array_equal(actual_from_numpy, expected)
+    np.testing.assert_array_equal(actual_from_list, expected)
+
+
+@pytest.mark.parametrize("config", _configs)
+def test_adapt_many_matches_adapt_to_target_for_dates(config: MappingConfig):
+    source_values = [date(2023, 1, 1) + timedelta(days=i) for i in range(400)]
+    expected = np.array([_as_numpy(adapt_to_target(v, config)) for v in source_values], dtype="datetime64[us]")
+    np.testing.assert_array_equal(adapt_many(np.array(source_values, dtype="datetime64[D]"), config), expected)
+    np.testing.assert_array_equal(adapt_many(source_values, config), expected)
+
+
+@pytest.mark.parametrize("config", _configs)
+def test_adapt_many_matches_adapt_to_target_for_aware_values(config: MappingConfig):
+    source_values = [pytz.utc.localize(v) for v in _datetimes_around_dst_transitions()]
+    expected = np.array([_as_numpy(adapt_to_target(v, config)) for v in source_values], dtype="datetime64[us]")
+    epoch_microseconds = np.array([v.replace(tzinfo=None) for v in source_values], dtype="datetime64[us]").astype(
+        np.int64
+    )
+    np.testing.assert_array_equal(adapt_many(epoch_microseconds, config), expected)
+    np.testing.assert_array_equal(adapt_many([v.astimezone(_berlin) for v in source_values], config), expected)
+
+
+@pytest.mark.parametrize(
+    "source_values",
+    [
+        pytest.param([datetime(2024, 1, 1)], id="naive datetime"),
+        pytest.param([date(2024, 1, 1), "2024-01-01"], id="wrong type"),
+        pytest.param(np.array([1.0, 2.0]), id="wrong dtype"),
+    ],
+)
+def test_adapt_many_raises_on_invalid_values(source_values: Union[list[Union[date, str]], np.ndarray]):
+    config = MappingConfig(
+        source=ChronoAssumption(resolution=timedelta(days=1)), target=ChronoAssumption(resolution=timedelta(days=1))
+    )
+    with pytest.raises(ValueError):
+        adapt_many(source_values, config)  # type: ignore[arg-type]
@@ -0,0 +1,77 @@
+import pickle
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+import pytz
+
+from chronomeleon import ChronoAssumption, MappingConfig, adapt_to_target
+from chronomeleon.caching import AdaptToTargetCache
+
+_berlin = pytz.timezone("Europe/Berlin")
+
+_config = MappingConfig(
+    source=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(days=1), is_inclusive_end=True),
+    target=ChronoAssumption(implicit_timezone=pytz.utc, resolution=timedelta(days=1), is_inclusive_end=False),
+    is_end=True,
+)
+
+
+def test_cache_returns_the_same_as_adapt_to_target():
+    cache = AdaptToTargetCache(max_size=2)
+    source_values = [date(2024, 1, 1), date(2024, 2, 1), date(2024, 1, 1), datetime(2024, 1, 1), date(2024, 1, 1)]
+    for source_value in source_values:
+        assert cache(source_value, _config) == adapt_to_target(source_value, _config)
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.size) == (
+        2,
+        3,
+        1,
+        2,
+    )  # date(2024, 2, 1) was the least recently used
+    assert info.hit_rate == pytest.approx(0.4)
+    cache.cache_clear()
+    assert cache.cache_info().size == 0
+
+
+@pytest.mark.parametrize("first_fold", [0, 1])
+def test_cache_distinguishes_the_repeated_hour(first_fold: int):
+    config = MappingConfig(
+        source=ChronoAssumption(resolution=timedelta(seconds=1)),
+        target=ChronoAssumption(implicit_timezone=pytz.utc, resolution=timedelta(seconds=1)),
+    )
+    cache = AdaptToTargetCache()
+    for fold in [first_fold, 1 - first_fold, first_fold]:
+        source_value = datetime(2024, 10, 27, 2, 30, fold=fold, tzinfo=ZoneInfo("Europe/Berlin"))
+        result = cache(source_value, config)
+        assert result == adapt_to_target(source_value, config)
+        assert result.hour == (1 if fold else 0)
+    assert (cache.cache_info().hits, cache.cache_info().misses) == (1, 2)
+
+
+def test_cache_does_not_cache_errors():
+    cache = AdaptToTargetCache()
+    with pytest.raises(ValueError):
+        cache(None, _config)  # type: ignore[arg-type]
+    assert cache.cache_info().misses == 0
+
+
+def test_invalid_max_size():
+    with pytest.raises(ValueError, match="max_size must be at least 1"):
+        AdaptToTargetCache(max_size=0)
+
+
+def test_equal_configs_have_the_same_hash():
+    copy = MappingConfig.from_dict(_config.to_dict())
+    assert copy == _config
+    assert hash(copy) == hash(_config)
+    assert hash(_config) != hash(MappingConfig(source=_config.source, target=_config.target, is_end=False))
+
+
+def test_cached_hash_is_not_pickled():
+    hash(_config)
+    unpickled = pickle.loads(pickle.dumps(_config))
+    assert "_hash" not in unpickled.__dict__
+    assert "_hash" not in unpickled.source.__dict__
+    assert unpickled == _config
+    assert hash(unpickled) == hash(_config)
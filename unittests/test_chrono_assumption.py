@@ -12,6 +12,9 @@ from chronomeleon import ChronoAssumption
             ChronoAssumption(resolution=timedelta(days=1)),
             True,
         ),
+        pytest.param(ChronoAssumption(string_format="sap_dats"), True, id="SAP DATS"),
+        pytest.param(ChronoAssumption(string_format="%d.%m.%Y"), True, id="strptime pattern"),
+        pytest.param(ChronoAssumption(string_format="dd.mm.yyyy"), False, id="unknown string format"),
     ],
 )
 def test_self_consistency(chrono_assumption: ChronoAssumption, is_self_consistent: bool):
@@ -0,0 +1,91 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Union
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+import pytz
+
+from chronomeleon import ChronoAssumption, MappingConfig, adapt_to_target
+from chronomeleon.batch import adapt_many
+from chronomeleon.compact import DatetimeArray, adapt_compact
+
+_berlin = pytz.timezone("Europe/Berlin")
+
+_SOURCE_VALUES: list[Union[date, datetime]] = [
+    date(2024, 3, 31),
+    datetime(2024, 10, 27, 2, 30),  # ambiguous in Berlin
+    datetime(2024, 10, 27, 2, 30, 0, 5),
+    datetime(1960, 1, 1, 0, 0, 0, 1),
+    datetime(2024, 10, 27, 0, 30, tzinfo=pytz.utc),
+    datetime(2024, 10, 27, 1, 30, tzinfo=pytz.utc),
+]
+
+
+@pytest.mark.parametrize(
+    "target",
+    [
+        pytest.param(ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(microseconds=1)), id="pytz"),
+        pytest.param(
+            ChronoAssumption(implicit_timezone=ZoneInfo("Europe/Berlin"), resolution=timedelta(microseconds=1)),
+            id="zoneinfo",
+        ),
+        pytest.param(
+            ChronoAssumption(implicit_timezone=timezone(timedelta(hours=-5)), resolution=timedelta(microseconds=1)),
+            id="fixed offset",
+        ),
+        pytest.param(ChronoAssumption(resolution=timedelta(microseconds=1)), id="UTC"),
+        pytest.param(ChronoAssumption(implicit_timezone=_berlin, is_date_only=True), id="date-only"),
+    ],
+)
+def test_adapt_compact_returns_the_same_as_adapt_to_target(target: ChronoAssumption):
+    config = MappingConfig(
+        source=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(microseconds=1)), target=target
+    )
+    result = adapt_compact(_SOURCE_VALUES, config)
+    expected = [adapt_to_target(source_value, config) for source_value in _SOURCE_VALUES]
+    assert len(result) == len(expected)
+    for actual_value, expected_value in zip(result, expected):
+        assert actual_value is not None
+        assert actual_value.replace(tzinfo=None) == expected_value.replace(tzinfo=None)
+        assert (actual_value.utcoffset(), actual_value.tzname()) == (
+            expected_value.utcoffset(),
+            expected_value.tzname(),
+        )
+        assert actual_value.fold == expected_value.fold
+    assert result[1] == expected[1]
+    assert result.isoformat() == [value.isoformat() for value in expected]
+    assert result.isoformat(sep=" ") == [value.isoformat(sep=" ") for value in expected]
+    assert (result.to_numpy(wall_clock=True) == adapt_many(_SOURCE_VALUES, config)).all()
+
+
+def test_datetime_array_exports_its_values_without_copying():
+    values = np.array([0, 86_400_000_000], dtype=np.int64)
+    result = DatetimeArray(values, pytz.utc)
+    assert np.shares_memory(result.to_numpy(), values)
+    assert np.shares_memory(np.asarray(result), values)
+    assert np.shares_memory(result[1:].values, values)
+    assert result.values.data.nbytes == result.nbytes == 16
+    assert result.to_numpy()[1] == np.datetime64("1970-01-02T00:00")
+
+
+def test_datetime_array_is_read_only():
+    result = DatetimeArray(np.array([0, 86_400_000_000], dtype=np.int64), pytz.utc)
+    for exported in [result.values, result.to_numpy(), np.asarray(result), result[1:].values]:
+        with pytest.raises(ValueError, match="read-only"):
+            exported[0] = 1
+    assert result.__buffer__(0).readonly
+    assert result[0] == datetime(1970, 1, 1, tzinfo=pytz.utc)
+
+
+@pytest.mark.parametrize("timezone_", [None, _berlin])
+def test_datetime_array_passes_missing_values_through(timezone_: Optional[pytz.BaseTzInfo]):
+    result = DatetimeArray(np.array([0, np.iinfo(np.int64).min], dtype=np.int64), timezone_)
+    assert result[1] is None
+    assert result.isoformat(na_rep="NaT")[1] == "NaT"
+    assert np.isnat(result.to_numpy(wall_clock=True)[1])
+
+
+def test_datetime_array_requires_a_one_dimensional_int64_array():
+    with pytest.raises(ValueError, match="int64"):
+        DatetimeArray(np.array([0.5]), None)
@@ -0,0 +1,157 @@
+import random
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Optional, Union
+from zoneinfo import ZoneInfo
+
+import pytest
+import pytz
+
+from chronomeleon import ChronoAssumption, ConversionKind, MappingConfig, adapt_to_target, compile_config
+from chronomeleon.mapping import compile_composition, compose_configs
+
+_berlin = pytz.timezone("Europe/Berlin")
+
+_legacy = ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(days=1), is_inclusive_end=True)
+_canonical = ChronoAssumption(resolution=timedelta(microseconds=1), is_inclusive_end=False)
+_sap = ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(seconds=1), is_inclusive_end=True)
+_berlin_date = ChronoAssumption(implicit_timezone=_berlin, is_date_only=True)
+_berlin_exclusive = ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(seconds=1), is_inclusive_end=False)
+
+
+def _assert_same_value(actual: datetime, expected: datetime) -> None:
+    # aware datetimes compare equal if they are the same instant, but we want the same representation, too
+    assert actual.replace(tzinfo=None) == expected.replace(tzinfo=None)
+    assert actual.utcoffset() == expected.utcoffset()
+
+
+def test_compose_configs_skips_the_intermediate_system():
+    first = MappingConfig(source=_legacy, target=_canonical, is_end=True)
+    second = MappingConfig(source=_canonical, target=_sap, is_end=True)
+    composed = compose_configs(first, second)
+    assert composed == MappingConfig(source=_legacy, target=_sap, is_end=True)
+    plan = compile_composition(first, second)
+    assert plan.config == composed
+    first_plan, second_plan = compile_config(first), compile_config(second)
+    assert len(plan.source_steps) + len(plan.target_steps) < sum(
+        len(p.source_steps) + len(p.target_steps) for p in [first_plan, second_plan]
+    )
+    _assert_same_value(plan(date(2024, 3, 31)), _berlin.localize(datetime(2024, 3, 31, 23, 59, 59)))
+
+
+def test_the_composition_of_a_config_and_its_mirror_image_is_the_identity():
+    first = MappingConfig(source=_berlin_exclusive, target=_canonical, is_end=True)
+    second = MappingConfig(source=_canonical, target=_berlin_exclusive, is_end=True)
+    plan = compile_composition(first, second)
+    assert plan.config.source == plan.config.target == _berlin_exclusive
+    assert plan.kind is ConversionKind.IDENTITY
+    source_value = datetime(2024, 10, 27, 2, 30, 0)  # ambiguous
+    _assert_same_value(plan(source_value), _berlin.localize(source_value))
+
+
+def test_the_composition_of_inclusive_ends_is_not_the_identity_around_dst_transitions():
+    # the inclusive end shift adds a day to the wall clock, but the target subtracts it from the UTC instant
+    first = MappingConfig(source=_legacy, target=_canonical, is_end=True)
+    second = MappingConfig(source=_canonical, target=_legacy, is_end=True)
+    plan = compile_composition(first, second)
+    assert plan.kind is ConversionKind.RESOLUTION_SHIFT
+    source_value = datetime(2024, 3, 30, 12, 0, 0)
+    expected = adapt_to_target(adapt_to_target(source_value, first), second)
+    _assert_same_value(plan(source_value), expected)
+    _assert_same_value(expected, _berlin.localize(datetime(2024, 3, 30, 11, 0, 0)))
+
+
+@pytest.mark.parametrize(
+    "first, second, message",
+    [
+        pytest.param(
+            MappingConfig(source=_legacy, target=_canonical, is_end=True),
+            MappingConfig(source=_sap, target=_canonical, is_end=True),
+            "the target of the first config must be the source of the second config",
+            id="different intermediate systems",
+        ),
+        pytest.param(
+            MappingConfig(source=_legacy, target=_canonical, is_end=True),
+            MappingConfig(source=_canonical, target=_sap, is_end=False),
+            "is_end differs",
+            id="start and end",
+        ),
+        pytest.param(
+            MappingConfig(source=_canonical, target=_berlin_date, is_end=False),
+            MappingConfig(source=_berlin_date, target=_canonical, is_end=False),
+            "lossy",
+            id="date-only intermediate system",
+        ),
+    ],
+)
+def test_compose_configs_raises_if_there_is_no_equivalent_config(
+    first: MappingConfig, second: MappingConfig, message: str
+):
+    with pytest.raises(ValueError, match=message):
+        compose_configs(first, second)
+
+
+_TIMEZONES: list[Optional[tzinfo]] = [None, _berlin, ZoneInfo("Europe/Berlin"), timezone(timedelta(hours=1))]
+_RESOLUTIONS = [timedelta(days=1), timedelta(seconds=1), timedelta(microseconds=1)]
+
+_SOURCE_VALUES: list[Union[date, datetime]] = [
+    date(2024, 3, 31),
+    date(2024, 10, 27),
+    datetime(2024, 3, 30, 12, 0),  # the day before the clocks are turned forward
+    datetime(2024, 3, 31, 2, 30),  # non-existent in Berlin
+    datetime(2024, 10, 27, 2, 30),  # ambiguous in Berlin
+    datetime(2024, 10, 26, 22, 0),
+    datetime(2024, 1, 1, 6, 0),
+    datetime(2024, 1, 1, 0, 0),
+    datetime(2024, 10, 27, 0, 30, tzinfo=pytz.utc),
+    datetime(2024, 3, 31, 4, 0, tzinfo=pytz.utc),
+    _berlin.localize(datetime(2024, 1, 1, 6, 0)),
+    datetime(2024, 10, 27, 2, 30, fold=1, tzinfo=ZoneInfo("Europe/Berlin")),
+]
+
+
+def _random_assumption(rng: random.Random, is_end: Optional[bool]) -> ChronoAssumption:
+    return ChronoAssumption(
+        implicit_timezone=rng.choice(_TIMEZONES),
+        resolution=rng.choice(_RESOLUTIONS),
+        implicit_is_dst=rng.choice([False, True]),
+        is_inclusive_end=rng.choice([False, True]) if is_end else None,
+        is_gastag_aware=rng.random() < 0.3,
+        is_date_only=rng.random() < 0.2,
+    )
+
+
+def _adapt_or_error(function: object, source_value: Union[date, datetime]) -> Union[datetime, str]:
+    try:
+        return function(source_value)  # type: ignore[operator,no-any-return]
+    except ValueError:
+        return "ValueError"
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_compile_composition_is_equivalent_to_chained_calls(seed: int):
+    rng = random.Random(seed)
+    checked = 0
+    while checked < 25:
+        is_end = rng.choice([None, False, True])
+        intermediate = _random_assumption(rng, is_end)
+        first = MappingConfig(
+            source=_random_assumption(rng, is_end), target=intermediate, is_end=is_end, is_gas=rng.random() < 0.7
+        )
+        second_is_end = is_end if rng.random() < 0.8 else rng.choice([None, False, True])
+        second = MappingConfig(
+            source=intermediate,
+            target=_random_assumption(rng, second_is_end),
+            is_end=second_is_end,
+            is_gas=rng.random() < 0.7,
+        )
+        if not (first.is_self_consistent() and second.is_self_consistent()):
+            continue
+        plan = compile_composition(first, second)
+        for source_value in _SOURCE_VALUES:
+            expected = _adapt_or_error(lambda v: adapt_to_target(adapt_to_target(v, first), second), source_value)
+            actual = _adapt_or_error(plan, source_value)
+            if isinstance(expected, str) or isinstance(actual, str):
+                assert actual == expected, (first, second, source_value)
+            else:
+                _assert_same_value(actual, expected)
+        checked += 1
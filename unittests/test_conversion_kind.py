@@ -0,0 +1,173 @@
+import random
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Optional, Union
+from zoneinfo import ZoneInfo
+
+import pytest
+import pytz
+
+from chronomeleon import (
+    ChronoAssumption,
+    ConversionKind,
+    ConversionPlan,
+    MappingConfig,
+    classify_config,
+    compile_config,
+)
+
+_berlin = pytz.timezone("Europe/Berlin")
+_plus_one = timezone(timedelta(hours=1))
+
+
+@pytest.mark.parametrize(
+    "config, expected",
+    [
+        pytest.param(
+            MappingConfig(
+                source=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(seconds=1)),
+                target=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(seconds=1)),
+            ),
+            ConversionKind.IDENTITY,
+            id="same timezone",
+        ),
+        pytest.param(
+            MappingConfig(
+                source=ChronoAssumption(
+                    implicit_timezone=_plus_one, resolution=timedelta(days=1), is_inclusive_end=True
+                ),
+                target=ChronoAssumption(
+                    implicit_timezone=_plus_one, resolution=timedelta(days=1), is_inclusive_end=True
+                ),
+                is_end=True,
+            ),
+            ConversionKind.IDENTITY,
+            id="the inclusive end shifts cancel out without DST",
+        ),
+        pytest.param(
+            MappingConfig(
+                source=ChronoAssumption(implicit_timezone=_plus_one, resolution=timedelta(seconds=1)),
+                target=ChronoAssumption(resolution=timedelta(seconds=1)),
+            ),
+            ConversionKind.OFFSET_SHIFT,
+            id="fixed offset to UTC",
+        ),
+        pytest.param(
+            MappingConfig(
+                source=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(days=1), is_inclusive_end=True),
+                target=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(days=1), is_inclusive_end=True),
+                is_end=True,
+            ),
+            ConversionKind.RESOLUTION_SHIFT,
+            id="the inclusive end shifts do not cancel out around DST transitions",
+        ),
+        pytest.param(
+            MappingConfig(
+                source=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(days=1), is_inclusive_end=True),
+                target=ChronoAssumption(
+                    implicit_timezone=_berlin, resolution=timedelta(seconds=1), is_inclusive_end=False
+                ),
+                is_end=True,
+            ),
+            ConversionKind.RESOLUTION_SHIFT,
+            id="inclusive to exclusive end",
+        ),
+        pytest.param(
+            MappingConfig(
+                source=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(seconds=1)),
+                target=ChronoAssumption(resolution=timedelta(seconds=1)),
+            ),
+            ConversionKind.GENERAL,
+            id="timezone with DST to UTC",
+        ),
+        pytest.param(
+            MappingConfig(
+                source=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(days=1)),
+                target=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(days=1), is_gastag_aware=True),
+                is_gas=True,
+            ),
+            ConversionKind.GENERAL,
+            id="Gastag",
+        ),
+        pytest.param(
+            MappingConfig(
+                source=ChronoAssumption(implicit_timezone=_berlin, is_date_only=True),
+                target=ChronoAssumption(implicit_timezone=_berlin, is_date_only=True),
+            ),
+            ConversionKind.GENERAL,
+            id="date-only target",
+        ),
+    ],
+)
+def test_classify_config(config: MappingConfig, expected: ConversionKind):
+    assert classify_config(config) is expected
+    plan = compile_config(config)
+    assert plan.kind is expected
+    assert (plan.fast_path is None) == (expected is ConversionKind.GENERAL)
+
+
+_TIMEZONES: list[Optional[tzinfo]] = [None, pytz.utc, _berlin, ZoneInfo("Europe/Berlin"), _plus_one]
+_RESOLUTIONS = [timedelta(days=1), timedelta(seconds=1), timedelta(microseconds=1)]
+
+_SOURCE_VALUES: list[Union[date, datetime]] = [
+    date(2024, 3, 30),
+    date(2024, 3, 31),
+    date(2024, 10, 27),
+    datetime(2024, 3, 30, 12, 0),
+    datetime(2024, 3, 31, 2, 30),  # non-existent in Berlin
+    datetime(2024, 10, 27, 2, 30),  # ambiguous in Berlin
+    datetime(2024, 10, 26, 2, 30),
+    datetime(2024, 1, 1, 0, 0),
+    datetime(2024, 10, 27, 0, 30, tzinfo=pytz.utc),
+    datetime(2024, 3, 31, 4, 0, tzinfo=_plus_one),
+    _berlin.localize(datetime(2024, 10, 27, 2, 30), is_dst=True),
+    datetime(2024, 10, 27, 2, 30, fold=1, tzinfo=ZoneInfo("Europe/Berlin")),
+]
+
+
+def _random_assumption(rng: random.Random, is_end: bool, timezone_: Optional[tzinfo]) -> ChronoAssumption:
+    return ChronoAssumption(
+        implicit_timezone=timezone_,
+        resolution=rng.choice(_RESOLUTIONS),
+        implicit_is_dst=rng.choice([False, True]),
+        is_inclusive_end=rng.choice([False, True]) if is_end else None,
+    )
+
+
+def _call_steps(plan: ConversionPlan, source_value: Union[date, datetime]) -> Union[datetime, str]:
+    try:
+        return plan.from_utc(plan.to_utc(source_value))
+    except ValueError:
+        return "ValueError"
+
+
+def _call_fast_path(plan: ConversionPlan, source_value: Union[date, datetime]) -> Union[datetime, str]:
+    try:
+        return plan(source_value)
+    except ValueError:
+        return "ValueError"
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_the_fast_paths_return_the_same_as_the_steps(seed: int):
+    rng = random.Random(seed)
+    for _ in range(30):
+        is_end = rng.choice([False, True])
+        source_timezone = rng.choice(_TIMEZONES)
+        # the same timezone in source and target is the interesting case for the fast paths
+        target_timezone = source_timezone if rng.random() < 0.6 else rng.choice(_TIMEZONES)
+        config = MappingConfig(
+            source=_random_assumption(rng, is_end, source_timezone),
+            target=_random_assumption(rng, is_end, target_timezone),
+            is_end=is_end,
+        )
+        plan = compile_config(config)
+        for source_value in _SOURCE_VALUES:
+            expected = _call_steps(plan, source_value)
+            actual = _call_fast_path(plan, source_value)
+            if isinstance(expected, str) or isinstance(actual, str):
+                assert actual == expected, (config, source_value)
+            else:
+                # aware datetimes compare equal if they are the same instant, but we want the same representation, too
+                assert actual.replace(tzinfo=None) == expected.replace(tzinfo=None), (config, source_value)
+                assert (actual.utcoffset(), actual.tzname()) == (expected.utcoffset(), expected.tzname())
+                assert actual.fold == expected.fold
@@ -0,0 +1,62 @@
+from datetime import date, datetime, timedelta
+from typing import Union
+
+import pytest
+import pytz
+
+from chronomeleon import ChronoAssumption, MappingConfig, adapt_to_target, compile_config
+
+_berlin = pytz.timezone("Europe/Berlin")
+
+_gas_end_config = MappingConfig(
+    source=ChronoAssumption(
+        implicit_timezone=_berlin, resolution=timedelta(days=1), is_inclusive_end=True, is_gastag_aware=False
+    ),
+    target=ChronoAssumption(resolution=timedelta(milliseconds=1), is_inclusive_end=True, is_gastag_aware=True),
+    is_end=True,
+    is_gas=True,
+)
+
+
+@pytest.mark.parametrize(
+    "source_value",
+    [
+        pytest.param(date(2021, 12, 31), id="date"),
+        pytest.param(datetime(2023, 3, 26, 5, 59, 59), id="naive datetime on DST transition"),
+        pytest.param(pytz.utc.localize(datetime(2023, 10, 28, 22, 0, 0)), id="aware datetime"),
+    ],
+)
+def test_plan_returns_the_same_as_adapt_to_target(source_value: Union[date, datetime]):
+    plan = compile_config(_gas_end_config)
+    assert plan(source_value) == adapt_to_target(source_value, _gas_end_config)
+    assert _gas_end_config.compile()(source_value) == adapt_to_target(source_value, _gas_end_config)
+
+
+def test_plan_only_contains_the_necessary_steps():
+    trivial_config = MappingConfig(
+        source=ChronoAssumption(implicit_timezone=pytz.utc), target=ChronoAssumption(resolution=timedelta(days=1))
+    )
+    plan = trivial_config.compile()
+    assert len(plan.source_steps) == 2  # localize, convert to UTC
+    assert not any(plan.target_steps)
+    assert plan(date(2024, 1, 1)) == datetime(2024, 1, 1, tzinfo=pytz.utc)
+
+
+def test_compiling_an_inconsistent_config_raises_value_error():
+    config = MappingConfig(
+        source=ChronoAssumption(resolution=timedelta(days=1), is_inclusive_end=True, is_gastag_aware=True),
+        target=ChronoAssumption(resolution=timedelta(seconds=1), is_inclusive_end=True),
+        is_end=True,
+    )
+    with pytest.raises(ValueError):
+        compile_config(config)
+    with pytest.raises(ValueError):
+        adapt_to_target(date(2024, 1, 1), config)
+
+
+def test_plan_raises_on_invalid_source_values():
+    plan = _gas_end_config.compile()
+    with pytest.raises(ValueError):
+        plan(None)  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        plan("2024-01-01")  # type: ignore[arg-type]
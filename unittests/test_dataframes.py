@@ -0,0 +1,109 @@
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+import pytz
+
+from chronomeleon import ChronoAssumption, MappingConfig, adapt_to_target
+
+pd = pytest.importorskip("pandas")
+pa = pytest.importorskip("pyarrow")
+
+# pylint:disable=wrong-import-position
+from chronomeleon.arrow import adapt_arrow
+from chronomeleon.pandas_accessor import adapt_series
+
+_berlin = pytz.timezone("Europe/Berlin")
+
+_gas_end_config = MappingConfig(
+    source=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(seconds=1), is_inclusive_end=True),
+    target=ChronoAssumption(resolution=timedelta(milliseconds=1), is_inclusive_end=True, is_gastag_aware=True),
+    is_end=True,
+    is_gas=True,
+)
+
+_date_only_config = MappingConfig(
+    source=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(days=1), is_inclusive_end=True),
+    target=ChronoAssumption(
+        implicit_timezone=ZoneInfo("Europe/Berlin"),
+        resolution=timedelta(days=1),
+        is_inclusive_end=False,
+        is_date_only=True,
+    ),
+    is_end=True,
+)
+
+_source_values = [
+    datetime(2024, 1, 1, 23, 59, 59),  # is shifted to the Gastag start
+    datetime(2024, 3, 30, 23, 59, 59),
+    datetime(2024, 10, 27, 2, 30),
+    datetime(2024, 6, 30, 23, 59, 59, 999999),
+]
+
+
+def test_series_accessor_on_naive_nanoseconds():
+    series = pd.Series(_source_values + [None], index=list("abcde"), name="vertragsende", dtype="datetime64[ns]")
+    result = series.chronomeleon.adapt(_gas_end_config)
+    assert str(result.dtype) == "datetime64[ns, UTC]"
+    assert list(result.index) == list("abcde")
+    assert result.name == "vertragsende"
+    assert [value.to_pydatetime() for value in result[:4]] == [
+        adapt_to_target(v, _gas_end_config) for v in _source_values
+    ]
+    assert pd.isna(result["e"])
+
+
+def test_series_accessor_keeps_the_nanoseconds():
+    series = pd.Series([pd.Timestamp("2024-01-01T23:59:59.000000500")])
+    result = adapt_series(series, _gas_end_config)
+    # 23:59:59.0000005 + 1s is not the (German) midnight, so it must not be shifted to the Gastag start
+    assert result[0] == pd.Timestamp("2024-01-01T23:00:00.000000500", tz="UTC") - pd.Timedelta(milliseconds=1)
+
+
+def test_series_accessor_on_aware_values():
+    series = pd.Series(_source_values, dtype="datetime64[ns]").dt.tz_localize("Europe/Berlin", ambiguous=False)
+    config = MappingConfig(
+        source=ChronoAssumption(resolution=timedelta(seconds=1), is_inclusive_end=True),
+        target=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(seconds=1), is_inclusive_end=True),
+        is_end=True,
+    )
+    result = adapt_series(series, config)
+    assert str(result.dtype) == "datetime64[ns, Europe/Berlin]"
+    expected = [adapt_to_target(value.to_pydatetime(), config) for value in series]
+    assert [value.to_pydatetime() for value in result] == expected
+
+
+def test_series_accessor_on_dates():
+    series = pd.Series([date(2024, 1, 31), None, date(2024, 12, 31)])
+    result = adapt_series(series, _date_only_config)
+    assert list(result) == [pd.Timestamp("2024-02-01"), pd.NaT, pd.Timestamp("2025-01-01")]
+
+
+def test_series_accessor_rejects_other_dtypes():
+    with pytest.raises(ValueError, match="must have a datetime64 dtype"):
+        adapt_series(pd.Series(["2024-01-01"]), _gas_end_config)
+
+
+def test_adapt_arrow():
+    array = pa.chunked_array(
+        [
+            pa.array(_source_values[:2], type=pa.timestamp("us")),
+            pa.array(_source_values[2:] + [None], type=pa.timestamp("us")),
+        ]
+    )
+    result = adapt_arrow(array, _gas_end_config)
+    assert result.type == pa.timestamp("us", tz="UTC")
+    assert result.to_pylist() == [adapt_to_target(v, _gas_end_config) for v in _source_values] + [None]
+
+
+def test_adapt_arrow_with_dates():
+    result = adapt_arrow(pa.array([date(2024, 1, 31), None], type=pa.date32()), _date_only_config)
+    assert result.type == pa.date32()
+    assert result.to_pylist() == [date(2024, 2, 1), None]
+
+
+@pytest.mark.parametrize("config", [_gas_end_config, _date_only_config])
+def test_adapt_arrow_maps_date64_like_date32(config: MappingConfig):
+    days = [date(2024, 1, 31), date(2024, 3, 31), None]
+    result = adapt_arrow(pa.array(days, type=pa.date64()), config)
+    assert result.to_pylist() == adapt_arrow(pa.array(days, type=pa.date32()), config).to_pylist()
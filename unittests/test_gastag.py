@@ -0,0 +1,44 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from chronomeleon.batch import _shift_gastag_starts_to_midnight, _shift_midnights_to_gastag_start
+from chronomeleon.gastag import get_gastag_table, shift_gastag_start_to_midnight, shift_midnight_to_gastag_start
+from chronomeleon.transition_index import to_microseconds
+
+
+@pytest.mark.parametrize(
+    "gastag_start_utc, midnight_utc",
+    [
+        pytest.param(datetime(2024, 1, 15, 5, 0), datetime(2024, 1, 14, 23, 0), id="winter"),
+        pytest.param(datetime(2024, 7, 15, 4, 0), datetime(2024, 7, 14, 22, 0), id="summer"),
+        pytest.param(datetime(2023, 3, 26, 4, 0), datetime(2023, 3, 25, 23, 0), id="5h Gastag start on DST start"),
+        pytest.param(datetime(2023, 10, 29, 5, 0), datetime(2023, 10, 28, 22, 0), id="7h Gastag start on DST end"),
+        pytest.param(datetime(1969, 6, 1, 5, 0), datetime(1969, 5, 31, 23, 0), id="before the table"),
+        pytest.param(datetime(2150, 6, 1, 5, 0), datetime(2150, 5, 31, 23, 0), id="after the table"),
+    ],
+)
+def test_shifting_between_gastag_start_and_midnight(gastag_start_utc: datetime, midnight_utc: datetime):
+    gastag_start = to_microseconds(gastag_start_utc)
+    midnight = to_microseconds(midnight_utc)
+    assert shift_gastag_start_to_midnight(gastag_start) == midnight
+    assert shift_midnight_to_gastag_start(midnight) == gastag_start
+    # other values are not modified
+    assert shift_gastag_start_to_midnight(midnight) == midnight
+    assert shift_midnight_to_gastag_start(gastag_start) == gastag_start
+    np.testing.assert_array_equal(
+        _shift_gastag_starts_to_midnight(np.array([gastag_start, midnight], dtype=np.int64)), [midnight, midnight]
+    )
+    np.testing.assert_array_equal(
+        _shift_midnights_to_gastag_start(np.array([gastag_start, midnight], dtype=np.int64)),
+        [gastag_start, gastag_start],
+    )
+
+
+def test_single_values_agree_with_the_gastag_table():
+    table = get_gastag_table()
+    for position in range(len(table.midnights) - 1):  # all days, including the DST transition days
+        midnight, gastag_start = table.midnights[position], table.gastag_starts[position]
+        assert shift_gastag_start_to_midnight(gastag_start) == midnight
+        assert shift_midnight_to_gastag_start(midnight) == gastag_start
@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+_IMPORT_TIME_BUDGET_MICROSECONDS = 50_000
+"""
+the budget for the time spent in the modules of chronomeleon themselves (i.e. without pytz and the standard library)
+"""
+
+
+def _run_python(code: str, *options: str) -> subprocess.CompletedProcess[str]:
+    """
+    runs the code in a fresh interpreter (so that nothing has been imported yet)
+    """
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+
+
+@pytest.mark.parametrize("module", ["chronomeleon", "chronomeleon.__main__"])
+def test_importing_chronomeleon_does_not_load_timezones_or_optional_backends(module: str):
+    code = (
+        f"import sys, pytz, {module}\n"
+        "print(sorted(pytz._tzinfo_cache))\n"
+        "print(sorted(m for m in ['multiprocessing', 'numpy', 'pandas', 'pyarrow', 'zoneinfo'] if m in sys.modules))"
+    )
+    loaded_timezones, loaded_modules = _run_python(code).stdout.splitlines()
+    assert loaded_timezones == "[]"
+    assert loaded_modules == "[]"
+
+
+def _get_import_self_time() -> int:
+    """
+    returns the time (in microseconds) spent in the modules of chronomeleon themselves by "import chronomeleon"
+    """
+    # lines of -X importtime look like: "import time:  <self [us]> | <cumulative [us]> | <indentation><module>"
+    lines = _run_python("import chronomeleon", "-X", "importtime").stderr.splitlines()
+    return sum(
+        int(self_time.removeprefix("import time:"))
+        for self_time, _, module in (line.split("|") for line in lines if line.startswith("import time:"))
+        if module.strip().startswith("chronomeleon")
+    )
+
+
+def test_importing_chronomeleon_is_within_the_budget():
+    # the self time doesn't include pytz and the standard library; the best of 3 runs is robust against a busy machine
+    best_self_time = min(_get_import_self_time() for _ in range(3))
+    assert 0 < best_self_time < _IMPORT_TIME_BUDGET_MICROSECONDS
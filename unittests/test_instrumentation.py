@@ -0,0 +1,52 @@
+from datetime import date, datetime, timedelta
+
+import pytz
+
+from chronomeleon import ChronoAssumption, MappingConfig, adapt_to_target, instrumentation
+from chronomeleon.instrumentation import recording
+
+_berlin = pytz.timezone("Europe/Berlin")
+
+_gas_end_config = MappingConfig(
+    source=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(days=1), is_inclusive_end=True),
+    target=ChronoAssumption(resolution=timedelta(milliseconds=1), is_inclusive_end=True, is_gastag_aware=True),
+    is_end=True,
+    is_gas=True,
+)
+
+_start_config = MappingConfig(source=ChronoAssumption(implicit_timezone=_berlin), target=ChronoAssumption())
+
+
+def test_recording_counts_steps_and_branches():
+    with recording() as recorder:
+        adapt_to_target(date(2024, 1, 1), _gas_end_config)  # midnight -> Gastag start
+        adapt_to_target(datetime(2024, 10, 27, 2, 30), _start_config)  # ambiguous
+        adapt_to_target(datetime(2024, 3, 31, 2, 30), _start_config)  # non-existent
+    assert instrumentation.active_recorder is None
+    assert {step: statistics.calls for step, statistics in recorder.steps.items()} == {
+        instrumentation.VALIDATION: 3,
+        instrumentation.SOURCE_CONVERSION: 3,
+        instrumentation.TARGET_CONVERSION: 3,
+    }
+    assert all(statistics.seconds > 0 for statistics in recorder.steps.values())
+    assert recorder.branches == {
+        instrumentation.MIDNIGHT_TO_GASTAG_START: 1,
+        instrumentation.AMBIGUOUS_LOCAL_TIME: 1,
+        instrumentation.NON_EXISTENT_LOCAL_TIME: 1,
+    }
+    assert "validation: 3 calls" in recorder.report()
+
+
+def test_recording_does_not_change_the_result():
+    expected = adapt_to_target(date(2024, 1, 1), _gas_end_config)
+    with recording():
+        assert adapt_to_target(date(2024, 1, 1), _gas_end_config) == expected
+        assert _gas_end_config.compile()(date(2024, 1, 1)) == expected
+
+
+def test_nothing_is_recorded_outside_of_the_with_block():
+    with recording() as recorder:
+        pass
+    adapt_to_target(date(2024, 1, 1), _gas_end_config)
+    assert not recorder.steps
+    assert not recorder.branches
@@ -0,0 +1,114 @@
+import random
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+import pytz
+
+from chronomeleon import ChronoAssumption, ConversionError, RangeMappingConfig
+from chronomeleon.intervals import find_gaps, find_overlaps, get_coverage, merge_intervals, to_intervals
+
+_berlin = pytz.timezone("Europe/Berlin")
+
+_INCLUSIVE_DATES = ChronoAssumption(
+    implicit_timezone=_berlin, resolution=timedelta(days=1), is_inclusive_end=True, is_date_only=True
+)
+_EXCLUSIVE_UTC = ChronoAssumption(resolution=timedelta(microseconds=1), is_inclusive_end=False)
+_CONFIG = RangeMappingConfig(source=_INCLUSIVE_DATES, target=_EXCLUSIVE_UTC)
+_CANONICAL = RangeMappingConfig(source=_EXCLUSIVE_UTC, target=_EXCLUSIVE_UTC)
+
+
+def test_touching_inclusive_ranges_neither_overlap_nor_have_a_gap():
+    intervals = to_intervals(
+        ["malo2", "malo1", "malo1", "malo1"],
+        [date(2024, 1, 1), date(2024, 3, 1), date(2024, 1, 1), date(2024, 5, 1)],
+        [date(2024, 12, 31), date(2024, 3, 31), date(2024, 2, 29), date(2024, 5, 31)],
+        _CONFIG,
+    )
+    assert intervals.row_indices.tolist() == [2, 1, 3, 0]
+    assert len(find_overlaps(intervals)[0]) == 0
+    gaps = find_gaps(intervals)
+    assert gaps.keys.tolist() == ["malo1"]
+    assert gaps.row_indices.tolist() == [3]
+    _, gap_starts, gap_ends = gaps.to_target(RangeMappingConfig(source=_EXCLUSIVE_UTC, target=_INCLUSIVE_DATES))
+    assert (gap_starts[0], gap_ends[0]) == (np.datetime64("2024-04-01"), np.datetime64("2024-04-30"))
+    merged = merge_intervals(intervals)
+    assert merged.keys.tolist() == ["malo1", "malo1", "malo2"]
+    keys, durations = get_coverage(intervals)
+    assert keys.tolist() == ["malo1", "malo2"]
+    assert durations.tolist() == [timedelta(days=122) - timedelta(hours=1), timedelta(days=366)]  # DST in March
+
+
+def test_overlaps_report_both_rows():
+    intervals = to_intervals(
+        [1, 1, 1], [date(2024, 1, 1), date(2024, 1, 10), date(2024, 1, 5)], [date(2024, 1, 31)] * 3, _CONFIG
+    )
+    overlaps, earlier_rows = find_overlaps(intervals)
+    assert overlaps.row_indices.tolist() == [2, 1]
+    assert earlier_rows.tolist() == [0, 2]  # of the ranges which end last, the latest one
+    _, starts, ends = overlaps.to_target(_CONFIG)
+    assert starts.tolist() == [np.datetime64("2024-01-04T23:00:00"), np.datetime64("2024-01-09T23:00:00")]
+    assert (ends == np.datetime64("2024-01-31T23:00:00")).all()
+
+
+def _get_reference_overlaps(keys: list[int], starts: list[int], ends: list[int]) -> set[tuple[int, int]]:
+    return {
+        (i, j)
+        for i in range(len(keys))
+        for j in range(len(keys))
+        if i != j and keys[i] == keys[j] and starts[j] < ends[i] and starts[i] < ends[j]
+    }
+
+
+def _get_reference_coverage(keys: list[int], starts: list[int], ends: list[int]) -> dict[int, int]:
+    covered: dict[int, set[int]] = {}
+    for key, start, end in zip(keys, starts, ends):
+        covered.setdefault(key, set()).update(range(start, end))
+    return {key: len(points) for key, points in covered.items()}
+
+
+def _get_random_ranges(seed: int) -> tuple[list[int], list[int], list[int]]:
+    rng = random.Random(seed)
+    count = rng.randint(1, 60)
+    keys = [rng.randint(0, 4) for _ in range(count)]
+    starts = [rng.randint(0, 50) for _ in range(count)]
+    return keys, starts, [start + rng.randint(1, 15) for start in starts]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_find_overlaps_agrees_with_the_brute_force(seed: int):
+    keys, starts, ends = _get_random_ranges(seed)
+    overlaps, earlier_rows = find_overlaps(to_intervals(keys, np.array(starts), np.array(ends), _CANONICAL))
+    reference_overlaps = _get_reference_overlaps(keys, starts, ends)
+    rows_with_earlier_overlaps = {
+        max(pair, key=lambda row: (starts[row], ends[row], row)) for pair in reference_overlaps
+    }
+    assert set(overlaps.row_indices.tolist()) == rows_with_earlier_overlaps
+    for later_row, earlier_row in zip(overlaps.row_indices.tolist(), earlier_rows.tolist()):
+        assert (later_row, earlier_row) in reference_overlaps
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_coverage_merges_and_gaps_agree_with_the_brute_force(seed: int):
+    keys, starts, ends = _get_random_ranges(seed)
+    intervals = to_intervals(keys, np.array(starts), np.array(ends), _CANONICAL)
+    reference_coverage = _get_reference_coverage(keys, starts, ends)
+    coverage_keys, durations = get_coverage(intervals)
+    assert dict(zip(coverage_keys.tolist(), (durations // np.timedelta64(1, "us")).tolist())) == reference_coverage
+    merged = merge_intervals(intervals)
+    gaps = find_gaps(intervals)
+    assert len(gaps) == len(merged) - len(reference_coverage)
+    assert (merged.ends - merged.starts).sum() == sum(reference_coverage.values())
+    assert (gaps.starts == merged.ends[:-1][merged.keys[:-1] == merged.keys[1:]]).all()
+
+
+def test_empty_intervals():
+    intervals = to_intervals([], np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), _CANONICAL)
+    assert len(find_overlaps(intervals)[0]) == len(find_gaps(intervals)) == len(merge_intervals(intervals)) == 0
+    assert len(get_coverage(intervals)[1]) == 0
+
+
+def test_to_intervals_raises_on_empty_ranges():
+    with pytest.raises(ConversionError) as error_info:
+        to_intervals(["a", "a"], np.array([0, 5]), np.array([3, 5]), _CANONICAL)
+    assert error_info.value.row_index == 1
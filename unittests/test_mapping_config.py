@@ -1,6 +1,9 @@
+import json
 from datetime import timedelta
+from typing import Any
 
 import pytest
+import pytz
 
 from chronomeleon.models import ChronoAssumption, MappingConfig
 
@@ -37,3 +40,49 @@ from chronomeleon.models import ChronoAssumption, MappingConfig
 )
 def test_self_consistency(mapping_config: MappingConfig, is_self_consistent: bool):
     assert mapping_config.is_self_consistent() == is_self_consistent
+
+
+@pytest.mark.parametrize(
+    "mapping_config",
+    [
+        pytest.param(
+            MappingConfig(
+                source=ChronoAssumption(
+                    resolution=timedelta(days=1),
+                    implicit_timezone=pytz.timezone("Europe/Berlin"),
+                    is_inclusive_end=True,
+                    is_gastag_aware=True,
+                ),
+                target=ChronoAssumption(
+                    resolution=timedelta(milliseconds=1), is_inclusive_end=False, is_date_only=True
+                ),
+                is_end=True,
+                is_gas=True,
+            ),
+        ),
+        pytest.param(MappingConfig(source=ChronoAssumption(implicit_is_dst=None), target=ChronoAssumption())),
+        pytest.param(
+            MappingConfig(
+                source=ChronoAssumption(string_format="sap_dats"), target=ChronoAssumption(string_format="%d.%m.%Y")
+            )
+        ),
+    ],
+)
+def test_dict_roundtrip(mapping_config: MappingConfig):
+    as_dict = mapping_config.to_dict()
+    json.dumps(as_dict)  # is serializable
+    assert MappingConfig.from_dict(as_dict) == mapping_config
+
+
+@pytest.mark.parametrize(
+    "as_dict",
+    [
+        pytest.param({"source": {}, "target": {"foo": "bar"}}, id="unknown key"),
+        pytest.param({"source": {"implicit_timezone": "Mars/Olympus_Mons"}, "target": {}}, id="unknown timezone"),
+        pytest.param({"source": {"resolution": "1 day"}, "target": {}}, id="invalid resolution"),
+        pytest.param({"source": {}}, id="missing target"),
+    ],
+)
+def test_from_dict_raises_value_error(as_dict: dict[str, Any]):
+    with pytest.raises(ValueError):
+        MappingConfig.from_dict(as_dict)
@@ -0,0 +1,102 @@
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+import pytz
+
+from chronomeleon import ChronoAssumption, MappingConfig, adapt_to_target
+from chronomeleon.batch import adapt_mixed
+from chronomeleon.registry import ConfigRegistry
+
+_berlin = pytz.timezone("Europe/Berlin")
+
+_CONFIGS = {
+    "start": MappingConfig(
+        source=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(days=1)),
+        target=ChronoAssumption(resolution=timedelta(milliseconds=1)),
+    ),
+    "inclusive end": MappingConfig(
+        source=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(days=1), is_inclusive_end=True),
+        target=ChronoAssumption(resolution=timedelta(milliseconds=1), is_inclusive_end=True),
+        is_end=True,
+    ),
+    "gas end": MappingConfig(
+        source=ChronoAssumption(
+            implicit_timezone=_berlin, resolution=timedelta(days=1), is_inclusive_end=False, is_gastag_aware=False
+        ),
+        target=ChronoAssumption(
+            implicit_timezone=_berlin, resolution=timedelta(seconds=1), is_inclusive_end=False, is_gastag_aware=True
+        ),
+        is_end=True,
+        is_gas=True,
+    ),
+}
+
+_VALUES = [date(2024, 3, 29) + timedelta(days=offset) for offset in range(5)] + [
+    datetime(2024, 10, 27, 0, 0),
+    datetime(2024, 12, 31, 0, 0),
+]
+_KEYS = ["gas end", "start", "inclusive end", "start", "gas end", "inclusive end", "start"]
+
+
+def _get_expected(values: list[date], keys: list[str]) -> list[datetime]:
+    return [adapt_to_target(value, _CONFIGS[key]).replace(tzinfo=None) for value, key in zip(values, keys)]
+
+
+@pytest.mark.parametrize(
+    "configs",
+    [
+        pytest.param(_CONFIGS, id="dict"),
+        pytest.param(ConfigRegistry(_CONFIGS), id="registry"),
+    ],
+)
+def test_adapt_mixed_returns_the_same_as_adapt_to_target_per_row(configs):
+    result = adapt_mixed(_VALUES, _KEYS, configs)
+    assert result.tolist() == _get_expected(_VALUES, _KEYS)
+
+
+def test_adapt_mixed_with_arrays_keeps_the_original_order():
+    values = np.array([np.datetime64(value, "D") for value in _VALUES] * 3)
+    keys = np.array(_KEYS * 3)
+    result = adapt_mixed(values, keys, _CONFIGS)
+    assert result.tolist() == _get_expected(_VALUES * 3, _KEYS * 3)
+
+
+def test_adapt_mixed_with_integer_keys():
+    configs = dict(enumerate(_CONFIGS.values()))
+    result = adapt_mixed(_VALUES[:3], [2, 0, 1], configs)
+    assert result.tolist() == _get_expected(_VALUES[:3], ["gas end", "start", "inclusive end"])
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [
+        pytest.param([("gas", "end"), "start", None], id="tuple and None"),
+        pytest.param([1, "start", 2.5], id="mixed types"),
+        pytest.param(np.array([1, "start", 2.5], dtype=object), id="object array"),
+    ],
+)
+def test_adapt_mixed_with_keys_of_any_hashable_type(keys):
+    configs = dict(zip(keys, [_CONFIGS["gas end"], _CONFIGS["start"], _CONFIGS["inclusive end"]]))
+    result = adapt_mixed(_VALUES[:3] * 2, list(keys) * 2, configs)
+    assert result.tolist() == _get_expected(_VALUES[:3] * 2, ["gas end", "start", "inclusive end"] * 2)
+
+
+def test_adapt_mixed_groups_equal_keys_of_different_types_like_a_dict():
+    configs = {1: _CONFIGS["start"], "1": _CONFIGS["gas end"]}
+    result = adapt_mixed(_VALUES[:3], [1, "1", 1.0], configs)
+    assert result.tolist() == _get_expected(_VALUES[:3], ["start", "gas end", "start"])
+
+
+def test_adapt_mixed_with_empty_columns():
+    assert len(adapt_mixed([], [], _CONFIGS)) == 0
+
+
+def test_adapt_mixed_raises_on_unknown_keys():
+    with pytest.raises(KeyError):
+        adapt_mixed(_VALUES[:2], ["start", "unknown"], _CONFIGS)
+
+
+def test_adapt_mixed_raises_on_different_lengths():
+    with pytest.raises(ValueError):
+        adapt_mixed(_VALUES, _KEYS[:-1], _CONFIGS)
@@ -0,0 +1,64 @@
+import pickle
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Union
+
+import pytest
+import pytz
+
+from chronomeleon import ChronoAssumption, ConversionError, MappingConfig, adapt_to_target
+from chronomeleon.parallel import adapt_csv_in_parallel, adapt_in_parallel
+
+_berlin = pytz.timezone("Europe/Berlin")
+
+_CONFIG = MappingConfig(
+    source=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(days=1), is_inclusive_end=True),
+    target=ChronoAssumption(implicit_timezone=pytz.utc, resolution=timedelta(days=1), is_inclusive_end=False),
+    is_end=True,
+)
+
+_SOURCE_VALUES: list[Union[date, datetime]] = [date(2024, 1, 1) + timedelta(days=i) for i in range(500)]
+
+
+@pytest.mark.parametrize("workers, min_parallel_size", [(1, 0), (2, 1_000_000), (2, 0), (3, 0)])
+def test_adapt_in_parallel(workers: int, min_parallel_size: int):
+    result = adapt_in_parallel(
+        _SOURCE_VALUES, _CONFIG, workers=workers, chunk_size=37, min_parallel_size=min_parallel_size
+    )
+    assert result == [adapt_to_target(value, _CONFIG) for value in _SOURCE_VALUES]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_adapt_in_parallel_reports_the_row_index(workers: int):
+    source_values = list(_SOURCE_VALUES)
+    source_values[123] = "2024-01-01"  # type: ignore[call-overload]
+    with pytest.raises(ConversionError, match="row 123: source_value must be a date or datetime") as error_info:
+        adapt_in_parallel(source_values, _CONFIG, workers=workers, chunk_size=50, min_parallel_size=0)
+    assert error_info.value.row_index == 123
+
+
+def test_conversion_error_can_be_pickled():
+    error = pickle.loads(pickle.dumps(ConversionError(17, "foo")))
+    assert isinstance(error, ConversionError)
+    assert error.row_index == 17
+    assert str(error) == "row 17: foo"
+
+
+def test_adapt_in_parallel_rejects_invalid_workers():
+    with pytest.raises(ValueError, match="workers must be at least 1"):
+        adapt_in_parallel(_SOURCE_VALUES, _CONFIG, workers=0)
+
+
+def test_adapt_csv_in_parallel(tmp_path: Path):
+    input_path = tmp_path / "input.csv"
+    input_path.write_text(
+        "id,vertragsende\n" + "".join(f"{i},{value.isoformat()}\n" for i, value in enumerate(_SOURCE_VALUES)),
+        encoding="utf-8",
+    )
+    output_path = tmp_path / "output.csv"
+    statistics = adapt_csv_in_parallel(input_path, output_path, {"vertragsende": _CONFIG}, workers=2, chunk_size=64)
+    assert statistics.rows == len(_SOURCE_VALUES)
+    expected = "id,vertragsende\n" + "".join(
+        f"{i},{adapt_to_target(value, _CONFIG).isoformat()}\n" for i, value in enumerate(_SOURCE_VALUES)
+    )
+    assert output_path.read_text(encoding="utf-8").replace("\r\n", "\n") == expected
@@ -0,0 +1,108 @@
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+import pytz
+
+from chronomeleon import ChronoAssumption, RangeMappingConfig
+from chronomeleon.intervals import Intervals, to_intervals
+from chronomeleon.periods import Granularity, generate_periods, iter_periods
+
+_berlin = pytz.timezone("Europe/Berlin")
+
+_INCLUSIVE_DATES = RangeMappingConfig(
+    source=ChronoAssumption(
+        implicit_timezone=_berlin, resolution=timedelta(days=1), is_inclusive_end=True, is_date_only=True
+    ),
+    target=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(seconds=1), is_inclusive_end=False),
+)
+
+_DATETIMES = RangeMappingConfig(
+    source=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(seconds=1), is_inclusive_end=False),
+    target=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(seconds=1), is_inclusive_end=False),
+)
+
+
+@pytest.mark.parametrize(
+    "day, expected_count",
+    [
+        pytest.param(date(2024, 3, 31), 92, id="spring forward"),
+        pytest.param(date(2024, 6, 1), 96, id="summer"),
+        pytest.param(date(2024, 10, 27), 100, id="fall back"),
+    ],
+)
+def test_a_german_day_has_92_96_or_100_quarter_hours(day: date, expected_count: int):
+    intervals = to_intervals(["malo"], [day], [day], _INCLUSIVE_DATES)
+    periods = generate_periods(intervals, Granularity.QUARTER_HOUR)
+    assert len(periods) == expected_count
+    assert (periods.ends - periods.starts == 15 * 60 * 1_000_000).all()
+    _, starts, _ = periods.to_target(_INCLUSIVE_DATES)
+    assert starts[0] == np.datetime64(datetime.combine(day, datetime.min.time()))
+
+
+def test_days_and_gastage_in_the_semantics_of_the_target():
+    intervals = to_intervals(
+        ["a", "b"], [date(2024, 3, 30), date(2024, 1, 1)], [date(2024, 3, 31)] * 2, _INCLUSIVE_DATES
+    )
+    days = generate_periods(intervals, Granularity.DAY, _berlin)
+    assert len(days) == 2 + 91
+    assert days.keys.tolist()[:3] == ["a", "a", "b"]
+    _, starts, ends = days.to_target(_INCLUSIVE_DATES)
+    assert (starts[0], ends[0], starts[1], ends[1]) == tuple(
+        np.datetime64(value) for value in ["2024-03-30", "2024-03-31", "2024-03-31", "2024-04-01"]
+    )
+    assert (generate_periods(intervals, Granularity.DAY, ZoneInfo("Europe/Berlin")).starts == days.starts).all()
+    gastage = generate_periods(intervals, Granularity.GASTAG)
+    _, starts, ends = gastage.to_target(_INCLUSIVE_DATES)
+    # the range starts at midnight, so the first Gastag is clipped to 0:00 - 6:00
+    assert starts[:3].tolist() == [
+        datetime(2024, 3, 30, 0, 0),
+        datetime(2024, 3, 30, 6, 0),
+        datetime(2024, 3, 31, 6, 0),
+    ]
+    assert ends[2] == np.datetime64("2024-04-01T00:00")
+
+
+def test_ranges_are_clipped_to_their_bounds():
+    intervals = to_intervals([1], [datetime(2024, 1, 1, 10, 7)], [datetime(2024, 1, 1, 10, 50)], _DATETIMES)
+    periods = generate_periods(intervals, Granularity.QUARTER_HOUR)
+    _, starts, ends = periods.to_target(_DATETIMES)
+    assert starts.tolist() == [datetime(2024, 1, 1, 10, minute) for minute in (7, 15, 30, 45)]
+    assert ends.tolist() == [datetime(2024, 1, 1, 10, minute) for minute in (15, 30, 45, 50)]
+
+
+@pytest.mark.parametrize("granularity", list(Granularity))
+def test_empty_ranges_off_the_grid_have_no_periods(granularity: Granularity):
+    # to_intervals rejects empty ranges, but Intervals can be built directly
+    start = int(np.datetime64("2024-01-01T10:07", "us").astype(np.int64))
+    intervals = Intervals(
+        keys=np.array([1, 2]),
+        starts=np.array([start, start], dtype=np.int64),
+        ends=np.array([start, start + 60_000_000], dtype=np.int64),
+        row_indices=np.array([0, 1], dtype=np.intp),
+    )
+    periods = generate_periods(intervals, granularity)
+    assert periods.row_indices.tolist() == [1]
+    assert list(iter_periods(intervals, granularity, max_periods=1))[0].row_indices.tolist() == [1]
+
+
+@pytest.mark.parametrize("max_periods", [1, 100, 1_000_000])
+def test_iter_periods_yields_the_same_periods_in_chunks(max_periods: int):
+    intervals = to_intervals(
+        list(range(10)),
+        [date(2024, 3, 1) + timedelta(days=day) for day in range(10)],
+        [date(2024, 3, 31)] * 10,
+        _INCLUSIVE_DATES,
+    )
+    expected = generate_periods(intervals, Granularity.QUARTER_HOUR)
+    chunks = list(iter_periods(intervals, Granularity.QUARTER_HOUR, max_periods=max_periods))
+    assert len(chunks) == (10 if max_periods < 2000 else 1)
+    assert (np.concatenate([chunk.starts for chunk in chunks]) == expected.starts).all()
+    assert (np.concatenate([chunk.row_indices for chunk in chunks]) == expected.row_indices).all()
+
+
+def test_days_are_only_supported_within_the_gastag_table():
+    intervals = to_intervals([1], [date(1960, 1, 1)], [date(1960, 1, 1)], _INCLUSIVE_DATES)
+    with pytest.raises(ValueError):
+        generate_periods(intervals, Granularity.GASTAG)
@@ -0,0 +1,101 @@
+import pickle
+from datetime import date, datetime, timedelta
+from typing import Union
+
+import numpy as np
+import pytest
+import pytz
+
+from chronomeleon import (
+    ChronoAssumption,
+    ConversionError,
+    MappingConfig,
+    RangeMappingConfig,
+    adapt_range_to_target,
+    adapt_to_target,
+)
+from chronomeleon.batch import adapt_ranges
+
+_berlin = pytz.timezone("Europe/Berlin")
+
+_range_config = RangeMappingConfig(
+    source=ChronoAssumption(
+        implicit_timezone=_berlin, resolution=timedelta(days=1), is_inclusive_end=True, is_gastag_aware=False
+    ),
+    target=ChronoAssumption(resolution=timedelta(milliseconds=1), is_inclusive_end=True, is_gastag_aware=True),
+    is_gas=True,
+)
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        pytest.param(date(2024, 1, 1), date(2024, 12, 31), id="one year"),
+        pytest.param(date(2024, 3, 31), date(2024, 3, 31), id="a single day (DST transition)"),
+        pytest.param(datetime(2024, 10, 27, 0, 0), datetime(2024, 10, 27, 23, 59), id="naive datetimes"),
+    ],
+)
+def test_adapt_range_to_target_is_the_same_as_adapting_start_and_end(
+    start: Union[date, datetime], end: Union[date, datetime]
+):
+    start_config = MappingConfig(
+        source=_range_config.source, target=_range_config.target, is_end=False, is_gas=_range_config.is_gas
+    )
+    end_config = MappingConfig(
+        source=_range_config.source, target=_range_config.target, is_end=True, is_gas=_range_config.is_gas
+    )
+    expected = (adapt_to_target(start, start_config), adapt_to_target(end, end_config))
+    assert adapt_range_to_target(start, end, _range_config, validate_order=True) == expected
+    assert _range_config.compile()(start, end) == expected
+
+
+def test_adapt_range_to_target_validates_the_order():
+    # the inclusive end date 2023-12-31 is the exclusive end 2024-01-01, i.e. an empty range
+    with pytest.raises(ValueError, match="must be before the end"):
+        adapt_range_to_target(date(2024, 1, 1), date(2023, 12, 31), _range_config, validate_order=True)
+    adapt_range_to_target(date(2024, 1, 1), date(2023, 12, 31), _range_config)  # doesn't raise
+
+
+def test_range_config_requires_is_inclusive_end():
+    config = RangeMappingConfig(source=ChronoAssumption(implicit_timezone=_berlin), target=ChronoAssumption())
+    assert config.get_consistency_errors() == [
+        "if is_end is True, then is_inclusive_end must not be None in both source and target"
+    ]
+    with pytest.raises(ValueError, match="not self-consistent"):
+        adapt_range_to_target(date(2024, 1, 1), date(2024, 1, 2), config)
+
+
+def test_range_config_dict_round_trip():
+    assert RangeMappingConfig.from_dict(_range_config.to_dict()) == _range_config
+
+
+def test_start_and_end_configs_are_built_once():
+    start_config, end_config = _range_config.start_config, _range_config.end_config
+    assert _range_config.start_config is start_config and _range_config.end_config is end_config
+    assert _range_config.end_config == MappingConfig(
+        source=_range_config.source, target=_range_config.target, is_end=True, is_gas=True
+    )
+    hash(_range_config)
+    unpickled = pickle.loads(pickle.dumps(_range_config))
+    assert "_hash" not in unpickled.__dict__
+    assert unpickled == _range_config
+    assert hash(unpickled) == hash(_range_config)
+    assert unpickled.start_config == _range_config.start_config
+
+
+def test_adapt_ranges():
+    starts = np.arange(np.datetime64("2023-01-01"), np.datetime64("2025-01-01"), dtype="datetime64[D]")
+    ends = starts + 30
+    result_starts, result_ends = adapt_ranges(starts, ends, _range_config, validate_order=True)
+    for start, end, result_start, result_end in zip(starts, ends, result_starts, result_ends):
+        expected_start, expected_end = adapt_range_to_target(start.item(), end.item(), _range_config)
+        assert result_start.item() == expected_start.replace(tzinfo=None)
+        assert result_end.item() == expected_end.replace(tzinfo=None)
+
+
+def test_adapt_ranges_reports_the_first_invalid_range():
+    starts = [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3)]
+    ends = [date(2024, 1, 1), date(2024, 1, 1), date(2024, 1, 1)]
+    with pytest.raises(ConversionError, match="row 1: the start 2024-01-02") as error_info:
+        adapt_ranges(starts, ends, _range_config, validate_order=True)
+    assert error_info.value.row_index == 1
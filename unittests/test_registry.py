@@ -0,0 +1,120 @@
+import pickle
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+import pytz
+
+from chronomeleon import ChronoAssumption, MappingConfig, adapt_to_target
+from chronomeleon.registry import ConfigRegistry
+
+_REGISTRY_TOML = """
+[assumptions.sap]
+implicit_timezone = "Europe/Berlin"
+resolution = "P1D"
+is_inclusive_end = true
+
+[assumptions.bo4e]
+resolution = "PT0.001S"
+is_inclusive_end = false
+
+[configs.vertragsbeginn]
+source = "sap"
+target = "bo4e"
+is_end = false
+
+[configs.vertragsende]
+source = "sap"
+target = "bo4e"
+is_end = true
+
+[configs.lieferende]
+source = { implicit_timezone = "Europe/Berlin", resolution = "P1D", is_inclusive_end = true }
+target = { resolution = "PT0.001S", is_inclusive_end = false }
+is_end = true
+"""
+
+
+@pytest.fixture
+def registry(tmp_path: Path) -> ConfigRegistry:
+    config_path = tmp_path / "registry.toml"
+    config_path.write_text(_REGISTRY_TOML, encoding="utf-8")
+    return ConfigRegistry.load(config_path)
+
+
+def test_configs_and_plans_are_looked_up_by_name(registry: ConfigRegistry):
+    assert registry.names == ["vertragsbeginn", "vertragsende", "lieferende"]
+    assert "vertragsende" in registry and len(registry) == 3
+    config = registry.get_config("vertragsende")
+    assert config == MappingConfig(
+        source=ChronoAssumption(
+            implicit_timezone=pytz.timezone("Europe/Berlin"), resolution=timedelta(days=1), is_inclusive_end=True
+        ),
+        target=ChronoAssumption(resolution=timedelta(milliseconds=1), is_inclusive_end=False),
+        is_end=True,
+    )
+    expected = datetime(2024, 12, 31, 23, 0, tzinfo=pytz.utc)
+    assert registry.get_plan("vertragsende")(date(2024, 12, 31)) == expected
+    assert adapt_to_target(date(2024, 12, 31), config) == expected
+
+
+def test_equal_assumptions_configs_and_plans_are_interned(registry: ConfigRegistry):
+    assert registry.get_config("vertragsbeginn").source is registry.get_assumption("sap")
+    assert registry.get_config("vertragsbeginn").target is registry.get_config("vertragsende").target
+    # the inline definitions of "lieferende" are equal to those of "vertragsende"
+    assert registry.get_config("lieferende") is registry.get_config("vertragsende")
+    assert registry.get_plan("lieferende") is registry.get_plan("vertragsende")
+    assert registry.get_plan("vertragsende").config is registry.get_config("vertragsende")
+
+
+@pytest.mark.parametrize("file_name", ["registry.json", "registry.toml"])
+def test_the_registry_round_trips(registry: ConfigRegistry, tmp_path: Path, file_name: str):
+    registry.dump(tmp_path / file_name)
+    loaded = ConfigRegistry.load(tmp_path / file_name)
+    assert loaded.to_dict() == registry.to_dict()
+    assert ConfigRegistry.from_string(registry.to_string()).to_dict() == registry.to_dict()
+    assert registry.to_dict()["configs"]["vertragsende"]["source"] == "sap"  # references are kept
+    for name in registry.names:
+        assert loaded.get_config(name) == registry.get_config(name)
+
+
+def test_the_registry_can_be_pickled(registry: ConfigRegistry):
+    unpickled = pickle.loads(pickle.dumps(registry))
+    assert unpickled.get_plan("vertragsende")(date(2024, 12, 31)) == registry.get_plan("vertragsende")(
+        date(2024, 12, 31)
+    )
+
+
+def test_the_configs_are_validated_at_load_time():
+    with pytest.raises(ValueError, match="config 'vertragsende' is not self-consistent: if is_end is True"):
+        ConfigRegistry.from_dict({"configs": {"vertragsende": {"source": {}, "target": {}, "is_end": True}}})
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        pytest.param({"configs": {"x": {"source": "sap", "target": {}}}}, "unknown assumption 'sap'", id="reference"),
+        pytest.param({"configs": {}, "columns": {}}, "unknown keys for ConfigRegistry: columns", id="unknown key"),
+        pytest.param({"assumptions": {}}, "'configs'", id="no configs"),
+        pytest.param({"configs": {"x": "sap"}}, "config 'x' must be a table", id="config is no table"),
+    ],
+)
+def test_invalid_registries_raise_a_value_error(data: dict[str, object], message: str):
+    with pytest.raises(ValueError, match=message):
+        ConfigRegistry.from_dict(data)
+
+
+def test_unknown_names_raise_a_key_error(registry: ConfigRegistry):
+    with pytest.raises(KeyError, match="there is no config 'foo'"):
+        registry.get_plan("foo")
+    with pytest.raises(KeyError, match="there is no assumption 'foo'"):
+        registry.get_assumption("foo")
+
+
+def test_toml_cannot_represent_an_undecided_is_dst(tmp_path: Path):
+    registry = ConfigRegistry(
+        {"x": MappingConfig(source=ChronoAssumption(implicit_is_dst=None), target=ChronoAssumption())}
+    )
+    registry.dump(tmp_path / "registry.json")  # JSON has null
+    with pytest.raises(ValueError, match="cannot be represented in TOML"):
+        registry.dump(tmp_path / "registry.toml")
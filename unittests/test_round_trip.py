@@ -0,0 +1,176 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import Union
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+import pytz
+
+from chronomeleon import (
+    ChronoAssumption,
+    MappingConfig,
+    adapt_to_source,
+    adapt_to_target,
+    compile_inverse,
+    get_lossy_steps,
+)
+from chronomeleon.round_trip import check_round_trip
+
+_berlin = pytz.timezone("Europe/Berlin")
+
+_DAYS = [date(2024, 3, 29) + timedelta(days=offset) for offset in range(4)] + [
+    date(2024, 10, 25) + timedelta(days=offset) for offset in range(4)
+]
+
+_DATETIMES = [
+    datetime(2024, 3, 31, 1, 59, 59),
+    datetime(2024, 3, 31, 3, 0),
+    datetime(2024, 10, 27, 1, 30),
+    datetime(2024, 10, 27, 3, 0),
+    datetime(2024, 10, 27, 6, 0),
+    datetime(2024, 12, 31, 23, 59, 59, 999000),
+]
+
+_SAP_TO_UTC = MappingConfig(
+    source=ChronoAssumption(
+        implicit_timezone=_berlin, resolution=timedelta(days=1), is_inclusive_end=True, is_date_only=True
+    ),
+    target=ChronoAssumption(resolution=timedelta(milliseconds=1), is_inclusive_end=True),
+    is_end=True,
+)
+
+_BERLIN_TO_DATE_ONLY = MappingConfig(
+    source=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(seconds=1)),
+    target=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(days=1), is_date_only=True),
+)
+
+
+@pytest.mark.parametrize(
+    "config, source_values",
+    [
+        pytest.param(_SAP_TO_UTC, _DAYS, id="inclusive end dates (Berlin) to UTC"),
+        pytest.param(
+            MappingConfig(
+                source=_SAP_TO_UTC.source,
+                target=ChronoAssumption(
+                    implicit_timezone=ZoneInfo("Europe/Berlin"), resolution=timedelta(seconds=1), is_inclusive_end=False
+                ),
+                is_end=True,
+            ),
+            _DAYS,
+            id="inclusive end dates to exclusive end datetimes",
+        ),
+        pytest.param(
+            MappingConfig(
+                source=ChronoAssumption(
+                    implicit_timezone=_berlin,
+                    resolution=timedelta(days=1),
+                    is_inclusive_end=True,
+                    is_gastag_aware=False,
+                    is_date_only=True,
+                ),
+                target=ChronoAssumption(
+                    resolution=timedelta(milliseconds=1), is_inclusive_end=True, is_gastag_aware=True
+                ),
+                is_end=True,
+                is_gas=True,
+            ),
+            _DAYS,
+            id="Gastag",
+        ),
+        pytest.param(
+            MappingConfig(
+                source=ChronoAssumption(
+                    implicit_timezone=_berlin, resolution=timedelta(seconds=1), is_inclusive_end=True
+                ),
+                target=ChronoAssumption(
+                    implicit_timezone=timezone(timedelta(hours=-5)), resolution=timedelta(seconds=1)
+                ),
+                is_end=False,
+            ),
+            _DATETIMES,
+            id="datetimes to a fixed offset",
+        ),
+    ],
+)
+def test_adapt_to_source_inverts_adapt_to_target(config: MappingConfig, source_values: list[Union[date, datetime]]):
+    assert not get_lossy_steps(config) or config.is_gas
+    for source_value in source_values:
+        round_tripped_value = adapt_to_source(adapt_to_target(source_value, config), config)
+        if config.source.is_date_only:
+            assert round_tripped_value == datetime.combine(source_value, datetime.min.time())
+        else:
+            assert isinstance(source_value, datetime)
+            assert round_tripped_value.replace(tzinfo=None) == source_value
+            assert round_tripped_value == _berlin.localize(source_value)
+    report = check_round_trip(source_values, config)
+    assert report.count == 0
+
+
+def test_the_inverse_is_the_mirror_image():
+    inverse = _SAP_TO_UTC.inverse()
+    assert (inverse.source, inverse.target, inverse.is_end, inverse.is_gas) == (
+        _SAP_TO_UTC.target,
+        _SAP_TO_UTC.source,
+        _SAP_TO_UTC.is_end,
+        _SAP_TO_UTC.is_gas,
+    )
+    assert inverse.inverse() == _SAP_TO_UTC
+    assert compile_inverse(_SAP_TO_UTC).config == inverse
+    # mapping with the mirror image subtracts the day in UTC, which is off by one at the DST transition
+    target_value = adapt_to_target(date(2024, 3, 31), _SAP_TO_UTC)
+    assert adapt_to_target(target_value, inverse) == datetime(2024, 3, 30)
+    assert adapt_to_source(target_value, _SAP_TO_UTC) == datetime(2024, 3, 31)
+
+
+@pytest.mark.parametrize(
+    "config, expected",
+    [
+        pytest.param(_SAP_TO_UTC, [], id="lossless"),
+        pytest.param(_BERLIN_TO_DATE_ONLY, ["target: is_date_only truncates the time of day"], id="date-only"),
+        pytest.param(
+            _SAP_TO_UTC.inverse(),
+            [
+                "target: is_date_only truncates the time of day",
+                "target: the inclusive end of dates is ambiguous around DST transitions",
+            ],
+            id="inclusive end dates with DST",
+        ),
+        pytest.param(
+            MappingConfig(
+                source=ChronoAssumption(implicit_timezone=_berlin, is_date_only=True),
+                target=ChronoAssumption(is_date_only=True),
+            ),
+            ["target: is_date_only truncates to dates in another timezone than the source's"],
+            id="dates in another timezone",
+        ),
+    ],
+)
+def test_get_lossy_steps(config: MappingConfig, expected: list[str]):
+    assert get_lossy_steps(config) == expected
+
+
+@pytest.mark.parametrize(
+    "config, source_values",
+    [
+        pytest.param(_BERLIN_TO_DATE_ONLY, _DATETIMES + [datetime(2024, 3, 31, 2, 30)], id="date-only"),
+        pytest.param(_SAP_TO_UTC.inverse(), [adapt_to_target(day, _SAP_TO_UTC) for day in _DAYS], id="inverse"),
+    ],
+)
+def test_check_round_trip_reports_the_rows_which_do_not_survive(config: MappingConfig, source_values: list[datetime]):
+    report = check_round_trip(source_values, config)
+    expected_row_indices = []
+    for row_index, source_value in enumerate(source_values):
+        round_tripped_value = adapt_to_source(adapt_to_target(source_value, config), config)
+        if source_value.tzinfo is None:
+            if round_tripped_value.replace(tzinfo=None) != source_value:
+                expected_row_indices.append(row_index)
+        elif round_tripped_value != source_value:
+            expected_row_indices.append(row_index)
+    assert report.count > 0
+    assert report.row_indices.tolist() == expected_row_indices
+    assert report.lossy_steps == tuple(get_lossy_steps(config))
+    for row_index, round_tripped_value in zip(expected_row_indices, report.round_tripped_values):
+        source_value = source_values[row_index]
+        expected = adapt_to_source(adapt_to_target(source_value, config), config)
+        assert round_tripped_value == np.datetime64(expected.replace(tzinfo=None))
@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import pytest
+import pytz
+
+from chronomeleon import ChronoAssumption, MappingConfig
+from chronomeleon.batch import adapt_many
+from chronomeleon.shared_buffers import adapt_buffer, adapt_buffer_in_parallel, get_slices
+
+_berlin = pytz.timezone("Europe/Berlin")
+
+_CONFIG = MappingConfig(
+    source=ChronoAssumption(resolution=timedelta(milliseconds=1), is_inclusive_end=True),
+    target=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(days=1), is_inclusive_end=False),
+    is_end=True,
+)
+
+_UTC_VALUES = (
+    np.arange(np.datetime64("2024-01-01T00:00"), np.datetime64("2024-12-31T00:00"), np.timedelta64(7, "h"))
+    .astype("datetime64[us]")
+    .astype(np.int64)
+)
+_EXPECTED = adapt_many(_UTC_VALUES, _CONFIG).astype(np.int64)
+
+
+@pytest.fixture(name="shared_memory")
+def fixture_shared_memory() -> Iterator[SharedMemory]:
+    block = SharedMemory(create=True, size=_UTC_VALUES.nbytes)
+    try:
+        np.ndarray(_UTC_VALUES.shape, dtype=np.int64, buffer=block.buf)[:] = _UTC_VALUES
+        yield block
+    finally:
+        block.close()
+        block.unlink()
+
+
+def test_adapt_buffer_maps_disjoint_slices_of_arrays():
+    output_values = np.zeros_like(_UTC_VALUES)
+    for part in get_slices(len(_UTC_VALUES), 3):
+        adapt_buffer(_UTC_VALUES, output_values, _CONFIG, start=part.start, stop=part.stop)
+    assert (output_values == _EXPECTED).all()
+
+
+def test_adapt_buffer_maps_shared_memory_in_place(shared_memory: SharedMemory):
+    adapt_buffer(shared_memory, shared_memory, _CONFIG, start=10)
+    values = np.ndarray(_UTC_VALUES.shape, dtype=np.int64, buffer=shared_memory.buf)
+    assert (values[:10] == _UTC_VALUES[:10]).all()
+    assert (values[10:] == _EXPECTED[10:]).all()
+    del values  # otherwise, the block cannot be closed
+
+
+def test_adapt_buffer_maps_naive_values_in_files(tmp_path: Path):
+    input_path = tmp_path / "input.bin"
+    output_path = tmp_path / "output.bin"
+    naive_values = np.array([datetime(2024, 3, 31, 1, 30), datetime(2024, 10, 27, 6, 0)], dtype="datetime64[us]")
+    np.append(naive_values.astype(np.int64), np.iinfo(np.int64).min).tofile(input_path)
+    np.zeros(3, dtype=np.int64).tofile(output_path)
+    config = MappingConfig(
+        source=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(seconds=1)),
+        target=ChronoAssumption(resolution=timedelta(seconds=1)),
+    )
+    adapt_buffer(input_path, str(output_path), config, is_aware=False)
+    output_values = np.fromfile(output_path, dtype=np.int64)
+    assert (output_values[:2] == adapt_many(naive_values, config).astype(np.int64)).all()
+    assert output_values[2] == np.iinfo(np.int64).min  # NaT
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_adapt_buffer_in_parallel(workers: int, shared_memory: SharedMemory, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("chronomeleon.shared_buffers.DEFAULT_MIN_PARALLEL_SIZE", 0)
+    adapt_buffer_in_parallel(shared_memory, shared_memory, _CONFIG, workers=workers)
+    values = np.ndarray(_UTC_VALUES.shape, dtype=np.int64, buffer=shared_memory.buf)
+    assert (values == _EXPECTED).all()
+    del values
+
+
+@pytest.mark.parametrize(
+    "length, parts, expected",
+    [
+        pytest.param(10, 3, [slice(0, 3), slice(3, 6), slice(6, 10)], id="uneven"),
+        pytest.param(2, 4, [slice(0, 1), slice(1, 2)], id="more parts than values"),
+        pytest.param(0, 4, [slice(0, 0)], id="empty"),
+    ],
+)
+def test_get_slices(length: int, parts: int, expected: list[slice]):
+    assert get_slices(length, parts) == expected
+
+
+@pytest.mark.parametrize(
+    "output_buffer, start, stop",
+    [
+        pytest.param(np.zeros(10, dtype=np.int64), 0, None, id="output too short"),
+        pytest.param(np.zeros(len(_UTC_VALUES), dtype=np.int32), 0, None, id="wrong dtype"),
+        pytest.param(np.zeros(len(_UTC_VALUES), dtype=np.int64), 5, 4, id="start after stop"),
+    ],
+)
+def test_adapt_buffer_raises_on_invalid_buffers(output_buffer: np.ndarray, start: int, stop: int):
+    with pytest.raises(ValueError):
+        adapt_buffer(_UTC_VALUES, output_buffer, _CONFIG, start=start, stop=stop)
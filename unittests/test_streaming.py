@@ -0,0 +1,152 @@
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+import pytz
+
+from chronomeleon import ChronoAssumption, ConversionError, MappingConfig
+from chronomeleon.__main__ import main
+from chronomeleon.streaming import adapt_csv, adapt_file, adapt_parquet, load_column_configs
+
+_COLUMNS_TOML = """
+[columns.vertragsbeginn]
+source = { implicit_timezone = "Europe/Berlin" }
+target = { }
+
+[columns.vertragsende]
+is_end = true
+source = { implicit_timezone = "Europe/Berlin", resolution = "P1D", is_inclusive_end = true }
+target = { implicit_timezone = "Europe/Berlin", resolution = "P1D", is_inclusive_end = false, is_date_only = true }
+"""
+
+_INPUT_CSV = """id,vertragsbeginn,vertragsende
+1,2024-01-01,2024-06-30
+2,2024-07-01T00:00:00,
+3,2024-10-27,2024-12-31
+"""
+
+_EXPECTED_CSV = """id,vertragsbeginn,vertragsende
+1,2023-12-31T23:00:00+00:00,2024-07-01
+2,2024-06-30T22:00:00+00:00,
+3,2024-10-26T22:00:00+00:00,2025-01-01
+"""
+
+
+@pytest.fixture
+def column_configs(tmp_path: Path) -> dict[str, MappingConfig]:
+    config_path = tmp_path / "columns.toml"
+    config_path.write_text(_COLUMNS_TOML, encoding="utf-8")
+    return load_column_configs(config_path)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 100])
+def test_adapt_csv(tmp_path: Path, column_configs: dict[str, MappingConfig], chunk_size: int):
+    input_path = tmp_path / "input.csv"
+    input_path.write_text(_INPUT_CSV, encoding="utf-8")
+    output_path = tmp_path / "output.csv"
+    reported_rows: list[int] = []
+    statistics = adapt_csv(
+        input_path, output_path, column_configs, chunk_size=chunk_size, on_chunk=lambda s: reported_rows.append(s.rows)
+    )
+    assert output_path.read_text(encoding="utf-8").replace("\r\n", "\n") == _EXPECTED_CSV
+    assert statistics.rows == 3
+    assert reported_rows[-1] == 3
+    assert len(reported_rows) == (3 + chunk_size - 1) // chunk_size
+
+
+def test_adapt_csv_reports_the_row_of_invalid_values(tmp_path: Path, column_configs: dict[str, MappingConfig]):
+    input_path = tmp_path / "input.csv"
+    input_path.write_text("vertragsbeginn,vertragsende\n2024-01-01,2024-01-01\n2024-01-01,foo\n", encoding="utf-8")
+    with pytest.raises(ConversionError, match="row 1: column 'vertragsende'") as error_info:
+        adapt_csv(input_path, tmp_path / "output.csv", column_configs)
+    assert error_info.value.row_index == 1
+
+
+def test_adapt_parquet(tmp_path: Path, column_configs: dict[str, MappingConfig]):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    input_path = tmp_path / "input.parquet"
+    output_path = tmp_path / "output.parquet"
+    table = pa.table(
+        {
+            "id": [1, 2, 3],
+            "vertragsbeginn": pa.array(["2024-01-01", "2024-07-01", "2024-10-27"]).cast(pa.date32()),
+            "vertragsende": pa.array(["2024-06-30", None, "2024-12-31"]).cast(pa.date32()),
+        }
+    )
+    pq.write_table(table, input_path)
+    statistics = adapt_parquet(input_path, output_path, column_configs, chunk_size=2)
+    result = pq.read_table(output_path).to_pylist()
+    assert statistics.rows == 3
+    assert [r["id"] for r in result] == [1, 2, 3]
+    assert [r["vertragsbeginn"].isoformat() for r in result] == [
+        "2023-12-31T23:00:00",
+        "2024-06-30T22:00:00",
+        "2024-10-26T22:00:00",
+    ]
+    assert [r["vertragsende"] and r["vertragsende"].isoformat() for r in result] == ["2024-07-01", None, "2025-01-01"]
+
+
+def test_adapt_parquet_writes_the_schema_of_empty_files(tmp_path: Path, column_configs: dict[str, MappingConfig]):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    input_path = tmp_path / "input.parquet"
+    output_path = tmp_path / "output.parquet"
+    schema = pa.schema([("id", pa.int64()), ("vertragsbeginn", pa.date32()), ("vertragsende", pa.date32())])
+    pq.write_table(schema.empty_table(), input_path)
+    statistics = adapt_parquet(input_path, output_path, column_configs)
+    result = pq.read_table(output_path)
+    assert statistics.rows == 0
+    assert result.num_rows == 0
+    assert result.schema.names == ["id", "vertragsbeginn", "vertragsende"]
+    assert result.schema.field("vertragsbeginn").type == pa.timestamp("us")
+
+
+def test_adapt_parquet_keeps_the_nanoseconds(tmp_path: Path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    input_path = tmp_path / "input.parquet"
+    output_path = tmp_path / "output.parquet"
+    nanoseconds = [1_704_067_200_000_000_001, None]  # 2024-01-01T00:00:00.000000001Z
+    pq.write_table(pa.table({"ts": pa.array(nanoseconds, type=pa.timestamp("ns", tz="UTC"))}), input_path)
+    config = MappingConfig(
+        source=ChronoAssumption(resolution=timedelta(microseconds=1)),
+        target=ChronoAssumption(implicit_timezone=pytz.timezone("Europe/Berlin"), resolution=timedelta(microseconds=1)),
+    )
+    adapt_parquet(input_path, output_path, {"ts": config})
+    result = pq.read_table(output_path).column("ts")
+    assert result.type == pa.timestamp("ns")
+    assert result.cast(pa.int64()).to_pylist() == [1_704_070_800_000_000_001, None]  # 01:00 wall clock in Berlin
+
+
+@pytest.mark.parametrize("file_name", ["output.csv", "output.parquet"])
+def test_adapt_file_rejects_chunk_sizes_below_1(
+    tmp_path: Path, column_configs: dict[str, MappingConfig], file_name: str
+):
+    input_path = tmp_path / file_name.replace("output", "input")
+    input_path.write_text(_INPUT_CSV, encoding="utf-8")  # not read at all
+    with pytest.raises(ValueError, match="chunk_size"):
+        adapt_file(input_path, tmp_path / file_name, column_configs, chunk_size=0)
+    assert not (tmp_path / file_name).exists()
+
+
+def test_command_line_interface_rejects_chunk_sizes_below_1(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    config_path = tmp_path / "columns.toml"
+    config_path.write_text(_COLUMNS_TOML, encoding="utf-8")
+    input_path = tmp_path / "input.csv"
+    input_path.write_text(_INPUT_CSV, encoding="utf-8")
+    exit_code = main([str(input_path), str(tmp_path / "output.csv"), "--config", str(config_path), "--chunk-size", "0"])
+    assert exit_code == 1
+    assert "chunk_size must be at least 1" in capsys.readouterr().err
+
+
+def test_command_line_interface(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    config_path = tmp_path / "columns.toml"
+    config_path.write_text(_COLUMNS_TOML, encoding="utf-8")
+    input_path = tmp_path / "input.csv"
+    input_path.write_text(_INPUT_CSV, encoding="utf-8")
+    output_path = tmp_path / "output.csv"
+    exit_code = main([str(input_path), str(output_path), "--config", str(config_path), "--chunk-size", "2"])
+    assert exit_code == 0
+    assert output_path.read_text(encoding="utf-8").replace("\r\n", "\n") == _EXPECTED_CSV
+    assert "3 rows" in capsys.readouterr().err
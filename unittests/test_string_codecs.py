@@ -0,0 +1,161 @@
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+import pytest
+import pytz
+
+from chronomeleon import ChronoAssumption, MappingConfig, adapt_to_target
+from chronomeleon.errors import ConversionError
+from chronomeleon.string_codecs import adapt_strings
+
+_berlin = pytz.timezone("Europe/Berlin")
+
+_DATS_TO_ISO = MappingConfig(
+    source=ChronoAssumption(
+        implicit_timezone=_berlin,
+        resolution=timedelta(days=1),
+        is_inclusive_end=True,
+        is_date_only=True,
+        string_format="sap_dats",
+    ),
+    target=ChronoAssumption(resolution=timedelta(milliseconds=1), is_inclusive_end=True),
+    is_end=True,
+)
+
+
+@pytest.mark.parametrize(
+    "source_values, string_format, parsed_values",
+    [
+        pytest.param(
+            ["20211231", "20240229"], "sap_dats", [date(2021, 12, 31), date(2024, 2, 29)], id="SAP DATS (in bulk)"
+        ),
+        pytest.param(["20211231", "2024229"], "sap_dats", None, id="SAP DATS (one by one)"),
+        pytest.param(
+            ["20211231120000", "20240229235959"],
+            "sap_dats_tims",
+            [datetime(2021, 12, 31, 12), datetime(2024, 2, 29, 23, 59, 59)],
+            id="SAP DATS/TIMS",
+        ),
+        pytest.param(["2021-12-31", "2024-02-29"], "iso", [date(2021, 12, 31), date(2024, 2, 29)], id="ISO dates"),
+        pytest.param(
+            ["2021-12-31T12:00:00", "2024-10-27T02:30:00.5"],
+            "iso",
+            [datetime(2021, 12, 31, 12), datetime(2024, 10, 27, 2, 30, 0, 500_000)],
+            id="ISO datetimes (in bulk)",
+        ),
+        pytest.param(
+            ["2021-12-31T12:00:00+00:00", "2024-02-29"],
+            "iso",
+            [datetime(2021, 12, 31, 12, tzinfo=pytz.utc), date(2024, 2, 29)],
+            id="ISO with UTC offset and mixed (one by one)",
+        ),
+        pytest.param(["31.12.2021"], "%d.%m.%Y", [datetime(2021, 12, 31)], id="strptime pattern"),
+    ],
+)
+def test_adapt_strings_returns_the_same_as_adapt_to_target(
+    source_values: list[Optional[str]], string_format: str, parsed_values: Optional[list[date]]
+):
+    config = MappingConfig(
+        source=ChronoAssumption(
+            implicit_timezone=_berlin,
+            resolution=timedelta(days=1),
+            is_inclusive_end=False,
+            string_format=string_format,
+        ),
+        target=ChronoAssumption(resolution=timedelta(milliseconds=1), is_inclusive_end=True),
+        is_end=True,
+    )
+    if parsed_values is None:
+        with pytest.raises(ConversionError) as error_info:
+            adapt_strings(source_values, config)
+        assert error_info.value.row_index == 1
+        return
+    result = adapt_strings(source_values, config)
+    assert result == [adapt_to_target(parsed_value, config).isoformat() for parsed_value in parsed_values]
+
+
+@pytest.mark.parametrize(
+    "target_format, expected",
+    [
+        pytest.param(None, ["2022-01-01", None, "0001-01-01", "9999-12-31"], id="ISO"),
+        pytest.param("sap_dats", ["20220101", None, "00000000", "99991231"], id="SAP DATS"),
+        pytest.param("%d.%m.%Y", ["01.01.2022", None, "01.01.0001", "31.12.9999"], id="strptime pattern"),
+    ],
+)
+@pytest.mark.parametrize(
+    "source_values",
+    [
+        pytest.param(["20211231", "", "00000000", "99991231"], id="SAP DATS"),
+        pytest.param(["2021-12-31", None, "0000-00-00", "9999-12-31"], id="ISO"),
+        pytest.param(["2021-12-31", "", "0001-01-01", "9999-12-31"], id="ISO (in bulk)"),
+    ],
+)
+def test_adapt_strings_passes_sentinels_and_missing_values_through(
+    source_values: list[Optional[str]], target_format: Optional[str], expected: list[Optional[str]]
+):
+    source_format = "iso" if "-" in source_values[0] else "sap_dats"  # type: ignore[operator]
+    config = MappingConfig(
+        source=ChronoAssumption(
+            implicit_timezone=_berlin,
+            resolution=timedelta(days=1),
+            is_inclusive_end=True,
+            is_date_only=True,
+            string_format=source_format,
+        ),
+        target=ChronoAssumption(
+            implicit_timezone=_berlin,
+            resolution=timedelta(days=1),
+            is_inclusive_end=False,
+            is_date_only=True,
+            string_format=target_format,
+        ),
+        is_end=True,
+    )
+    assert adapt_strings(source_values, config) == expected
+
+
+def test_adapt_strings_formats_sap_dats_tims():
+    config = MappingConfig(
+        source=_DATS_TO_ISO.source,
+        target=ChronoAssumption(is_inclusive_end=False, string_format="sap_dats_tims"),
+        is_end=True,
+    )
+    assert adapt_strings(["20211231", "99991231"], config) == ["20211231230000", "99991231235959"]
+    assert adapt_strings(["00000000"], config) == ["00000000000000"]  # only sentinels
+
+
+def test_adapt_strings_raises_on_invalid_strings():
+    with pytest.raises(ConversionError) as error_info:
+        adapt_strings(["20211231", "20211232"], _DATS_TO_ISO)
+    assert error_info.value.row_index == 1
+
+
+@pytest.mark.parametrize("invalid_string", ["   ", "--", " 0000000", "+0000000", "00000000 "])
+def test_adapt_strings_raises_on_strings_which_only_resemble_zeros(invalid_string: str):
+    with pytest.raises(ConversionError) as error_info:
+        adapt_strings(["20211231", invalid_string], _DATS_TO_ISO)
+    assert error_info.value.row_index == 1
+
+
+@pytest.mark.parametrize("invalid_string", ["today", "now", "NaT"])
+def test_adapt_strings_raises_on_words_which_numpy_would_parse(invalid_string: str):
+    config = MappingConfig(source=ChronoAssumption(), target=ChronoAssumption())
+    for strings in (["2024-01-01", invalid_string], ["2024-01-01", invalid_string, None]):  # in bulk and one by one
+        with pytest.raises(ConversionError) as error_info:
+            adapt_strings(strings, config)
+        assert error_info.value.row_index == 1
+
+
+def test_adapt_strings_raises_on_zero_dates_with_times():
+    config = MappingConfig(
+        source=ChronoAssumption(string_format="sap_dats_tims"), target=ChronoAssumption(string_format="sap_dats_tims")
+    )
+    for strings in (["20211231000000", "00000000123456"], ["20211231000000", "00000000123456", None]):
+        with pytest.raises(ConversionError) as error_info:
+            adapt_strings(strings, config)
+        assert error_info.value.row_index == 1
+    assert adapt_strings(["00000000000000", None], config) == ["00000000000000", None]
+
+
+def test_string_format_survives_the_dict_round_trip():
+    assert MappingConfig.from_dict(_DATS_TO_ISO.to_dict()) == _DATS_TO_ISO
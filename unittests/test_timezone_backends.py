@@ -0,0 +1,115 @@
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Optional, Union
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+import pytz
+
+from chronomeleon import ChronoAssumption, MappingConfig, adapt_to_target
+from chronomeleon.batch import adapt_many
+from chronomeleon.mapping import _localize_with_fixed_offset, _to_fixed_offset_timezone
+
+
+def _get_config(implicit_timezone: tzinfo, is_dst: Optional[bool] = False) -> MappingConfig:
+    return MappingConfig(
+        source=ChronoAssumption(
+            implicit_timezone=implicit_timezone,
+            implicit_is_dst=is_dst,
+            resolution=timedelta(days=1),
+            is_inclusive_end=True,
+        ),
+        target=ChronoAssumption(
+            implicit_timezone=implicit_timezone, resolution=timedelta(milliseconds=1), is_inclusive_end=True
+        ),
+        is_end=True,
+    )
+
+
+@pytest.mark.parametrize("zone", ["Europe/Berlin", "Europe/London", "America/New_York", "Australia/Lord_Howe"])
+@pytest.mark.parametrize("is_dst", [False, True])
+@pytest.mark.parametrize(
+    "source_value",
+    [
+        pytest.param(date(2024, 3, 30), id="date"),
+        pytest.param(datetime(2024, 3, 31, 1, 30), id="before/in the gap"),
+        pytest.param(datetime(2024, 10, 26, 1, 30), id="ambiguous (Europe)"),
+        pytest.param(datetime(2024, 11, 2, 0, 30), id="ambiguous (America)"),
+        pytest.param(datetime(2024, 4, 6, 1, 45), id="ambiguous (Lord Howe)"),
+        pytest.param(datetime(1990, 7, 1, 12, 0), id="summer"),
+    ],
+)
+def test_zoneinfo_gives_the_same_results_as_pytz(zone: str, is_dst: bool, source_value: Union[date, datetime]):
+    pytz_result = adapt_to_target(source_value, _get_config(pytz.timezone(zone), is_dst))
+    zoneinfo_result = adapt_to_target(source_value, _get_config(ZoneInfo(zone), is_dst))
+    # aware datetimes in a fold don't compare equal to other zones (PEP 495), so we compare the details
+    assert zoneinfo_result.astimezone(timezone.utc) == pytz_result.astimezone(timezone.utc)
+    assert zoneinfo_result.replace(tzinfo=None) == pytz_result.replace(tzinfo=None)
+    assert zoneinfo_result.utcoffset() == pytz_result.utcoffset()
+    assert zoneinfo_result.fold == zoneinfo_result.astimezone(timezone.utc).astimezone(ZoneInfo(zone)).fold
+
+
+def test_zoneinfo_rejects_ambiguous_values_like_pytz():
+    with pytest.raises(ValueError, match="is ambiguous in Europe/Berlin"):
+        # the inclusive end is shifted by 1 day to 2024-10-27 02:30
+        adapt_to_target(datetime(2024, 10, 26, 2, 30), _get_config(ZoneInfo("Europe/Berlin"), is_dst=None))
+
+
+@pytest.mark.parametrize(
+    "fixed_offset, pytz_timezone",
+    [
+        pytest.param(timezone.utc, pytz.utc, id="UTC"),
+        pytest.param(timezone(timedelta(hours=1)), pytz.timezone("Etc/GMT-1"), id="UTC+1"),
+        pytest.param(timezone(timedelta(hours=-5)), pytz.timezone("Etc/GMT+5"), id="UTC-5"),
+    ],
+)
+def test_fixed_offsets(fixed_offset: timezone, pytz_timezone: tzinfo):
+    config = _get_config(fixed_offset)
+    plan = config.compile()
+    assert plan.source_steps[0].func is _localize_with_fixed_offset  # type: ignore[attr-defined]
+    assert plan.target_steps[-1].func is _to_fixed_offset_timezone  # type: ignore[attr-defined]
+    source_value = datetime(2024, 10, 27, 2, 30)
+    result = adapt_to_target(source_value, config)
+    assert result == adapt_to_target(source_value, _get_config(pytz_timezone))
+    assert result.tzinfo is fixed_offset
+
+
+def test_adapt_many_with_zoneinfo():
+    source_values = np.arange(
+        np.datetime64("2024-03-30T00:00"), np.datetime64("2024-04-01T00:00"), np.timedelta64(15, "m")
+    )
+    config = _get_config(ZoneInfo("Europe/Berlin"))
+    expected = [adapt_to_target(value.item(), config).replace(tzinfo=None) for value in source_values]
+    assert adapt_many(source_values, config).tolist() == expected
+
+
+@pytest.mark.parametrize(
+    "implicit_timezone, expected",
+    [
+        pytest.param(pytz.timezone("Europe/Berlin"), "Europe/Berlin", id="pytz"),
+        pytest.param(ZoneInfo("Europe/Berlin"), "zoneinfo:Europe/Berlin", id="zoneinfo"),
+        pytest.param(timezone(timedelta(hours=-3, minutes=-30)), "fixed:-03:30", id="fixed offset"),
+    ],
+)
+def test_timezone_serialization(implicit_timezone: tzinfo, expected: str):
+    assumption = ChronoAssumption(implicit_timezone=implicit_timezone)
+    assert assumption.to_dict() == {"implicit_timezone": expected}
+    assert ChronoAssumption.from_dict(assumption.to_dict()) == assumption
+
+
+def test_implicit_timezone_must_be_a_tzinfo():
+    assumption = ChronoAssumption(implicit_timezone="Europe/Berlin")  # type: ignore[arg-type]
+    assert assumption.get_consistency_errors() == ["implicit_timezone must be a timezone (tzinfo) object but is str"]
+
+
+@pytest.mark.parametrize("fold", [0, 1])
+def test_inclusive_end_keeps_the_fold_of_aware_values(fold: int):
+    config = MappingConfig(
+        source=ChronoAssumption(resolution=timedelta(seconds=1), is_inclusive_end=True),
+        target=ChronoAssumption(resolution=timedelta(seconds=1), is_inclusive_end=False),
+        is_end=True,
+    )
+    source_value = datetime(2024, 10, 27, 2, 30, fold=fold, tzinfo=ZoneInfo("Europe/Berlin"))
+    expected = source_value.astimezone(timezone.utc) + timedelta(seconds=1)
+    assert adapt_to_target(source_value, config) == expected
+    assert adapt_many([source_value], config)[0].item() == expected.replace(tzinfo=None)
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+import numpy as np
+import pytest
+import pytz
+
+from chronomeleon import ChronoAssumption, MappingConfig, adapt_to_target
+from chronomeleon.batch import adapt_many
+from chronomeleon.transition_index import from_microseconds, get_transition_index, to_microseconds
+
+_berlin = pytz.timezone("Europe/Berlin")
+
+
+@pytest.mark.parametrize(
+    "local_value, is_dst, expected_utc",
+    [
+        pytest.param(datetime(2023, 7, 1, 12, 0), False, datetime(2023, 7, 1, 10, 0), id="summer"),
+        pytest.param(datetime(2023, 12, 1, 12, 0), None, datetime(2023, 12, 1, 11, 0), id="winter"),
+        pytest.param(datetime(2023, 10, 29, 2, 30), False, datetime(2023, 10, 29, 1, 30), id="ambiguous as CET"),
+        pytest.param(datetime(2023, 10, 29, 2, 30), True, datetime(2023, 10, 29, 0, 30), id="ambiguous as CEST"),
+        pytest.param(datetime(2023, 3, 26, 2, 30), False, datetime(2023, 3, 26, 1, 30), id="non-existent as CET"),
+        pytest.param(datetime(2023, 3, 26, 2, 30), True, datetime(2023, 3, 26, 0, 30), id="non-existent as CEST"),
+    ],
+)
+def test_local_to_utc_behaves_like_pytz(local_value: datetime, is_dst: Optional[bool], expected_utc: datetime):
+    index = get_transition_index(_berlin)
+    actual = from_microseconds(index.local_to_utc(to_microseconds(local_value), is_dst))
+    assert actual == expected_utc
+    if is_dst is not None:
+        assert actual == _berlin.localize(local_value, is_dst=is_dst).astimezone(pytz.utc).replace(tzinfo=None)
+
+
+@pytest.mark.parametrize(
+    "local_value",
+    [
+        pytest.param(datetime(2023, 10, 29, 2, 30), id="ambiguous"),
+        pytest.param(datetime(2023, 3, 26, 2, 30), id="non-existent"),
+    ],
+)
+def test_strict_localization_raises_value_error(local_value: datetime):
+    config = MappingConfig(
+        source=ChronoAssumption(implicit_timezone=_berlin, implicit_is_dst=None),
+        target=ChronoAssumption(),
+    )
+    with pytest.raises(ValueError):
+        adapt_to_target(local_value, config)
+    with pytest.raises(ValueError):
+        adapt_many(np.array([local_value], dtype="datetime64[us]"), config)
+
+
+def test_utc_to_local_uses_the_pytz_tzinfo():
+    utc_value = datetime(2023, 10, 29, 0, 30)
+    actual = get_transition_index(_berlin).to_aware_datetime(to_microseconds(utc_value))
+    expected = pytz.utc.localize(utc_value).astimezone(_berlin)
+    assert actual == expected
+    assert actual.tzinfo is expected.tzinfo
+
+
+def test_dst_interpretation_is_configurable_for_columns():
+    source_values = [datetime(2023, 10, 29, 2, 30) + timedelta(minutes=i) for i in range(-90, 90)]
+    config = MappingConfig(
+        source=ChronoAssumption(implicit_timezone=_berlin, implicit_is_dst=True),
+        target=ChronoAssumption(),
+    )
+    expected = np.array(
+        [adapt_to_target(v, config).replace(tzinfo=None) for v in source_values], dtype="datetime64[us]"
+    )
+    np.testing.assert_array_equal(adapt_many(source_values, config), expected)
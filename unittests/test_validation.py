@@ -0,0 +1,113 @@
+from datetime import date, datetime, timedelta
+from typing import Any, Optional, Union
+
+import numpy as np
+import pytest
+import pytz
+
+from chronomeleon import ChronoAssumption, MappingConfig, adapt_to_target
+from chronomeleon.batch import adapt_many
+from chronomeleon.errors import ErrorKind
+from chronomeleon.validation import validate_many
+
+_berlin = pytz.timezone("Europe/Berlin")
+
+_strict_config = MappingConfig(
+    source=ChronoAssumption(implicit_timezone=_berlin, implicit_is_dst=None, resolution=timedelta(seconds=1)),
+    target=ChronoAssumption(resolution=timedelta(seconds=1)),
+)
+_end_config = MappingConfig(
+    source=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(days=1), is_inclusive_end=True),
+    target=ChronoAssumption(implicit_timezone=_berlin, resolution=timedelta(seconds=1), is_inclusive_end=True),
+    is_end=True,
+)
+_without_timezone_config = MappingConfig(
+    source=ChronoAssumption(resolution=timedelta(seconds=1)), target=ChronoAssumption(resolution=timedelta(seconds=1))
+)
+
+_SOURCE_VALUES: list[Any] = [
+    date(2024, 1, 1),
+    None,
+    "2024-01-01",
+    datetime(2024, 10, 27, 2, 30),  # ambiguous in Berlin
+    datetime(2024, 3, 31, 2, 30),  # non-existent in Berlin
+    date(9999, 12, 31),
+    datetime(2024, 5, 1, 12, 0, tzinfo=pytz.utc),
+    datetime(2024, 5, 1, 12, 0),
+    datetime(1, 1, 1),
+]
+
+
+def _adapt_or_none(source_value: Union[date, datetime], config: MappingConfig) -> Optional[np.datetime64]:
+    try:
+        result = adapt_to_target(source_value, config)
+    except (ValueError, OverflowError):
+        return None
+    return np.datetime64(result.replace(tzinfo=None), "us")
+
+
+@pytest.mark.parametrize(
+    "config, expected_errors",
+    [
+        pytest.param(
+            _strict_config,
+            {
+                ErrorKind.MISSING: [1],
+                ErrorKind.INVALID_TYPE: [2],
+                ErrorKind.AMBIGUOUS: [3],
+                ErrorKind.NON_EXISTENT: [4],
+                ErrorKind.OUT_OF_RANGE: [8],
+            },
+            id="implicit_is_dst=None",
+        ),
+        pytest.param(
+            _end_config,
+            {
+                ErrorKind.MISSING: [1],
+                ErrorKind.INVALID_TYPE: [2],
+                ErrorKind.OUT_OF_RANGE: [5],  # the day after 9999-12-31
+            },
+            id="inclusive end",
+        ),
+        pytest.param(
+            _without_timezone_config,
+            {
+                ErrorKind.MISSING: [1],
+                ErrorKind.INVALID_TYPE: [2],
+                ErrorKind.NAIVE_WITHOUT_TIMEZONE: [0, 3, 4, 5, 7, 8],
+            },
+            id="no implicit timezone",
+        ),
+    ],
+)
+def test_validate_many_reports_what_adapt_to_target_raises_on(
+    config: MappingConfig, expected_errors: dict[ErrorKind, list[int]]
+):
+    report = validate_many(_SOURCE_VALUES, config, max_samples=1)
+    assert {kind: summary.row_indices.tolist() for kind, summary in report.errors.items()} == expected_errors
+    assert report.error_count == sum(len(row_indices) for row_indices in expected_errors.values())
+    for row_index, source_value in enumerate(_SOURCE_VALUES):
+        expected = _adapt_or_none(source_value, config)
+        assert report.is_valid[row_index] == (expected is not None)
+        if expected is None:
+            assert np.isnat(report.values[row_index])
+        else:
+            assert report.values[row_index] == expected
+    assert report.errors[ErrorKind.INVALID_TYPE].samples == ((2, "'2024-01-01'"),)
+    assert "cannot be mapped" in report.summary()
+
+
+def test_validate_many_reports_not_a_time_in_arrays_as_missing():
+    source_values = np.array(["2024-01-01T00:00", "NaT", "2024-10-27T02:30"], dtype="datetime64[us]")
+    report = validate_many(source_values, _strict_config)
+    assert report.errors[ErrorKind.MISSING].row_indices.tolist() == [1]
+    assert report.errors[ErrorKind.AMBIGUOUS].samples == ((2, "2024-10-27T02:30:00.000000"),)
+    assert report.values[0] == adapt_many(source_values[:1], _strict_config)[0]
+
+
+def test_validate_many_without_errors_returns_the_same_as_adapt_many():
+    source_values = np.array(["2024-01-01", "2024-03-31", "2024-10-27"], dtype="datetime64[D]")
+    report = validate_many(source_values, _end_config)
+    assert not report.errors
+    assert report.is_valid.all()
+    assert (report.values == adapt_many(source_values, _end_config)).all()